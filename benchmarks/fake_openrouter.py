@@ -0,0 +1,145 @@
+# Локальная замена OpenRouter для бенчмарков: /api/v1/chat/completions со стримингом SSE,
+# настраиваемой задержкой до ответа, скоростью выдачи токенов и долей отказов.
+# Запуск отдельно: python benchmarks/fake_openrouter.py --port 8765 --latency 0.2 --token-rate 50
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+SAMPLE_ANSWER = (
+    "Процессоры **AMD Ryzen 7 7800X3D** используют 3D V-Cache объёмом 96 МБ.\n\n"
+    "| Модель | Ядра | L3 |\n|---|---|---|\n| 7800X3D | 8 | 96 МБ |\n| 7950X3D | 16 | 128 МБ |\n\n"
+    "```python\nprint(\"Radeon\")\n```\n\n"
+    "- Поддержка DDR5 и PCIe 5.0\n- Сокет AM5\n\n"
+    "Подробнее на [сайте AMD](https://www.amd.com)."
+)
+
+class FakeOpenRouterConfig:
+    def __init__(self, latency=0.05, token_rate=200.0, tokens=None, failure_rate=0.0, failure_status=503, seed=7805):
+        self.latency = latency
+        self.token_rate = token_rate
+        # Без явного числа токенов отдаётся весь SAMPLE_ANSWER по словам
+        self.tokens = tokens
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.failures = 0
+
+    def should_fail(self):
+        with self.lock:
+            self.requests += 1
+            failed = self.random.random() < self.failure_rate
+            self.failures += failed
+            return failed
+
+    def answer_tokens(self, question):
+        words = f"Ответ на «{question[:60]}». {SAMPLE_ANSWER}".split(" ")
+        if self.tokens:
+            words = (words * (self.tokens // len(words) + 1))[:self.tokens]
+        return [word + " " for word in words[:-1]] + words[-1:]
+
+class FakeOpenRouterHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = FakeOpenRouterConfig()
+
+    def log_message(self, *args):
+        pass
+
+    def send_empty(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.send_empty(200)
+
+    def do_GET(self):
+        body = json.dumps({"data": [{"id": "bench/model-a"}, {"id": "bench/model-b"}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_empty(404)
+            return
+        config = self.config
+        time.sleep(config.latency)
+        if config.should_fail():
+            self.send_empty(config.failure_status, [("Retry-After", "0")] if config.failure_status == 429 else [])
+            return
+        tokens = config.answer_tokens(body["messages"][-1]["content"])
+        usage = {"prompt_tokens": sum(len(m["content"]) // 3 for m in body["messages"]), "completion_tokens": len(tokens)}
+        if not body.get("stream"):
+            answer = json.dumps({"model": body.get("model"), "choices": [{"message": {"role": "assistant", "content": "".join(tokens)}}],
+                                 "usage": usage}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(answer)))
+            self.end_headers()
+            self.wfile.write(answer)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            self.write_chunk(b": OPENROUTER PROCESSING\n\n")
+            delay = 1.0 / config.token_rate if config.token_rate else 0.0
+            next_at = time.monotonic()
+            for token in tokens:
+                next_at += delay
+                pause = next_at - time.monotonic()
+                if pause > 0:
+                    time.sleep(pause)
+                self.write_event({"choices": [{"delta": {"content": token}}]})
+            self.write_event({"choices": [{"delta": {}, "finish_reason": "stop"}], "usage": usage})
+            self.write_chunk(b"data: [DONE]\n\n")
+            self.write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # Клиент отменил запрос — нормальная ситуация для бенчмарка отмены
+            pass
+
+    def write_event(self, payload):
+        self.write_chunk(b"data: " + json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n\n")
+
+    def write_chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+def start_fake_openrouter(config=None, port=0):
+    # Сервер в фоновом потоке; base_url подставляется в OPENROUTER_BASE_URL
+    handler = type("ConfiguredHandler", (FakeOpenRouterHandler,), {"config": config or FakeOpenRouterConfig()})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальная замена OpenRouter для бенчмарков")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка до ответа, с")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="токенов в секунду, 0 — без пауз")
+    parser.add_argument("--tokens", type=int, default=None, help="длина ответа в токенах")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="доля ответов с ошибкой")
+    parser.add_argument("--failure-status", type=int, default=503)
+    args = parser.parse_args()
+    config = FakeOpenRouterConfig(args.latency, args.token_rate, args.tokens, args.failure_rate, args.failure_status)
+    server, base_url = start_fake_openrouter(config, args.port)
+    print(f"OPENROUTER_BASE_URL={base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Нагрузочный прогон шлюза целиком на localhost: локальная замена OpenRouter, шлюз на свободном порту
+# и несколько тонких клиентов (HTTP со стримингом) плюс один WebSocket-клиент.
+# Второй проход повторяет вопросы первого от других клиентов — ответы должны прийти из общего кэша.
+# Третий — шлюз с хранилищем, как chat_gateway.py --store: поток текста не должен ломаться от HTML для хранилища.
+# Пример: python benchmarks/gateway_load.py --clients 8 --questions 5 --output gateway.json
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fake_openrouter import FakeOpenRouterConfig, start_fake_openrouter
+from run_benchmarks import summarize
+
+RESULT_VERSION = 1
+
+class TimingListener:
+    def __init__(self, chat_core):
+        self.base = chat_core.ResponseListener()
+        self.started_at = time.perf_counter()
+        self.first_chunk_ms = None
+        self.streamed = ""
+        self.text = None
+
+    def __getattr__(self, name):
+        return getattr(self.base, name)
+
+    def chunk(self, snapshot, text):
+        if self.first_chunk_ms is None:
+            self.first_chunk_ms = (time.perf_counter() - self.started_at) * 1000
+        self.streamed = text
+
+    def finished(self, text, html_text, store_id):
+        self.text = text
+
+async def run_client(chat_core, client, questions, results):
+    history = chat_core.MessageStore()
+    for question in questions:
+        listener = TimingListener(chat_core)
+        metrics = await client.respond(history, chat_core.ChatMessage("user", question), listener=listener)
+        # Склеенные куски потока — начало итогового текста (в конце бэкенд дописывает ссылку на сайт AMD)
+        broken = listener.text is not None and not listener.text.startswith(listener.streamed)
+        results.append({"status": metrics["status"], "total_ms": (time.perf_counter() - listener.started_at) * 1000,
+                        "first_chunk_ms": listener.first_chunk_ms, "broken_stream": broken})
+
+async def run_websocket(url, question):
+    import aiohttp
+    started = time.perf_counter()
+    events = []
+    async with aiohttp.ClientSession() as http:
+        async with http.post(f"{url}/v1/sessions", json={"client": "ws-bench"}) as response:
+            session = (await response.json())["session"]
+        async with http.ws_connect(f"{url}/v1/sessions/{session}/ws") as ws:
+            await ws.send_json({"type": "message", "id": 1, "content": question})
+            async for message in ws:
+                event = message.json()
+                events.append(event["type"])
+                if event["type"] == "done":
+                    break
+    return {"total_ms": round((time.perf_counter() - started) * 1000, 2), "events": len(events),
+            "deltas": events.count("delta"), "finished": "finished" in events}
+
+async def run_cancel(chat_core, gateway, client, question):
+    # Клиент бросает вопрос посреди стрима: шлюз должен отменить ответ и освободить слот
+    history = chat_core.MessageStore()
+    task = asyncio.ensure_future(client.respond(history, chat_core.ChatMessage("user", question)))
+    deadline = time.monotonic() + 5
+    while gateway.active == 0 and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    deadline = time.monotonic() + 5
+    while gateway.active and time.monotonic() < deadline:
+        await asyncio.sleep(0.005)
+    return {"active_after_cancel": gateway.active}
+
+async def start_stack(chat_core, chat_gateway, args, base_url, data_dir, store):
+    # Как chat_gateway.py: с --store бэкенд ещё и рендерит HTML для своего хранилища
+    backend = chat_core.ChatBackend(data_dir=data_dir, use_store=store, use_knowledge=False, render_html=store,
+                                    rate_limiter=chat_core.RateLimiter(args.rate) if args.rate else None,
+                                    client=chat_core.OpenRouterClient(base_url=base_url, pool_size=args.workers))
+    gateway = chat_gateway.ChatGateway(backend, token="", workers=args.workers)
+    runner, url = await chat_gateway.start_gateway(gateway, "127.0.0.1", 0)
+    clients = [chat_gateway.GatewayClient(url, token="", use_store=False) for _ in range(args.clients)]
+    return gateway, runner, url, clients
+
+async def run_pass(name, chat_core, clients, questions, config):
+    requests = []
+    upstream_before = config.requests
+    started = time.perf_counter()
+    await asyncio.gather(*(run_client(chat_core, client, client_questions, requests)
+                           for client, client_questions in zip(clients, questions)))
+    elapsed = time.perf_counter() - started
+    statuses = {}
+    for request in requests:
+        statuses[request["status"]] = statuses.get(request["status"], 0) + 1
+    result = {
+        "requests": len(requests), "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(requests) / elapsed, 2) if elapsed else None,
+        "upstream_requests": config.requests - upstream_before, "statuses": statuses,
+        "broken_streams": sum(request["broken_stream"] for request in requests),
+        "total_ms": summarize([request["total_ms"] for request in requests]),
+        "first_chunk_ms": summarize([request["first_chunk_ms"] for request in requests if request["first_chunk_ms"]]),
+    }
+    print(f"{name}: {len(requests)} запросов за {elapsed:.2f} с, к модели: {result['upstream_requests']}, "
+          f"сломанных потоков: {result['broken_streams']}", file=sys.stderr)
+    return result
+
+async def main_gateway(args):
+    config = FakeOpenRouterConfig(args.latency, args.token_rate, args.tokens, args.failure_rate, args.failure_status)
+    server, base_url = start_fake_openrouter(config)
+    home = tempfile.mkdtemp(prefix="amd_chatbot_gateway_")
+    os.environ["AMD_CHATBOT_HOME"] = home
+    import chat_core
+    import chat_gateway
+    questions = [[f"Клиент {c}, вопрос {q}: как обновить BIOS для Ryzen?" for q in range(args.questions)]
+                 for c in range(args.clients)]
+    results = {}
+    try:
+        gateway, runner, url, clients = await start_stack(chat_core, chat_gateway, args, base_url, home, store=False)
+        try:
+            results["cold"] = await run_pass("cold", chat_core, clients, questions, config)
+            # Во втором проходе клиент c задаёт вопросы клиента c + 1
+            results["shared_cache"] = await run_pass("shared_cache", chat_core, clients, questions[1:] + questions[:1], config)
+            results["websocket"] = await run_websocket(url, "Вопрос по WebSocket: как включить EXPO?")
+            results["cancel"] = await run_cancel(chat_core, gateway, clients[0], "Длинный вопрос, который будет отменён")
+        finally:
+            for client in clients:
+                await client.close()
+            await runner.cleanup()
+        store_home = os.path.join(home, "store")
+        gateway, runner, url, clients = await start_stack(chat_core, chat_gateway, args, base_url, store_home, store=True)
+        try:
+            results["store"] = await run_pass("store", chat_core, clients, questions, config)
+        finally:
+            for client in clients:
+                await client.close()
+            await runner.cleanup()
+        with sqlite3.connect(os.path.join(store_home, "conversations.sqlite3")) as connection:
+            results["store"]["stored_rows"] = dict(connection.execute("SELECT role, COUNT(*) FROM messages GROUP BY role"))
+    finally:
+        server.shutdown()
+    return {
+        "version": RESULT_VERSION, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {"clients": args.clients, "questions": args.questions, "workers": args.workers, "rate": args.rate,
+                   "latency_s": args.latency, "token_rate": args.token_rate, "tokens": args.tokens,
+                   "failure_rate": args.failure_rate},
+        "results": results,
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон шлюза AMD ChatBot на localhost")
+    parser.add_argument("--output", help="файл для JSON, по умолчанию stdout")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--questions", type=int, default=5, help="вопросов на клиента за проход")
+    parser.add_argument("--workers", type=int, default=16, help="одновременных ответов на шлюзе")
+    parser.add_argument("--rate", type=float, default=0.0, help="лимит запросов шлюза к модели в секунду")
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка фейкового сервера до ответа, с")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="токенов в секунду от фейкового сервера")
+    parser.add_argument("--tokens", type=int, default=None, help="длина ответа в токенах")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=503)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    report = json.dumps(asyncio.run(main_gateway(arguments)), ensure_ascii=False, indent=1)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        print(report)
@@ -0,0 +1,287 @@
+# Безголовые бенчмарки ChatBotWindow против локальной замены OpenRouter.
+# Результат — JSON (stdout или --output), краткая сводка — в stderr.
+# Пример: python benchmarks/run_benchmarks.py --turns 100,1000,5000 --output bench.json
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_STARTED = time.perf_counter()
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from fake_openrouter import FakeOpenRouterConfig, SAMPLE_ANSWER, start_fake_openrouter
+
+RESULT_VERSION = 1
+
+def summarize(values):
+    values = sorted(values)
+    if not values:
+        return None
+    rank = lambda p: values[max(0, -(-len(values) * p // 100) - 1)]
+    return {"n": len(values), "mean": round(statistics.fmean(values), 3), "p50": round(rank(50), 3),
+            "p95": round(rank(95), 3), "max": round(values[-1], 3)}
+
+def rss_mb():
+    # Текущий RSS из /proc; там, где его нет, — пиковый из getrusage
+    try:
+        with open("/proc/self/statm") as f:
+            return round(int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20, 1)
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1)
+
+def wait_until(app, predicate, timeout):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
+
+def child_startup():
+    # Холодный запуск в отдельном процессе: импорт, построение окна, первый кадр
+    import main
+    imported = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([])
+    window = main.ChatBotWindow()
+    window.show()
+    built = time.perf_counter()
+    wait_until(app, lambda: window.frame_monitor.frames, 10)
+    painted = time.perf_counter()
+    print(json.dumps({"import_ms": (imported - BENCH_STARTED) * 1000, "window_ms": (built - imported) * 1000,
+                      "first_frame_ms": (painted - built) * 1000, "total_ms": (painted - BENCH_STARTED) * 1000}))
+
+def bench_startup(runs, env):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child-startup"], env=env,
+                                capture_output=True, text=True, timeout=120).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: summarize([sample[key] for sample in samples]) for key in samples[0]}
+
+def bench_network(app, window, requests_count, timeout):
+    # От нажатия «Отправить» до первого кадра с текстом ответа и до конца ответа
+    first_paint, complete, failed = [], [], 0
+    state = {}
+    window.stream_chunk_signal.connect(lambda *_: state.setdefault("chunk_at", time.monotonic()))
+    for i in range(requests_count):
+        state.clear()
+        recorded = len(window.request_metrics.records)
+        sent = time.monotonic()
+        window.input_field.setText(f"Бенчмарк вопрос {i}: стоит ли обновлять BIOS перед установкой Ryzen 7 7800X3D?")
+        window.send_message()
+        if wait_until(app, lambda: "chunk_at" in state and window.frame_monitor.frames
+                      and window.frame_monitor.frames[-1][0] >= state["chunk_at"], timeout):
+            first_paint.append((window.frame_monitor.frames[-1][0] - sent) * 1000)
+        if not wait_until(app, lambda: len(window.request_metrics.records) > recorded, timeout):
+            failed += 1
+            continue
+        record = window.request_metrics.records[-1]
+        if record["status"] == "error":
+            failed += 1
+        complete.append((time.monotonic() - sent) * 1000)
+    records = [record for record in window.request_metrics.records if record["status"] == "ok"]
+    return {
+        "requests": requests_count, "failed": failed,
+        "send_to_first_paint_ms": summarize(first_paint), "send_to_complete_ms": summarize(complete),
+        "ttfb_ms": summarize([r["ttfb_ms"] for r in records if r["ttfb_ms"] is not None]),
+        "first_token_ms": summarize([r["first_token_ms"] for r in records if r["first_token_ms"] is not None]),
+        "tokens_per_s": summarize([r["tokens_per_s"] for r in records if r["tokens_per_s"] is not None]),
+        "markdown_ms": summarize([r["markdown_ms"] for r in records if r["markdown_ms"] is not None]),
+        "gui_ms": summarize([r["gui_ms"] for r in records if r["gui_ms"] is not None]),
+    }
+
+def fill_turns(app, window, turns, answer_html):
+    session = window.current_session
+    started = time.perf_counter()
+    for i in range(turns):
+        window.update_chat_area(session, f"<b>Вы:</b> вопрос номер {i} про Radeon RX 7900 XTX")
+        window.begin_stream_block(session)
+        window.finish_stream_block(session, answer_html, -1)
+        if i % 100 == 99:
+            app.processEvents()
+    app.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+def measure_frames(app, window, action, frames):
+    monitor = window.frame_monitor
+    monitor.frames.clear()
+    for step in range(frames):
+        action(step)
+        window.chat_area.viewport().update()
+        app.processEvents()
+    return summarize([paint_ms for _, paint_ms in monitor.frames])
+
+def bench_export(core, turns, answer_html, export_dir):
+    # Экспорт идёт из структурированных реплик, поэтому объём задаётся числом ходов, а не лентой окна
+    created = time.time()
+    rows = []
+    for i in range(turns):
+        question = f"вопрос номер {i} про Radeon RX 7900 XTX"
+        rows.append(("user", question, question, created))
+        rows.append(("assistant", SAMPLE_ANSWER, answer_html, created))
+    results = {}
+    for suffix in (".jsonl", ".md", ".html"):
+        path = os.path.join(export_dir, f"export_{turns}{suffix}")
+        exporter = core.ChatExporter(lambda: (len(rows), iter(rows)), path)
+        started = time.perf_counter()
+        exporter.run()
+        results[suffix[1:]] = {"ms": round((time.perf_counter() - started) * 1000, 2), "bytes": os.path.getsize(path)}
+    return results
+
+def bench_transcript(core, app, window, turn_counts, answer_html, export_dir):
+    results = []
+    loaded = 0
+    scrollbar = window.chat_area.verticalScrollBar()
+    for target in turn_counts:
+        insert_ms = fill_turns(app, window, target - loaded, answer_html)
+        inserted = target - loaded
+        loaded = target
+        scroll_frames = measure_frames(
+            app, window, lambda step: scrollbar.setValue(scrollbar.maximum() - step * scrollbar.pageStep() // 2), 60)
+        scrollbar.setValue(scrollbar.maximum())
+        session = window.current_session
+        window.begin_stream_block(session)
+        stream_frames = measure_frames(
+            app, window, lambda step: window.update_stream_block(session, answer_html[:len(answer_html) * (step + 1) // 30]), 30)
+        window.finish_stream_block(session, answer_html, -1)
+        export = bench_export(core, target, answer_html, export_dir)
+        results.append({
+            "turns": target, "rows": window.chat_area.transcript_model.rowCount(), "rss_mb": rss_mb(),
+            "insert_ms_per_turn": round(insert_ms / max(1, inserted), 4),
+            "scroll_frame_ms": scroll_frames, "stream_frame_ms": stream_frames,
+            "export": export,
+        })
+        print(f"  {target} turns: rss {results[-1]['rss_mb']} MB, html export {export['html']['ms']:.1f} ms", file=sys.stderr)
+    return results
+
+def bench_markdown(core, iterations):
+    renderer = core.MarkdownRenderer()
+    renderer.render("warm-up", cache=False)
+    texts = [f"{SAMPLE_ANSWER}\n\nВариант {i}" for i in range(iterations)]
+    started = time.perf_counter()
+    for text in texts:
+        renderer.render(text, cache=False)
+    cold_ms = (time.perf_counter() - started) * 1000 / iterations
+    renderer.render(texts[0])
+    started = time.perf_counter()
+    for _ in range(iterations):
+        renderer.render(texts[0])
+    cached_ms = (time.perf_counter() - started) * 1000 / iterations
+    long_answer = "\n\n".join([SAMPLE_ANSWER] * 20)
+    streaming = core.StreamingMarkdown(renderer)
+    started = time.perf_counter()
+    for offset in range(0, len(long_answer), core.STREAM_FLUSH_CHARS):
+        streaming.feed(long_answer[offset:offset + core.STREAM_FLUSH_CHARS])
+    stream_ms = (time.perf_counter() - started) * 1000
+    return {"render_ms": round(cold_ms, 4), "render_ms_per_kb": round(cold_ms / (len(texts[0].encode()) / 1024), 4),
+            "cached_render_ms": round(cached_ms, 4), "streaming_answer_chars": len(long_answer),
+            "streaming_total_ms": round(stream_ms, 2)}
+
+def bench_message_store(core, turns):
+    # Память на реплику в истории вкладки и сборка тела запроса: первая — с сериализацией, повторная — из кэша записей
+    import tracemalloc
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    history = core.MessageStore()
+    for i in range(turns):
+        history.add_input(history.append(core.ChatMessage("user", f"Вопрос {i} про Ryzen")))
+        history.append(core.ChatMessage("assistant", f"{SAMPLE_ANSWER} {i}"))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    payload = {"messages": history.messages, "stream": True, "model": "bench/model-a"}
+    timings = []
+    for _ in range(2):
+        started = time.perf_counter()
+        body = core.encode_payload(payload)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {"messages": len(history), "bytes_per_message": round(used / (2 * turns), 1), "payload_bytes": len(body),
+            "first_encode_ms": round(timings[0], 3), "cached_encode_ms": round(timings[1], 3)}
+
+def main_benchmarks(args):
+    config = FakeOpenRouterConfig(args.latency, args.token_rate, args.tokens, args.failure_rate, args.failure_status)
+    server, base_url = start_fake_openrouter(config)
+    home = tempfile.mkdtemp(prefix="amd_chatbot_bench_")
+    env = dict(os.environ, AMD_CHATBOT_HOME=home, OPENROUTER_BASE_URL=base_url, OPENROUTER_API_KEY="bench",
+               OPENROUTER_MODELS="bench/model-a,bench/model-b", AMD_CHATBOT_RENDER_MODE=args.render_mode)
+    os.environ.update(env)
+    results = {}
+    print("startup...", file=sys.stderr)
+    results["startup"] = bench_startup(args.startup_runs, env)
+    import main
+    import chat_core
+    from PyQt6.QtCore import QT_VERSION_STR
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication([])
+    window = main.ChatBotWindow()
+    window.resize(1000, 750)
+    window.show()
+    window.set_active_screen(4)
+    wait_until(app, lambda: window.frame_monitor.frames, 10)
+    print("network...", file=sys.stderr)
+    results["network"] = bench_network(app, window, args.requests, args.request_timeout)
+    results["network"]["server_requests"] = config.requests
+    results["network"]["server_failures"] = config.failures
+    print("markdown...", file=sys.stderr)
+    results["markdown"] = bench_markdown(chat_core, args.markdown_iterations)
+    print("message store...", file=sys.stderr)
+    results["message_store"] = bench_message_store(chat_core, max(args.turns))
+    print("transcript...", file=sys.stderr)
+    answer_html = window.markdown_renderer.render(SAMPLE_ANSWER)
+    window.clear_chat()
+    results["transcript"] = bench_transcript(chat_core, app, window, args.turns, answer_html, home)
+    started = time.perf_counter()
+    window.request_metrics.export(os.path.join(home, "metrics.json"))
+    results["metrics_export_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    window.close()
+    server.shutdown()
+    return {
+        "version": RESULT_VERSION, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": {"python": platform.python_version(), "qt": QT_VERSION_STR, "platform": platform.platform(),
+                        "qpa": os.environ.get("QT_QPA_PLATFORM")},
+        "config": {"latency_s": args.latency, "token_rate": args.token_rate, "tokens": args.tokens,
+                   "failure_rate": args.failure_rate, "failure_status": args.failure_status,
+                   "requests": args.requests, "turns": args.turns, "render_mode": args.render_mode},
+        "results": results,
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Бенчмарки AMD ChatBot без окна")
+    parser.add_argument("--child-startup", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="файл для JSON, по умолчанию stdout")
+    parser.add_argument("--turns", type=lambda value: [int(part) for part in value.split(",")], default=[100, 1000, 5000])
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--request-timeout", type=float, default=60.0)
+    parser.add_argument("--startup-runs", type=int, default=3)
+    parser.add_argument("--markdown-iterations", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="задержка фейкового сервера до ответа, с")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="токенов в секунду от фейкового сервера")
+    parser.add_argument("--tokens", type=int, default=None, help="длина ответа в токенах")
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=503)
+    parser.add_argument("--render-mode", default="effects", choices=["effects", "cached", "auto"])
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    if arguments.child_startup:
+        child_startup()
+        sys.exit(0)
+    report = json.dumps(main_benchmarks(arguments), ensure_ascii=False, indent=1)
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as f:
+            f.write(report)
+    else:
+        print(report)
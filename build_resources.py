@@ -0,0 +1,93 @@
+# Собирает иконки из path/to в ресурсный пакет Qt (resources_rc.py).
+# PyQt6 больше не поставляет pyrcc, поэтому бинарный формат rcc (версия 1) пишется здесь напрямую.
+# Запуск: python build_resources.py
+import os
+import struct
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, Qt
+from PyQt6.QtGui import QGuiApplication, QImage
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "path", "to")
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources_rc.py")
+PREFIX = "icons"
+# Кнопочные иконки показываются 16×16; 32×32 оставляет запас для HiDPI и экономит декодирование при запуске
+BUTTON_ICON_SIZE = 32
+BUTTON_ICONS = ("bell_icon.png", "search_icon.png", "settings_icon.png", "star_icon.png")
+
+def qt_hash(name):
+    h = 0
+    for ch in name:
+        h = ((h << 4) + ord(ch)) & 0xFFFFFFFF
+        h ^= (h & 0xF0000000) >> 23
+        h &= 0x0FFFFFFF
+    return h
+
+def scaled_png(path, size):
+    image = QImage(path).scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, "PNG")
+    return bytes(data)
+
+def load_files():
+    files = {}
+    for name in sorted(os.listdir(SOURCE_DIR)):
+        path = os.path.join(SOURCE_DIR, name)
+        if name in BUTTON_ICONS:
+            files[name] = scaled_png(path, BUTTON_ICON_SIZE)
+        else:
+            with open(path, "rb") as f:
+                files[name] = f.read()
+    return files
+
+def build_rcc(files):
+    names = bytearray()
+    name_offsets = {}
+
+    def add_name(name):
+        if name not in name_offsets:
+            name_offsets[name] = len(names)
+            names.extend(struct.pack(">HI", len(name), qt_hash(name)))
+            names.extend(name.encode("utf-16-be"))
+        return name_offsets[name]
+
+    data = bytearray()
+    data_offsets = {}
+    for name, blob in files.items():
+        data_offsets[name] = len(data)
+        data.extend(struct.pack(">I", len(blob)))
+        data.extend(blob)
+
+    # Узлы: 0 — корень, 1 — каталог префикса, дальше файлы, отсортированные по хэшу имени для бинарного поиска
+    children = sorted(files, key=qt_hash)
+    tree = bytearray()
+    tree.extend(struct.pack(">IHII", 0, 2, 1, 1))
+    tree.extend(struct.pack(">IHII", add_name(PREFIX), 2, len(children), 2))
+    for name in children:
+        # Локаль файла: любая территория (0), язык QLocale.C (1) — как у rcc по умолчанию
+        tree.extend(struct.pack(">IHHHI", add_name(name), 0, 0, 1, data_offsets[name]))
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    header = b"qres" + struct.pack(">IIII", 1, tree_offset, data_offset, names_offset)
+    return header + bytes(tree) + bytes(data) + bytes(names)
+
+def main():
+    app = QGuiApplication([])
+    files = load_files()
+    bundle = build_rcc(files)
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write("# Сгенерировано build_resources.py из path/to — не редактировать вручную.\n")
+        f.write("from PyQt6.QtCore import QResource\n\n")
+        f.write("qt_resource_data = (\n")
+        for i in range(0, len(bundle), 48):
+            f.write(f"    {bundle[i:i + 48]!r}\n")
+        f.write(")\n\n")
+        f.write("QResource.registerResourceData(qt_resource_data)\n")
+    print(f"{OUTPUT_PATH}: {len(files)} файлов, {len(bundle)} байт")
+    del app
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# Пакетный режим без окна: вопросы из JSONL или CSV, ответы построчно в JSONL по мере готовности,
+# сводка по пропускной способности и задержкам — в stderr. Каждый вопрос — отдельный разговор.
+# Пример: python chat_batch.py faq.jsonl --output answers.jsonl --concurrency 8 --rate 4
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+from chat_core import (API_BASE_URL, API_POOL_SIZE, REQUEST_WORKERS, ChatBackend, ChatMessage, MessageStore,
+                       OpenRouterClient, RateLimiter, RequestMetricsLog, ResponseListener, logger, setup_logging)
+
+def read_questions(path):
+    # JSONL: объект с полями question (text, prompt) и id или просто строка; CSV: столбцы question и id, иначе первый столбец
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        if os.path.splitext(path)[1].lower() == ".csv":
+            rows = csv.reader(f)
+            header = next(rows, None)
+            if header is None:
+                return
+            names = [name.strip().lower() for name in header]
+            if "question" in names:
+                question_column = names.index("question")
+                id_column = names.index("id") if "id" in names else None
+            else:
+                question_column, id_column = 0, None
+                rows = [header, *rows]
+            for number, row in enumerate(rows, 1):
+                if len(row) > question_column and row[question_column].strip():
+                    yield (row[id_column] if id_column is not None else number), row[question_column].strip()
+            return
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            item = json.loads(line)
+            if isinstance(item, str):
+                yield number, item
+            else:
+                question = item.get("question") or item.get("text") or item.get("prompt")
+                if question:
+                    yield item.get("id", number), question
+
+class BatchListener(ResponseListener):
+    def __init__(self):
+        self.error = None
+
+    def failed(self, error):
+        self.error = error
+
+async def answer(backend, question_id, question):
+    history = MessageStore()
+    listener = BatchListener()
+    metrics = await backend.respond(history, ChatMessage("user", question), listener=listener)
+    reply = history[-1].content if history[-1].role == "assistant" else ""
+    return {"id": question_id, "question": question, "answer": reply, "status": metrics["status"],
+            "model": metrics["model"], "total_ms": metrics["total_ms"], "first_token_ms": metrics["first_token_ms"],
+            "prompt_tokens": metrics["prompt_tokens"], "completion_tokens": metrics["completion_tokens"],
+            "error": listener.error}, metrics
+
+async def run_batch(args, output):
+    backend = ChatBackend(use_cache=not args.no_cache, use_store=False, use_knowledge=not args.no_knowledge,
+                          render_html=False, rate_limiter=RateLimiter(args.rate, args.burst) if args.rate else None,
+                          client=OpenRouterClient(base_url=args.base_url, pool_size=max(API_POOL_SIZE, args.concurrency)))
+    questions = read_questions(args.input)
+    records = []
+    started = time.perf_counter()
+
+    async def worker():
+        # Воркеры сами берут следующий вопрос: файл читается по мере работы, а не целиком
+        for question_id, question in questions:
+            row, metrics = await answer(backend, question_id, question)
+            records.append(metrics)
+            output.write(json.dumps(row, ensure_ascii=False) + "\n")
+            output.flush()
+            if not args.quiet:
+                print(f"[{len(records)}] {row['status']} {row['total_ms']} мс: {question[:60]}", file=sys.stderr)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    finally:
+        await backend.close()
+        backend.close_storage()
+    return records, time.perf_counter() - started
+
+def print_stats(records, elapsed):
+    statuses = {}
+    for record in records:
+        statuses[record["status"]] = statuses.get(record["status"], 0) + 1
+    print(f"Вопросов: {len(records)} за {elapsed:.2f} с · {len(records) / elapsed if elapsed else 0:.2f} вопр./с · "
+          + ", ".join(f"{status}: {count}" for status, count in sorted(statuses.items())), file=sys.stderr)
+    for field, title in (("total_ms", "Полное время"), ("first_token_ms", "Первый токен"), ("rate_wait_ms", "Ожидание лимита")):
+        points = RequestMetricsLog.percentiles(records, field)
+        if points:
+            print(f"{title}, мс: p50 {points[0]:.1f} · p95 {points[1]:.1f} · p99 {points[2]:.1f}", file=sys.stderr)
+    tokens = sum(record["completion_tokens"] or 0 for record in records)
+    if tokens and elapsed:
+        print(f"Токенов ответа: {tokens} · {tokens / elapsed:.1f} ток./с", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетные ответы чат-бота AMD без окна")
+    parser.add_argument("input", help="вопросы: .jsonl (поле question) или .csv (столбец question)")
+    parser.add_argument("--output", "-o", help="файл JSONL для ответов, по умолчанию stdout")
+    parser.add_argument("--concurrency", "-c", type=int, default=REQUEST_WORKERS, help="одновременных вопросов")
+    parser.add_argument("--rate", type=float, default=0.0, help="не больше стольких запросов к модели в секунду (0 — без лимита)")
+    parser.add_argument("--burst", type=float, default=None, help="допустимый всплеск запросов сверх --rate")
+    parser.add_argument("--base-url", default=API_BASE_URL, help="адрес OpenRouter или локальной заглушки")
+    parser.add_argument("--no-cache", action="store_true", help="не читать и не пополнять кэш ответов")
+    parser.add_argument("--no-knowledge", action="store_true", help="не отвечать из локального справочника и не добавлять фрагменты")
+    parser.add_argument("--quiet", "-q", action="store_true", help="без построчного прогресса в stderr")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency должно быть не меньше 1")
+    log_listener = setup_logging()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        records, elapsed = asyncio.run(run_batch(args, output))
+    except (OSError, ValueError) as e:
+        logger.error("Batch failed: %s", e)
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        log_listener.stop()
+    print_stats(records, elapsed)
+    return 1 if any(record["status"] == "error" for record in records) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
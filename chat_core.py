@@ -0,0 +1,1832 @@
+# Ядро чата без Qt: сеть, повторы, контекст, кэш, справочник, хранилище и экспорт.
+# Используется окном (main.py), пакетным режимом (chat_batch.py) и бенчмарками
+import time
+import sys
+import json
+import threading
+import os
+import re
+import html
+import hashlib
+import sqlite3
+import zlib
+import queue
+import random
+import tempfile
+import logging
+import logging.handlers
+import itertools
+import csv
+import math
+import email.utils
+from array import array
+from collections import deque, OrderedDict
+
+SYSTEM_PROMPT = "Вы — технический помощник AMD. Отвечайте на вопросы о продуктах Ryzen и Radeon. Если нужно предоставить ссылку, используйте Markdown-формат, например [AMD](https://www.amd.com)."
+APP_DATA_DIR = os.environ.get("AMD_CHATBOT_HOME", os.path.join(os.path.expanduser("~"), ".amd_chatbot"))
+API_BASE_URL = os.environ.get("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+API_KEY = os.environ.get("OPENROUTER_API_KEY", "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")
+# Таймаут чтения считается между чанками — при стриминге ответ целиком может идти дольше минуты
+API_CONNECT_TIMEOUT = float(os.environ.get("OPENROUTER_CONNECT_TIMEOUT", "10"))
+API_READ_TIMEOUT = float(os.environ.get("OPENROUTER_READ_TIMEOUT", "60"))
+API_POOL_SIZE = 8
+# Основная модель и резервные в порядке переключения
+API_MODELS = [model.strip() for model in os.environ.get(
+    "OPENROUTER_MODELS",
+    "tngtech/deepseek-r1t-chimera:free,deepseek/deepseek-chat-v3-0324:free,deepseek/deepseek-r1:free").split(",") if model.strip()]
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+RETRYABLE_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 30.0
+# Общий предел ожидания начала ответа и порог, после которого параллельно спрашивается следующая модель (0 — выкл.)
+REQUEST_DEADLINE = float(os.environ.get("AMD_CHATBOT_REQUEST_DEADLINE", "90"))
+HEDGE_AFTER = float(os.environ.get("AMD_CHATBOT_HEDGE_AFTER", "8"))
+# Не больше стольких запросов одновременно в работе и в очереди
+REQUEST_WORKERS = 4
+REQUEST_QUEUE_LIMIT = 8
+# Бюджет контекста на запрос: системный промпт и свежие реплики, старые сворачиваются в краткую сводку
+CONTEXT_TOKEN_BUDGET = int(os.environ.get("AMD_CHATBOT_CONTEXT_TOKENS", "6000"))
+CONTEXT_SUMMARY_SHARE = 0.15
+CONTEXT_SUMMARY_LINE_CHARS = 160
+# Частичный текст отправляется в интерфейс пачками, а не на каждый токен
+STREAM_FLUSH_INTERVAL = 0.05
+STREAM_FLUSH_CHARS = 48
+MARKDOWN_CACHE_LIMIT = 256
+# Кэш ответов на диске: срок жизни, предел размера и порог похожести для нечёткого поиска (None — выключен)
+RESPONSE_CACHE_TTL = 7 * 24 * 3600
+RESPONSE_CACHE_MAX_ENTRIES = 2000
+RESPONSE_CACHE_MAX_BYTES = 20 * 1024 * 1024
+RESPONSE_CACHE_FUZZY_THRESHOLD = 0.7
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+# При запуске подгружаются только последние сообщения, более старые — страницами при прокрутке вверх
+HISTORY_PAGE_SIZE = 50
+SEARCH_RESULT_LIMIT = 30
+# Сколько id сообщений процесс резервирует в базе за раз
+MESSAGE_ID_BLOCK = 256
+# Локальный справочник: корпус характеристик лежит рядом с программой, индекс (BM25 и векторы .npy через mmap) — в папке данных.
+# Короткие вопросы о характеристиках одной модели отвечаются без сети, к остальным добавляются лучшие фрагменты
+KNOWLEDGE_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "knowledge", "amd_specs.json")
+KNOWLEDGE_INDEX_DIR = os.path.join(APP_DATA_DIR, "knowledge_index")
+KNOWLEDGE_INDEX_VERSION = 1
+KNOWLEDGE_EMBEDDING_DIM = 512
+KNOWLEDGE_TOP_K = 3
+KNOWLEDGE_MIN_SCORE = 0.35
+KNOWLEDGE_BM25_WEIGHT = 0.6
+KNOWLEDGE_LOOKUP_MAX_WORDS = 12
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+EXPORT_BATCH_SIZE = 500
+EXPORT_FILTERS = "JSON Lines (*.jsonl);;Markdown (*.md);;HTML (*.html)"
+EXPORT_HTML_HEADER = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+<meta charset="utf-8">
+<title>Чат с поддержкой AMD</title>
+<style>
+body { font-family: "Segoe UI", Arial, sans-serif; max-width: 860px; margin: 24px auto; color: #1E1E1E; background: #F3F3F3; }
+section { background: #FFFFFF; border: 1px solid #CCCCCC; border-radius: 6px; padding: 10px 14px; margin: 10px 0; }
+section.user { border-left: 4px solid #5F5F5F; }
+section.assistant { border-left: 4px solid #D32F2F; }
+.meta { color: #5F5F5F; font-size: 12px; margin-bottom: 6px; }
+pre { background: #F3F3F3; padding: 8px; overflow-x: auto; }
+table { border-collapse: collapse; } td, th { border: 1px solid #CCCCCC; padding: 4px 8px; }
+a { color: #0067C0; }
+</style>
+</head>
+<body>
+<h1>Чат с поддержкой AMD</h1>
+"""
+# Метрики последних запросов для страницы «Производительность»
+REQUEST_METRICS_LIMIT = 1000
+LATENCY_BUCKETS_MS = (250, 500, 1000, 2000, 4000, 8000, 16000)
+# Журнал пишется в фоне в ротируемый файл; тексты запросов — только на уровне DEBUG,
+# обрезанными и не для каждого запроса (один из LOG_DEBUG_SAMPLE_EVERY)
+LOG_LEVEL = os.environ.get("AMD_CHATBOT_LOG_LEVEL", "INFO").upper()
+LOG_PATH = os.path.join(APP_DATA_DIR, "logs", "chatbot.log")
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_PREVIEW_CHARS = 300
+LOG_DEBUG_SAMPLE_EVERY = max(1, int(os.environ.get("AMD_CHATBOT_LOG_SAMPLE_EVERY", "1")))
+
+logger = logging.getLogger("amd_chatbot")
+
+class RedactingFormatter(logging.Formatter):
+    PATTERNS = [
+        (re.compile(r"sk-[A-Za-z0-9_-]{8,}"), "sk-***"),
+        (re.compile(r"(Bearer\s+)\S+"), r"\1***"),
+        (re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+"), "***@***"),
+    ]
+
+    def format(self, record):
+        text = super().format(record)
+        for pattern, replacement in self.PATTERNS:
+            text = pattern.sub(replacement, text)
+        return text
+
+class Preview:
+    # Строка собирается только если запись действительно попадёт в журнал
+    def __init__(self, value, limit=LOG_PREVIEW_CHARS):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self):
+        value = self.value
+        if isinstance(value, MessageStore):
+            value = value.messages
+        if isinstance(value, list) and value and isinstance(value[0], ChatMessage):
+            return f"{len(value)} messages, last {value[-1].role}: {Preview(value[-1].content, self.limit)}"
+        if isinstance(value, dict) and "messages" in value:
+            rest = {key: item for key, item in value.items() if key != "messages"}
+            return f"{rest} + {Preview(value['messages'], self.limit)}"
+        text = value if isinstance(value, str) else repr(value)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[:self.limit]}… (+{len(text) - self.limit} chars)"
+
+class DebugSampler:
+    def __init__(self, every=LOG_DEBUG_SAMPLE_EVERY):
+        self.every = every
+        self.counter = itertools.count()
+
+    def sample(self):
+        # Проверка уровня идёт первой: без DEBUG счётчик не трогается и превью не строятся
+        return logger.isEnabledFor(logging.DEBUG) and next(self.counter) % self.every == 0
+
+debug_sampler = DebugSampler()
+
+def setup_logging(level=LOG_LEVEL, path=LOG_PATH):
+    # Вызывающий поток только кладёт запись в очередь; форматирование, маскирование и запись — в потоке слушателя
+    formatter = RedactingFormatter("%(asctime)s %(levelname)s %(threadName)s %(message)s")
+    handlers = []
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                                            encoding="utf-8", delay=True)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"File logging disabled: {e}", file=sys.stderr)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+    log_queue = queue.SimpleQueue()
+    logger.setLevel(getattr(logging, level, logging.INFO))
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+class AsyncLoopThread:
+    # Один цикл asyncio на всё приложение: запросы, стриминг, повторы и отмена — корутины в одном потоке.
+    # Окно получает результаты через сигналы Qt, как и раньше; сам цикл Qt ничем не блокируется.
+    def __init__(self):
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="asyncio-loop", daemon=True)
+        self.thread.start()
+
+    def submit(self, coroutine):
+        import asyncio
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, callback, *args):
+        self.loop.call_soon_threadsafe(callback, *args)
+
+    def stop(self, cleanup=None, timeout=5.0):
+        import asyncio
+
+        async def shutdown():
+            # Незавершённые запросы отменяются и закрывают свои ответы до закрытия сессии
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if cleanup is not None:
+                await cleanup()
+
+        try:
+            self.submit(shutdown()).result(timeout)
+        except Exception as e:
+            logger.warning("Async loop shutdown incomplete: %s", e)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        if not self.thread.is_alive():
+            self.loop.close()
+
+def make_trace_config():
+    # aiohttp сообщает о разрешении имени и создании соединения; отметки пишутся в trace_request_ctx запроса
+    import aiohttp
+
+    def stamp(name):
+        async def handler(session, context, params):
+            # Запросы без trace_request_ctx (прогрев соединения) отметок не собирают
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx[name] = time.perf_counter()
+        return handler
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(stamp("dns_started"))
+    trace_config.on_dns_resolvehost_end.append(stamp("dns_finished"))
+    trace_config.on_connection_create_start.append(stamp("connect_started"))
+    trace_config.on_connection_create_end.append(stamp("connect_finished"))
+    return trace_config
+
+class OpenRouterClient:
+    def __init__(self, base_url=API_BASE_URL, api_key=API_KEY, connect_timeout=API_CONNECT_TIMEOUT,
+                 read_timeout=API_READ_TIMEOUT, pool_size=API_POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_size = pool_size
+        self.headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "X-Title": "AMD ChatBot Support"
+        }
+        self.session = None
+
+    def get_session(self):
+        # Одна сессия на всё окно: TCP- и TLS-соединения переиспользуются между вопросами.
+        # Сессия привязана к циклу asyncio, поэтому создаётся внутри него при первом запросе
+        if self.session is None:
+            import aiohttp
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                trace_configs=[make_trace_config()])
+        return self.session
+
+    async def chat_completions(self, payload, timings):
+        body = encode_payload(payload)
+        timings["request_bytes"] = len(body)
+        stamps = {}
+        response = await self.get_session().post(f"{self.base_url}/chat/completions", data=body,
+                                                 trace_request_ctx=stamps)
+        timings["reused"] = "connect_finished" not in stamps
+        if not timings["reused"]:
+            dns_ms = (stamps["dns_finished"] - stamps["dns_started"]) * 1000 if "dns_finished" in stamps else 0.0
+            timings["dns_ms"] = dns_ms
+            # aiohttp не разделяет TCP и TLS: для https connect_ms включает рукопожатие
+            timings["connect_ms"] = (stamps["connect_finished"] - stamps["connect_started"]) * 1000 - dns_ms
+        return response
+
+    async def warm_up(self):
+        # Рукопожатие выполняется заранее, соединение остаётся в пуле для первого вопроса
+        import asyncio
+        import aiohttp
+        try:
+            async with self.get_session().head(f"{self.base_url}/models"):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.info("Warm-up failed: %s", e)
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+
+class UpstreamError(Exception):
+    def __init__(self, message, status=None, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+def parse_retry_after(value):
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+def is_retryable(error):
+    import asyncio
+    import aiohttp
+    if isinstance(error, UpstreamError):
+        return error.status is None or error.status in RETRYABLE_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_timeout=BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.open_until = 0.0
+        self.lock = threading.Lock()
+
+    def allows(self):
+        # После паузы разомкнутый выключатель пропускает пробный запрос (half-open)
+        with self.lock:
+            return time.monotonic() >= self.open_until
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.open_until = 0.0
+
+    def record_failure(self, retry_after=None):
+        with self.lock:
+            self.failures += 1
+            if retry_after:
+                self.open_until = max(self.open_until, time.monotonic() + retry_after)
+            if self.failures >= self.failure_threshold:
+                self.open_until = max(self.open_until, time.monotonic() + self.reset_timeout)
+
+class StreamAttempt:
+    def __init__(self, client, model, payload):
+        self.client = client
+        self.model = model
+        self.payload = dict(payload, model=model)
+        self.response = None
+        self.buffered = []
+        self.timings = {}
+
+    async def open(self):
+        # Попытка считается успешной после первого события data: — до него ответ модели ещё не начался
+        started = time.perf_counter()
+        try:
+            self.response = await self.client.chat_completions(self.payload, self.timings)
+            self.timings["ttfb_ms"] = (time.perf_counter() - started) * 1000
+            if self.response.status >= 400:
+                raise UpstreamError(f"{self.response.status} {self.response.reason}", self.response.status,
+                                    parse_retry_after(self.response.headers.get("Retry-After")))
+            async for line in self.response.content:
+                line = line.rstrip(b"\r\n")
+                self.buffered.append(line)
+                if line.startswith(b"data:"):
+                    payload = line[5:].strip()
+                    if payload.startswith(b"{") and b'"error"' in payload:
+                        error = json.loads(payload.decode("utf-8")).get("error")
+                        if error:
+                            code = error.get("code")
+                            raise UpstreamError(error.get("message", str(error)), code if isinstance(code, int) else None)
+                    self.timings["first_event_ms"] = (time.perf_counter() - started) * 1000
+                    break
+        except BaseException:
+            # Ошибка или отмена (проигравший хедж, очистка чата) сразу освобождает сокет
+            self.close()
+            raise
+        return self
+
+    def close(self):
+        if self.response is not None:
+            self.response.close()
+
+    async def iter_lines(self):
+        for line in self.buffered:
+            yield line
+        async for line in self.response.content:
+            yield line.rstrip(b"\r\n")
+
+class RequestPolicy:
+    def __init__(self, client, models=API_MODELS, max_attempts=RETRY_MAX_ATTEMPTS, base_delay=RETRY_BASE_DELAY,
+                 max_delay=RETRY_MAX_DELAY, deadline=REQUEST_DEADLINE, hedge_after=HEDGE_AFTER):
+        self.client = client
+        self.models = list(models)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.hedge_after = hedge_after
+        self.breakers = {model: CircuitBreaker() for model in self.models}
+
+    def available_models(self):
+        return [model for model in self.models if self.breakers[model].allows()]
+
+    def backoff(self, failures):
+        # Полный джиттер: случайная пауза до экспоненциальной границы
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** failures))
+
+    def start_attempt(self, attempts, model, payload):
+        import asyncio
+        attempt = StreamAttempt(self.client, model, payload)
+        attempts[asyncio.ensure_future(attempt.open())] = attempt
+
+    @staticmethod
+    def discard(attempts):
+        for task, attempt in attempts.items():
+            task.cancel()
+            if task.done() and not task.cancelled():
+                task.exception()
+            attempt.close()
+        attempts.clear()
+
+    async def open_stream(self, payload, on_status=None):
+        # Отмена вызывающей задачи (очистка чата, закрытие окна) прерывает ожидание, паузу и все попытки
+        import asyncio
+        deadline = time.monotonic() + self.deadline
+        last_error = None
+        for failures in range(self.max_attempts):
+            models = self.available_models()
+            if not models:
+                # Все выключатели разомкнуты — пробуем основную модель, чтобы не отказывать сразу
+                models = self.models[:1]
+            attempts = {}
+            self.start_attempt(attempts, models[0], payload)
+            hedge_at = time.monotonic() + self.hedge_after if self.hedge_after and len(models) > 1 else None
+            try:
+                while attempts:
+                    now = time.monotonic()
+                    if now > deadline:
+                        raise last_error or TimeoutError("Превышено время ожидания ответа")
+                    wake_at = deadline if hedge_at is None else min(deadline, hedge_at)
+                    done, _ = await asyncio.wait(attempts, timeout=wake_at - now, return_when=asyncio.FIRST_COMPLETED)
+                    if not done:
+                        if hedge_at and time.monotonic() >= hedge_at:
+                            # Основная модель долго молчит — параллельно спрашиваем следующую, побеждает первый ответ
+                            hedge_at = None
+                            self.start_attempt(attempts, models[1], payload)
+                            if on_status:
+                                on_status(f"Долгий ответ, дополнительно запрошена {models[1]}...")
+                        continue
+                    for task in done:
+                        attempt = attempts.pop(task)
+                        breaker = self.breakers[attempt.model]
+                        error = task.exception()
+                        if error is None:
+                            breaker.record_success()
+                            return attempt
+                        logger.info("Attempt on %s failed: %s", attempt.model, error)
+                        last_error = error
+                        if not is_retryable(error):
+                            if isinstance(error, UpstreamError) and error.status == 404:
+                                # Модель недоступна — сразу исключаем её надолго, остальные ещё пробуем
+                                breaker.record_failure(BREAKER_RESET_TIMEOUT)
+                                continue
+                            raise error
+                        breaker.record_failure(getattr(error, "retry_after", None))
+            finally:
+                self.discard(attempts)
+            if failures == self.max_attempts - 1:
+                break
+            next_models = self.available_models()
+            if next_models and next_models[0] != models[0]:
+                # Переключение на резервную модель без паузы
+                if on_status:
+                    on_status(f"Переключение на {next_models[0]}...")
+                continue
+            delay = getattr(last_error, "retry_after", None)
+            if delay is None:
+                delay = self.backoff(failures)
+            delay = min(delay, max(0.0, deadline - time.monotonic()))
+            if on_status:
+                on_status(f"Повтор через {delay:.1f} с...")
+            await asyncio.sleep(delay)
+        raise last_error or RuntimeError("Не удалось получить ответ")
+
+def estimate_tokens(text):
+    # Грубая оценка без токенизатора: ~3 символа на токен для смеси кириллицы и латиницы
+    return len(text) // 3 + 4
+
+class ChatMessage:
+    # Одна запись на реплику без словаря атрибутов; роль интернирована,
+    # токены, JSON для запроса и HTML считаются один раз по требованию
+    __slots__ = ("role", "content", "message_id", "created", "html_text", "_tokens", "_json")
+
+    def __init__(self, role, content, message_id=None, created=None, html_text=None):
+        self.role = sys.intern(role)
+        self.content = content
+        self.message_id = message_id
+        self.created = time.time() if created is None else created
+        self.html_text = html_text
+        self._tokens = None
+        self._json = None
+
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            self._tokens = estimate_tokens(self.content)
+        return self._tokens
+
+    def to_json(self):
+        if self._json is None:
+            self._json = json.dumps({"role": self.role, "content": self.content}, ensure_ascii=False)
+        return self._json
+
+    def rendered_html(self, renderer=None):
+        if self.html_text is None:
+            self.html_text = (renderer.render(self.content) if renderer and self.role == "assistant"
+                              else html.escape(self.content))
+        return self.html_text
+
+class MessageStore:
+    # История вкладки: реплики в порядке диалога для модели и те же записи пользователя в порядке ввода для стрелок
+    SYSTEM_MESSAGE = ChatMessage("system", SYSTEM_PROMPT, created=0.0)
+
+    def __init__(self):
+        self.messages = [self.SYSTEM_MESSAGE]
+        self.inputs = []
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __getitem__(self, index):
+        return self.messages[index]
+
+    def __iter__(self):
+        return iter(self.messages)
+
+    def append(self, message):
+        self.messages.append(message)
+        return message
+
+    def add_input(self, message):
+        self.inputs.append(message)
+        return message
+
+def encode_payload(payload):
+    # Реплики сериализуются один раз и кэшируются в записях; на каждый запрос собирается только обёртка
+    fields = json.dumps({key: value for key, value in payload.items() if key != "messages"})
+    messages = ", ".join(message.to_json() if isinstance(message, ChatMessage) else json.dumps(message, ensure_ascii=False)
+                         for message in payload["messages"])
+    return f'{{"messages": [{messages}]{", " + fields[1:-1] if fields != "{}" else ""}}}'.encode("utf-8")
+
+class ContextWindow:
+    def __init__(self, token_budget=CONTEXT_TOKEN_BUDGET, summarize=True):
+        self.token_budget = token_budget
+        self.summarize = summarize
+
+    def build(self, history):
+        system = [m for m in history[:1] if m.role == "system"]
+        turns = history[len(system):]
+        used = sum(m.tokens for m in system)
+        summary_budget = int(self.token_budget * CONTEXT_SUMMARY_SHARE) if self.summarize else 0
+        budget = self.token_budget - used - summary_budget
+        # Свежие реплики набираются с конца, последняя всегда попадает в запрос
+        start = len(turns)
+        while start > 0:
+            cost = turns[start - 1].tokens
+            if start < len(turns) and cost > budget:
+                break
+            budget -= cost
+            used += cost
+            start -= 1
+        while 0 < start < len(turns) - 1 and turns[start].role != "user":
+            used -= turns[start].tokens
+            start += 1
+        messages = system + turns[start:]
+        if start and self.summarize:
+            summary = self.summarize_turns(turns[:start], summary_budget)
+            if summary:
+                used += estimate_tokens(summary)
+                messages = system + [ChatMessage("system", summary)] + turns[start:]
+        return messages, used
+
+    def summarize_turns(self, turns, token_budget):
+        # Экстрактивная сводка без обращения к модели: начало каждой реплики, самые свежие в приоритете
+        lines = []
+        for message in reversed(turns):
+            text = " ".join(message.content.split())
+            if len(text) > CONTEXT_SUMMARY_LINE_CHARS:
+                text = text[:CONTEXT_SUMMARY_LINE_CHARS] + "…"
+            speaker = "Пользователь" if message.role == "user" else "Ассистент"
+            line = f"- {speaker}: {text}"
+            token_budget -= estimate_tokens(line)
+            if token_budget < 0:
+                break
+            lines.append(line)
+        if not lines:
+            return ""
+        lines.reverse()
+        return "Краткое содержание более ранней части разговора:\n" + "\n".join(lines)
+
+class MarkdownRenderer:
+    def __init__(self, cache_limit=MARKDOWN_CACHE_LIMIT):
+        self.cache_limit = cache_limit
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        # Конвертер Markdown создаётся один раз на поток и переиспользуется через reset()
+        self.local = threading.local()
+
+    def converter(self):
+        converter = getattr(self.local, "converter", None)
+        if converter is None:
+            import markdown
+            converter = self.local.converter = markdown.Markdown()
+        return converter
+
+    def render(self, text, cache=True):
+        text = text.replace("\\n", "<br>")
+        text = text.replace("\\t", "    ")
+        text = text.strip()
+        key = hashlib.sha1(text.encode("utf-8")).digest()
+        if cache:
+            with self.lock:
+                html_text = self.cache.get(key)
+                if html_text is not None:
+                    self.cache.move_to_end(key)
+                    return html_text
+        try:
+            html_text = self.converter().reset().convert(text)
+        except Exception as e:
+            logger.warning("Markdown conversion error: %s", e)
+            return text
+        if cache:
+            with self.lock:
+                self.cache[key] = html_text
+                while len(self.cache) > self.cache_limit:
+                    self.cache.popitem(last=False)
+        return html_text
+
+class StreamingMarkdown:
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self.text = ""
+        self.stable_end = 0
+        self.stable_html = []
+
+    def feed(self, chunk):
+        self.text += chunk
+        # Завершённые блоки (до пустой строки вне блока кода) рендерятся один раз, заново — только хвост
+        search_from = self.stable_end
+        while True:
+            boundary = self.text.find("\n\n", search_from)
+            if boundary < 0:
+                break
+            search_from = boundary + 2
+            block = self.text[self.stable_end:boundary]
+            if block.count("```") % 2:
+                continue
+            if block.strip():
+                self.stable_html.append(self.renderer.render(block))
+            self.stable_end = search_from
+        tail = self.text[self.stable_end:]
+        tail_html = self.renderer.render(tail, cache=False) if tail.strip() else ""
+        return "\n".join(self.stable_html + [tail_html])
+
+def normalize_question(text):
+    text = text.lower().replace("ё", "е")
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+def compact_model_name(text):
+    # «Radeon RX 7900 XTX», «rx7900xtx» и «7900-XTX» сводятся к одной записи
+    return "".join(normalize_question(text).split())
+
+def index_terms(text):
+    # Грубая основа слова для BM25: у длинных слов без цифр отбрасываются окончания
+    return [word if len(word) <= 6 or any(ch.isdigit() for ch in word) else word[:6]
+            for word in normalize_question(text).split()]
+
+def model_tokens(normalized):
+    # Слова с цифрами — модели и артикулы: 7800x3d и 7600x похожи по буквам, но это разные вопросы
+    return {word for word in normalized.split() if any(ch.isdigit() for ch in word)}
+
+class MinHasher:
+    PRIME = (1 << 61) - 1
+
+    def __init__(self, permutations=MINHASH_PERMUTATIONS, seed=7805):
+        # Фиксированное зерно: подписи, сохранённые на диске, остаются сравнимыми между запусками
+        state = seed
+        self.coefficients = []
+        for _ in range(permutations):
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            a = state % self.PRIME or 1
+            state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+            self.coefficients.append((a, state % self.PRIME))
+
+    def signature(self, text):
+        padded = f" {text} "
+        shingles = {zlib.crc32(padded[i:i + 3].encode("utf-8")) for i in range(max(1, len(padded) - 2))}
+        return array("Q", (min((a * h + b) % self.PRIME for h in shingles) for a, b in self.coefficients))
+
+    def similarity(self, first, second):
+        return sum(x == y for x, y in zip(first, second)) / len(first)
+
+    def bands(self, signature, band_count=MINHASH_BANDS):
+        rows = len(signature) // band_count
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(band_count)]
+
+class ResponseCache:
+    def __init__(self, path, ttl=RESPONSE_CACHE_TTL, max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+                 max_bytes=RESPONSE_CACHE_MAX_BYTES, fuzzy_threshold=RESPONSE_CACHE_FUZZY_THRESHOLD):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.fuzzy_threshold = fuzzy_threshold
+        self.hasher = MinHasher()
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                response TEXT NOT NULL,
+                signature BLOB,
+                latency REAL NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self.connection.commit()
+        # LSH-индекс по подписям вопросов без контекста строится при первом нечётком поиске
+        self.buckets = None
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def make_key(self, question, context):
+        return hashlib.sha256(f"{normalize_question(question)}\0{context}".encode("utf-8")).hexdigest()
+
+    def get(self, question, context=""):
+        now = time.time()
+        key = self.make_key(question, context)
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT response, latency FROM responses WHERE key = ? AND created > ?", (key, now - self.ttl)).fetchone()
+            match = "exact" if row else None
+            if row is None and not context and self.fuzzy_threshold:
+                key, row = self.find_similar(normalize_question(question), now)
+                match = "fuzzy" if row else None
+            if row is None:
+                self.misses += 1
+                return None
+            self.connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.connection.commit()
+            self.hits += 1
+            self.fuzzy_hits += match == "fuzzy"
+            self.saved_seconds += row[1]
+        return row[0], match
+
+    def find_similar(self, normalized, now):
+        if self.buckets is None:
+            self.buckets = {}
+            for key, signature in self.connection.execute("SELECT key, signature FROM responses WHERE signature IS NOT NULL"):
+                self.index_signature(key, array("Q", signature))
+        signature = self.hasher.signature(normalized)
+        numbers = model_tokens(normalized)
+        candidates = set()
+        for band in self.hasher.bands(signature):
+            candidates.update(self.buckets.get(band, ()))
+        best_key, best_score = None, self.fuzzy_threshold
+        for key in candidates:
+            row = self.connection.execute("SELECT signature, question FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None or model_tokens(normalize_question(row[1])) != numbers:
+                continue
+            score = self.hasher.similarity(signature, array("Q", row[0]))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None, None
+        row = self.connection.execute(
+            "SELECT response, latency FROM responses WHERE key = ? AND created > ?", (best_key, now - self.ttl)).fetchone()
+        return best_key, row
+
+    def index_signature(self, key, signature):
+        for band in self.hasher.bands(signature):
+            self.buckets.setdefault(band, set()).add(key)
+
+    def put(self, question, context, response, latency):
+        now = time.time()
+        key = self.make_key(question, context)
+        signature = None if context else self.hasher.signature(normalize_question(question))
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, question, response, signature.tobytes() if signature else None, latency, now, now))
+            if signature and self.buckets is not None:
+                self.index_signature(key, signature)
+            self.evict(now)
+            self.connection.commit()
+
+    def evict(self, now):
+        # Сначала устаревшие записи, затем давно не запрошенные — пока не уложимся в лимиты
+        self.connection.execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl,))
+        count, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(response)), 0) FROM responses").fetchone()
+        while count > self.max_entries or (size > self.max_bytes and count > 1):
+            key, length = self.connection.execute("SELECT key, LENGTH(response) FROM responses ORDER BY accessed LIMIT 1").fetchone()
+            self.connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            count -= 1
+            size -= length
+        if self.buckets is not None and count < sum(len(keys) for keys in self.buckets.values()) // MINHASH_BANDS:
+            self.buckets = None
+
+    def stats_text(self):
+        total = self.hits + self.misses
+        rate = 100 * self.hits / total if total else 0
+        return f"Кэш: {self.hits}/{total} ({rate:.0f}%), сэкономлено {self.saved_seconds:.1f} с"
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+class KnowledgeBase:
+    # Справочник характеристик из корпуса рядом с программой. Точные вопросы о характеристиках одной модели
+    # отвечаются сразу; для остальных находятся подходящие фрагменты (BM25 + векторная близость) для запроса
+    FIELD_PATTERNS = {
+        "cores": re.compile(r"ядер|ядра|ядро|поток|core|thread"),
+        "clock": re.compile(r"частот|ггц|ghz|мгц|mhz|clock|boost|буст"),
+        "power": re.compile(r"tdp|теплов|энергопотреб|потребля|ватт|мощност|power"),
+        "socket": re.compile(r"сокет|socket|разъ[её]м"),
+        "memory": re.compile(r"vram|видеопамят|памят|gddr|шин"),
+        "cache": re.compile(r"кэш|кеш|cache"),
+        "units": re.compile(r"вычислительн|compute|\bcu\b"),
+        "architecture": re.compile(r"архитектур|поколени|architecture"),
+        "year": re.compile(r"вышел|вышла|выпуск|релиз|release"),
+    }
+    SUMMARY_PATTERN = re.compile(r"характеристик|спецификац|параметр|specs?\b")
+    # Слова, которые могут стоять в вопросе о характеристике помимо модели и самой характеристики.
+    # Всё остальное («почему», «как», «снизить», «bios», «нужен») — повод отдать вопрос модели
+    LOOKUP_WORDS = re.compile(
+        r"(?:сколько|как(?:ой|ая|ое|ие|ую|ов|ова|ово|овы|им|ом|ого)|what|which|how|many|much|"
+        r"у|в|на|для|и|с|а|это|есть|же|вообще|скажи\w*|подскаж\w*|напомни\w*|пожалуйста|"
+        r"is|are|does|do|has|have|the|a|an|of|in|for|on|it|its|please|tell|me|"
+        r"amd|ryzen|radeon|rx|threadripper|процессор\w*|видеокарт\w*|цп|cpu|gpu|чип\w*|модел\w*|"
+        r"максимальн\w*|базов\w*|макс|max|base|объ[её]м\w*|размер\w*|количеств\w*|числ\w*|тип\w*|"
+        r"l1|l2|l3|size|amount|number|count|total|все|всего)")
+    INDEX_FILES = ("vectors", "doc_lengths", "term_offsets", "postings", "frequencies", "idf")
+
+    def __init__(self, corpus_path=KNOWLEDGE_CORPUS_PATH, index_dir=KNOWLEDGE_INDEX_DIR, top_k=KNOWLEDGE_TOP_K,
+                 min_score=KNOWLEDGE_MIN_SCORE, dims=KNOWLEDGE_EMBEDDING_DIM):
+        self.corpus_path = corpus_path
+        self.index_dir = index_dir
+        self.top_k = top_k
+        self.min_score = min_score
+        self.dims = dims
+        # Отдельные блокировки: точный ответ не ждёт, пока в фоне импортируется NumPy и строится индекс
+        self.lock = threading.Lock()
+        self.index_lock = threading.Lock()
+        self.loaded = False
+        self.index_loaded = False
+        self.corpus_hash = None
+        self.products = []
+        self.documents = []
+        self.aliases = {}
+        self.index = None
+
+    def warm_up(self):
+        self.load()
+        self.load_index()
+
+    def load(self):
+        # Корпус нужен для точных ответов и читается без NumPy; повторные вызовы ничего не делают
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            started = time.perf_counter()
+            try:
+                with open(self.corpus_path, "rb") as f:
+                    raw = f.read()
+                corpus = json.loads(raw)
+            except (OSError, ValueError) as e:
+                logger.warning("Knowledge corpus unavailable: %s", e)
+                return
+            self.corpus_hash = hashlib.sha256(raw).hexdigest()
+            self.products = corpus.get("products", [])
+            for product in self.products:
+                words = product["name"].split()
+                for start in range(len(words)):
+                    alias = compact_model_name(" ".join(words[start:]))
+                    if any(ch.isdigit() for ch in alias):
+                        # «7600» — это и Ryzen 5 7600, и Radeon RX 7600: под одним названием может быть несколько моделей
+                        self.aliases.setdefault(alias, []).append(product)
+            self.documents = [self.describe(product) for product in self.products]
+            self.documents += [f"{note['title']}: {note['text']}" for note in corpus.get("notes", [])]
+            logger.info("Knowledge base: %d products, %d documents in %.1f ms", len(self.products), len(self.documents),
+                        (time.perf_counter() - started) * 1000)
+
+    def load_index(self):
+        self.load()
+        with self.index_lock:
+            if self.index_loaded or not self.documents:
+                return
+            self.index_loaded = True
+            try:
+                self.index = self.open_index(self.corpus_hash)
+            except ImportError:
+                logger.info("NumPy is not installed, knowledge snippets disabled")
+            except (OSError, ValueError) as e:
+                logger.warning("Knowledge index disabled: %s", e)
+
+    def open_index(self, corpus_hash):
+        # Индекс лежит в папке данных отдельными .npy и открывается через mmap; пересобирается при смене корпуса
+        import numpy as np
+        meta_path = os.path.join(self.index_dir, "meta.json")
+        meta = None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if not meta or meta.get("corpus") != corpus_hash or meta.get("version") != KNOWLEDGE_INDEX_VERSION or meta.get("dims") != self.dims:
+            meta = self.build_index(np, corpus_hash, meta_path)
+        index = {name: np.load(os.path.join(self.index_dir, f"{name}.npy"), mmap_mode="r") for name in self.INDEX_FILES}
+        index["vocabulary"] = meta["vocabulary"]
+        index["average_length"] = meta["average_length"]
+        return index
+
+    def build_index(self, np, corpus_hash, meta_path):
+        started = time.perf_counter()
+        os.makedirs(self.index_dir, exist_ok=True)
+        vocabulary = {}
+        postings = {}
+        lengths = []
+        for doc_id, text in enumerate(self.documents):
+            terms = index_terms(text)
+            lengths.append(len(terms))
+            for term in terms:
+                counts = postings.setdefault(vocabulary.setdefault(term, len(vocabulary)), {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+        offsets = [0]
+        docs = []
+        frequencies = []
+        for term_id in range(len(vocabulary)):
+            for doc_id, count in sorted(postings[term_id].items()):
+                docs.append(doc_id)
+                frequencies.append(count)
+            offsets.append(len(docs))
+        offsets = np.array(offsets, dtype=np.int64)
+        document_frequency = np.diff(offsets).astype(np.float32)
+        count = len(self.documents)
+        arrays = {
+            "vectors": np.stack([self.embed(np, text) for text in self.documents]) if self.documents
+                       else np.zeros((0, self.dims), dtype=np.float32),
+            "doc_lengths": np.array(lengths, dtype=np.float32),
+            "term_offsets": offsets,
+            "postings": np.array(docs, dtype=np.int32),
+            "frequencies": np.array(frequencies, dtype=np.float32),
+            "idf": np.log(1 + (count - document_frequency + 0.5) / (document_frequency + 0.5)).astype(np.float32),
+        }
+        for name, values in arrays.items():
+            np.save(os.path.join(self.index_dir, f"{name}.npy"), values)
+        # meta.json пишется последним: без него частично записанный индекс считается отсутствующим
+        meta = {"version": KNOWLEDGE_INDEX_VERSION, "corpus": corpus_hash, "dims": self.dims, "vocabulary": vocabulary,
+                "average_length": sum(lengths) / max(1, count)}
+        temp_path = meta_path + ".part"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(temp_path, meta_path)
+        logger.info("Knowledge index built: %d documents, %d terms in %.1f ms", count, len(vocabulary),
+                    (time.perf_counter() - started) * 1000)
+        return meta
+
+    def embed(self, np, text):
+        # Хэшированные слова и триграммы символов: без модели эмбеддингов, устойчиво к окончаниям слов
+        vector = np.zeros(self.dims, dtype=np.float32)
+        for word in normalize_question(text).split():
+            padded = f" {word} "
+            for feature in [word] + [padded[i:i + 3] for i in range(len(padded) - 2)]:
+                digest = zlib.crc32(feature.encode("utf-8"))
+                vector[digest % self.dims] += -1.0 if digest & 0x80000000 else 1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def product_kinds(words):
+        if "radeon" in words or "rx" in words:
+            return {"gpu"}
+        if "ryzen" in words or "threadripper" in words:
+            return {"cpu"}
+        return {"cpu", "gpu"}
+
+    def product_mentions(self, words, kinds):
+        # Самое длинное совпадение с названием модели в каждой позиции: «7900 XTX» не путается с «7900».
+        # Для каждого совпадения — (начало, конец, подходящие модели)
+        position = 0
+        while position < len(words):
+            for end in range(min(len(words), position + 4), position, -1):
+                candidates = [product for product in self.aliases.get("".join(words[position:end]), ())
+                              if product["kind"] in kinds]
+                if candidates:
+                    yield position, end, candidates
+                    position = end
+                    break
+            else:
+                position += 1
+
+    def find_products(self, question):
+        words = normalize_question(question).split()
+        found = []
+        for _, _, candidates in self.product_mentions(words, self.product_kinds(words)):
+            if candidates[0] not in found:
+                found.append(candidates[0])
+        return found
+
+    def lookup(self, question):
+        # Локальный ответ — только на явный вопрос о характеристике одной модели, где нет ничего, кроме модели,
+        # характеристики и служебных слов. Советы, диагностика и неоднозначные названия уходят модели
+        self.load()
+        if len(question.split()) > KNOWLEDGE_LOOKUP_MAX_WORDS:
+            return None
+        words = normalize_question(question).split()
+        products = []
+        covered = set()
+        for start, end, candidates in self.product_mentions(words, {"cpu", "gpu"}):
+            if len(candidates) > 1:
+                # Голый номер решается только словом прямо перед ним: «radeon 7600», но не «у меня 7600 и rx 7600»
+                kinds = self.product_kinds(words[start - 1:start])
+                candidates = [product for product in candidates if product["kind"] in kinds]
+                if len(candidates) != 1:
+                    return None
+            if candidates[0] not in products:
+                products.append(candidates[0])
+            covered.update(range(start, end))
+        if len(products) != 1:
+            return None
+        for position, word in enumerate(words):
+            if position in covered or self.LOOKUP_WORDS.fullmatch(word) or self.SUMMARY_PATTERN.search(word):
+                continue
+            if not any(pattern.search(word) for pattern in self.FIELD_PATTERNS.values()):
+                return None
+        product = products[0]
+        text = " ".join(words)
+        fields = [field for field, pattern in self.FIELD_PATTERNS.items() if pattern.search(text)]
+        if not fields and self.SUMMARY_PATTERN.search(text):
+            return f"{self.describe(product)}\n\n_Данные из локального справочника характеристик._"
+        facts = [self.describe_field(product, field) for field in fields]
+        if not facts or None in facts:
+            # Характеристики нет в справочнике — пусть отвечает модель
+            return None
+        return f"**AMD {product['name']}**: {', '.join(facts)}.\n\n_Данные из локального справочника характеристик._"
+
+    def search(self, question):
+        self.load_index()
+        index = self.index
+        if index is None or not self.documents:
+            return []
+        import numpy as np
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        k1, b = BM25_K1, BM25_B
+        for term in set(index_terms(question)):
+            term_id = index["vocabulary"].get(term)
+            if term_id is None:
+                continue
+            start, end = index["term_offsets"][term_id], index["term_offsets"][term_id + 1]
+            docs = index["postings"][start:end]
+            frequency = index["frequencies"][start:end]
+            norm = k1 * (1 - b + b * index["doc_lengths"][docs] / index["average_length"])
+            scores[docs] += index["idf"][term_id] * frequency * (k1 + 1) / (frequency + norm)
+        if scores.max() > 0:
+            scores /= scores.max()
+        combined = KNOWLEDGE_BM25_WEIGHT * scores + (1 - KNOWLEDGE_BM25_WEIGHT) * (index["vectors"] @ self.embed(np, question))
+        for product in self.find_products(question):
+            # Карточки названных в вопросе моделей идут первыми
+            combined[self.products.index(product)] = 1.0
+        best = np.argsort(-combined)[:self.top_k]
+        return [(float(combined[i]), self.documents[i]) for i in best if combined[i] >= self.min_score]
+
+    def describe(self, product):
+        fields = ("cores", "clock", "power", "socket", "cache") if product["kind"] == "cpu" else ("units", "clock", "memory", "power")
+        facts = [fact for fact in (self.describe_field(product, field) for field in fields) if fact]
+        if product.get("graphics"):
+            facts.append(f"встроенная графика {product['graphics']}")
+        if product.get("notes"):
+            facts.append(product["notes"])
+        return f"AMD {product['name']} — {product['segment']} ({product['architecture']}, {product['year']}): {', '.join(facts)}."
+
+    @staticmethod
+    def describe_field(product, field):
+        number = lambda value: f"{value:g}".replace(".", ",")
+        cpu = product["kind"] == "cpu"
+        if field == "cores":
+            return f"ядер/потоков: {product['cores']}/{product['threads']}" if cpu else None
+        if field == "clock":
+            if cpu:
+                return f"базовая частота {number(product['base_clock_ghz'])} ГГц, до {number(product['boost_clock_ghz'])} ГГц в бусте"
+            return f"частота до {product['boost_clock_mhz']} МГц"
+        if field == "power":
+            return f"TDP {product['tdp_w']} Вт" if cpu else f"мощность платы {product['board_power_w']} Вт"
+        if field == "socket":
+            return f"сокет {product['socket']}" if cpu else None
+        if field == "memory":
+            return None if cpu else f"{product['vram_gb']} ГБ {product['memory_type']}, шина {product['memory_bus_bits']} бит"
+        if field == "cache":
+            return f"кэш L3 {product['l3_cache_mb']} МБ" if cpu else None
+        if field == "units":
+            return None if cpu else f"вычислительных блоков (CU): {product['compute_units']}"
+        if field == "architecture":
+            return f"архитектура {product['architecture']}"
+        if field == "year":
+            return f"выпуск {product['year']} г."
+        return None
+
+class ConversationStore:
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA busy_timeout=5000")
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                html TEXT NOT NULL,
+                created REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS messages_by_session ON messages (session_id, id);
+            CREATE TABLE IF NOT EXISTS message_ids (
+                next_id INTEGER NOT NULL
+            );
+        """)
+        self.create_search_index()
+        self.connection.commit()
+        # id сообщений выдаются сразу при постановке в очередь, чтобы интерфейс мог сослаться на строку до записи.
+        # Блоки id резервируются в базе, поэтому два процесса на одном файле (окно и шлюз) не выдают одинаковые id
+        self.id_lock = threading.Lock()
+        self.id_connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.id_connection.execute("PRAGMA busy_timeout=5000")
+        self.next_message_id = self.end_message_id = 0
+        # Запись идёт в отдельном потоке со своим соединением: интерфейс только кладёт реплику в очередь
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(target=self._writer, args=(path,), daemon=True)
+        self.writer.start()
+
+    def create_search_index(self):
+        # Внешнее FTS5-содержимое поверх messages, обновляется триггером на каждую вставку.
+        # Проверка и создание под блокировкой записи: окно и шлюз могут открыть новый файл одновременно
+        self.connection.execute("BEGIN IMMEDIATE")
+        exists =self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'messages_fts'").fetchone()
+        if not exists:
+            try:
+                self.connection.execute(
+                    "CREATE VIRTUAL TABLE messages_fts USING fts5(content, content='messages', content_rowid='id', tokenize='trigram')")
+            except sqlite3.OperationalError:
+                self.connection.execute(
+                    "CREATE VIRTUAL TABLE messages_fts USING fts5(content, content='messages', content_rowid='id')")
+            self.connection.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+        self.connection.execute("""
+            CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                INSERT INTO messages_fts (rowid, content) VALUES (new.id, new.content);
+            END
+        """)
+        sql = self.connection.execute("SELECT sql FROM sqlite_master WHERE name = 'messages_fts'").fetchone()[0]
+        self.search_trigram = "trigram" in sql
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        words = query.split()
+        if self.search_trigram:
+            # Триграммы находят подстроки, но только от трёх символов
+            terms = ['"' + word.replace('"', '""') + '"' for word in words if len(word) >= 3]
+        else:
+            terms = ['"' + word.replace('"', '""') + '"*' for word in words]
+        if not terms:
+            return []
+        return self.connection.execute("""
+            SELECT m.id, m.session_id, m.role, snippet(messages_fts, 0, '«', '»', '…', 48)
+            FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid
+            WHERE messages_fts MATCH ?
+            ORDER BY messages_fts.rowid DESC
+            LIMIT ?
+        """, (" ".join(terms), limit)).fetchall()
+
+    def create_session(self):
+        # Через соединение счётчика id: оно не привязано к потоку, поэтому шлюз вызывает это вне цикла asyncio
+        with self.id_lock:
+            return self.id_connection.execute("INSERT INTO sessions (created) VALUES (?)", (time.time(),)).lastrowid
+
+    def latest_session(self):
+        row = self.connection.execute("SELECT id FROM sessions ORDER BY id DESC LIMIT 1").fetchone()
+        return row[0] if row else None
+
+    def reserve_message_ids(self, count=MESSAGE_ID_BLOCK):
+        # BEGIN IMMEDIATE берёт блокировку записи: чтение и сдвиг счётчика атомарны для всех процессов
+        self.id_connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.id_connection.execute("SELECT next_id FROM message_ids").fetchone()
+            # MAX(id) учитывает строки, записанные до появления счётчика
+            start = self.id_connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM messages").fetchone()[0]
+            if row is None:
+                self.id_connection.execute("INSERT INTO message_ids (next_id) VALUES (?)", (start + count,))
+            else:
+                start = max(start, row[0])
+                self.id_connection.execute("UPDATE message_ids SET next_id = ?", (start + count,))
+            self.id_connection.execute("COMMIT")
+        except sqlite3.Error:
+            self.id_connection.execute("ROLLBACK")
+            raise
+        self.next_message_id, self.end_message_id = start, start + count
+
+    def append(self, session_id, role, content, html_text):
+        with self.id_lock:
+            if self.next_message_id >= self.end_message_id:
+                try:
+                    self.reserve_message_ids()
+                except sqlite3.Error as e:
+                    logger.error("Message id reservation failed: %s", e)
+                    return None
+            message_id = self.next_message_id
+            self.next_message_id += 1
+        self.queue.put((message_id, session_id, role, content, html_text, time.time()))
+        return message_id
+
+    def load_page(self, session_id, before_id=None, limit=HISTORY_PAGE_SIZE):
+        # Чтение по индексу (session_id, id) с LIMIT: время не зависит от длины истории
+        if before_id is None:
+            rows = self.connection.execute(
+                "SELECT id, role, content, html, created FROM messages WHERE session_id = ? ORDER BY id DESC LIMIT ?",
+                (session_id, limit)).fetchall()
+        else:
+            rows = self.connection.execute(
+                "SELECT id, role, content, html, created FROM messages WHERE session_id = ? AND id < ? ORDER BY id DESC LIMIT ?",
+                (session_id, before_id, limit)).fetchall()
+        rows.reverse()
+        return rows
+
+    def load_range(self, session_id, from_id, before_id):
+        return self.connection.execute(
+            "SELECT id, role, content, html, created FROM messages WHERE session_id = ? AND id >= ? AND id < ? ORDER BY id",
+            (session_id, from_id, before_id)).fetchall()
+
+    def flush(self):
+        # Ждёт, пока писатель сохранит всё, что было поставлено в очередь до вызова
+        done = threading.Event()
+        self.queue.put(done)
+        while not done.wait(0.1):
+            if not self.writer.is_alive():
+                return
+
+    def open_export(self, session_id, batch_size=EXPORT_BATCH_SIZE):
+        # Вызывается в потоке экспорта: своё соединение и чтение порциями по индексу, вся сессия в память не грузится
+        self.flush()
+        connection = sqlite3.connect(self.path)
+        total = connection.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)).fetchone()[0]
+
+        def rows():
+            last_id = 0
+            try:
+                while True:
+                    batch = connection.execute(
+                        "SELECT id, role, content, html, created FROM messages WHERE session_id = ? AND id > ? ORDER BY id LIMIT ?",
+                        (session_id, last_id, batch_size)).fetchall()
+                    if not batch:
+                        return
+                    last_id = batch[-1][0]
+                    for _, role, content, html_text, created in batch:
+                        yield role, content, html_text, created
+            finally:
+                connection.close()
+
+        return total, rows()
+
+    def close(self):
+        self.queue.put(None)
+        self.writer.join(timeout=5)
+        self.id_connection.close()
+        self.connection.close()
+
+    def _writer(self, path):
+        connection = sqlite3.connect(path)
+        connection.execute("PRAGMA busy_timeout=5000")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+            flushed = [item for item in batch if isinstance(item, threading.Event)]
+            batch = [item for item in batch if isinstance(item, tuple)]
+            if batch:
+                try:
+                    connection.executemany(
+                        "INSERT INTO messages (id, session_id, role, content, html, created) VALUES (?, ?, ?, ?, ?, ?)", batch)
+                    connection.commit()
+                except sqlite3.Error as e:
+                    logger.error("Conversation store write failed: %s", e)
+            for done in flushed:
+                done.set()
+        connection.close()
+
+class ChatExporter:
+    FORMATS = {".jsonl": "jsonl", ".md": "markdown", ".html": "html"}
+    ROLE_TITLES = {"user": "Вы", "assistant": "Чат-бот"}
+
+    def __init__(self, source, path, renderer=None, on_progress=None, on_finished=None, batch_size=EXPORT_BATCH_SIZE):
+        # source вызывается уже в потоке экспорта и возвращает (число сообщений, итератор строк)
+        self.source = source
+        self.path = path
+        self.format = self.FORMATS.get(os.path.splitext(path)[1].lower(), "markdown")
+        self.renderer = renderer
+        self.on_progress = on_progress
+        self.on_finished = on_finished
+        self.batch_size = batch_size
+        self.cancel_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="chat-export", daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def run(self):
+        error = ""
+        rows = None
+        temp_path = None
+        try:
+            total, rows = self.source()
+            # Запись во временный файл рядом с целевым: до переименования целевой файл не меняется
+            descriptor, temp_path = tempfile.mkstemp(prefix=".export-", suffix=".part",
+                                                     dir=os.path.dirname(os.path.abspath(self.path)))
+            with open(descriptor, "w", encoding="utf-8", newline="\n") as f:
+                f.write(self.header())
+                chunk = []
+                done = 0
+                for row in rows:
+                    chunk.append(self.format_row(*row))
+                    done += 1
+                    if len(chunk) == self.batch_size:
+                        if self.cancelled:
+                            break
+                        f.write("".join(chunk))
+                        chunk = []
+                        if self.on_progress:
+                            self.on_progress(done, total)
+                if not self.cancelled:
+                    f.write("".join(chunk))
+                    f.write(self.footer())
+                    f.flush()
+                    os.fsync(f.fileno())
+            if not self.cancelled:
+                os.replace(temp_path, self.path)
+                if self.on_progress:
+                    self.on_progress(done, total)
+        except Exception as e:
+            logger.warning("Chat export to %s failed: %s", self.path, e)
+            error = str(e)
+        finally:
+            if rows is not None and hasattr(rows, "close"):
+                rows.close()
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+        if self.on_finished:
+            self.on_finished(self.path, error)
+
+    def header(self):
+        if self.format == "html":
+            return EXPORT_HTML_HEADER
+        if self.format == "markdown":
+            return "# Чат с поддержкой AMD\n\n"
+        return ""
+
+    def footer(self):
+        return "</body>\n</html>\n" if self.format == "html" else ""
+
+    def format_row(self, role, content, html_text, created):
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created)) if created else ""
+        if self.format == "jsonl":
+            return json.dumps({"role": role, "content": content, "created": stamp or None}, ensure_ascii=False) + "\n"
+        title = self.ROLE_TITLES.get(role, role)
+        if self.format == "markdown":
+            return f"### {title}{' · ' + stamp if stamp else ''}\n\n{content}\n\n"
+        if html_text is None:
+            # Реплики без сохранённого HTML (хранилище недоступно) рендерятся здесь же, в потоке экспорта
+            html_text = self.renderer.render(content) if role == "assistant" and self.renderer else html.escape(content)
+        return (f'<section class="{html.escape(role)}"><div class="meta">{title}{" · " + stamp if stamp else ""}</div>\n'
+                f'{html_text}\n</section>\n')
+
+class RequestMetricsLog:
+    FIELDS = ("time", "model", "status", "reused", "dns_ms", "connect_ms", "ttfb_ms", "first_token_ms", "total_ms",
+              "request_bytes", "response_bytes", "prompt_tokens", "completion_tokens", "tokens_per_s", "markdown_ms",
+              "gui_ms", "rate_wait_ms", "error")
+
+    def __init__(self, limit=REQUEST_METRICS_LIMIT):
+        self.records = deque(maxlen=limit)
+
+    @classmethod
+    def new_record(cls, **values):
+        record = dict.fromkeys(cls.FIELDS)
+        record["time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        record.update(values)
+        return record
+
+    def add(self, record):
+        self.records.append(record)
+
+    def models(self):
+        return sorted({record["model"] for record in self.records if record.get("model")})
+
+    def select(self, model=None):
+        return [record for record in self.records if model is None or record.get("model") == model]
+
+    @staticmethod
+    def percentiles(records, field, points=(50, 95, 99)):
+        values = sorted(record[field] for record in records if record.get(field) is not None)
+        if not values:
+            return None
+        # Ранговый процентиль: значение, не превышенное p% запросов
+        return [values[max(0, math.ceil(point / 100 * len(values)) - 1)] for point in points]
+
+    @staticmethod
+    def histogram(records, field="total_ms", buckets=LATENCY_BUCKETS_MS):
+        counts = [0] * (len(buckets) + 1)
+        for record in records:
+            value = record.get(field)
+            if value is not None:
+                counts[next((i for i, bound in enumerate(buckets) if value < bound), len(buckets))] += 1
+        return counts
+
+    def export(self, path):
+        # Формат определяется расширением; запись через временный файл, чтобы не оставить обрезанный отчёт
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            if path.lower().endswith(".json"):
+                json.dump(list(self.records), f, ensure_ascii=False, indent=1)
+            else:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(self.records)
+        os.replace(temp_path, path)
+
+class RequestScheduler:
+    def __init__(self, loop_thread, max_workers=REQUEST_WORKERS, max_pending=REQUEST_QUEUE_LIMIT, on_saturation_changed=None):
+        self.loop_thread = loop_thread
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.on_saturation_changed = on_saturation_changed
+        # Счётчик очереди читается окном синхронно, остальное состояние живёт только в цикле asyncio
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.saturated = False
+        self.closed = False
+        # Очередь задач на каждый разговор: задачи одного разговора выполняются строго по порядку
+        self.queues = {}
+        self.runners = {}
+        self.slots = None
+
+    def submit(self, key, fn, *args):
+        with self.lock:
+            if self.closed or self.pending >= self.max_pending:
+                return False
+            self.pending += 1
+            self._update_saturation()
+        self.loop_thread.call_soon(self._enqueue, key, fn, args)
+        return True
+
+    def cancel(self, key):
+        # Сбрасывает очередь разговора и отменяет его текущую корутину вместе с открытым ответом
+        self.loop_thread.call_soon(self._cancel, key)
+
+    def cancel_all(self):
+        self.loop_thread.call_soon(self._cancel_all)
+
+    def shutdown(self):
+        with self.lock:
+            self.closed = True
+        self.cancel_all()
+
+    def _update_saturation(self):
+        saturated = self.pending >= self.max_pending
+        if saturated != self.saturated:
+            self.saturated = saturated
+            if self.on_saturation_changed:
+                self.on_saturation_changed(saturated)
+
+    def _task_done(self, count=1):
+        with self.lock:
+            self.pending -= count
+            self._update_saturation()
+
+    def _enqueue(self, key, fn, args):
+        import asyncio
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.max_workers)
+        self.queues.setdefault(key, deque()).append((fn, args))
+        if key not in self.runners:
+            self.runners[key] = asyncio.ensure_future(self._run(key))
+
+    def _cancel(self, key):
+        dropped = self.queues.pop(key, None)
+        if dropped:
+            self._task_done(len(dropped))
+            dropped.clear()
+        runner = self.runners.pop(key, None)
+        if runner is not None:
+            runner.cancel()
+
+    def _cancel_all(self):
+        for key in list(self.runners):
+            self._cancel(key)
+
+    async def _run(self, key):
+        import asyncio
+        tasks = self.queues[key]
+        try:
+            while tasks:
+                fn, args = tasks.popleft()
+                try:
+                    async with self.slots:
+                        await fn(*args)
+                except Exception as e:
+                    logger.exception("Request task failed: %s", e)
+                finally:
+                    self._task_done()
+        finally:
+            if self.runners.get(key) is asyncio.current_task():
+                del self.runners[key]
+                self.queues.pop(key, None)
+
+class RateLimiter:
+    # Token bucket на запросы к модели: не больше rate запусков в секунду, всплеск до burst.
+    # Ответы из кэша и справочника его не расходуют
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = None
+
+    async def acquire(self):
+        import asyncio
+        if not self.rate:
+            return 0.0
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        # Ожидающие стоят в очереди на блокировке, поэтому время считается вместе с ней
+        started = time.monotonic()
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - started
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class ResponseListener:
+    # События одного ответа; окно, пакетный режим и шлюз переопределяют нужные
+    def status(self, text):
+        pass
+
+    def cache_stats(self, text):
+        pass
+
+    def started(self):
+        pass
+
+    def chunk(self, snapshot, text):
+        # snapshot — то, что показывать (HTML, если бэкенд рендерит), text — весь сырой текст ответа на этот момент
+        pass
+
+    def finished(self, text, html_text, store_id):
+        pass
+
+    def failed(self, error):
+        pass
+
+    def metrics(self, record):
+        pass
+
+class ChatBackend:
+    # Всё, что нужно для ответа, без Qt: клиент OpenRouter с политикой повторов, окно контекста, справочник,
+    # кэш ответов и хранилище разговоров. Корутины выполняются в цикле asyncio вызывающей стороны
+    def __init__(self, data_dir=APP_DATA_DIR, use_cache=True, use_store=True, use_knowledge=True, render_html=True,
+                 rate_limiter=None, client=None):
+        self.api_client = client or OpenRouterClient()
+        self.request_policy = RequestPolicy(self.api_client)
+        self.context_window = ContextWindow()
+        self.markdown_renderer = MarkdownRenderer()
+        self.render_html = render_html
+        self.rate_limiter = rate_limiter
+        self.knowledge = KnowledgeBase() if use_knowledge else None
+        if self.knowledge:
+            # Корпус и индекс читаются в фоне, чтобы первый вопрос не ждал импорта NumPy
+            threading.Thread(target=self.knowledge.warm_up, name="knowledge-index", daemon=True).start()
+        self.response_cache = None
+        self.conversation_store = None
+        if use_cache:
+            try:
+                os.makedirs(data_dir, exist_ok=True)
+                self.response_cache = ResponseCache(os.path.join(data_dir, "response_cache.sqlite3"))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Response cache disabled: %s", e)
+        if use_store:
+            try:
+                os.makedirs(data_dir, exist_ok=True)
+                self.conversation_store = ConversationStore(os.path.join(data_dir, "conversations.sqlite3"))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Conversation store disabled: %s", e)
+
+    async def warm_up(self):
+        await self.api_client.warm_up()
+
+    async def close(self):
+        await self.api_client.close()
+
+    def close_storage(self):
+        if self.response_cache:
+            self.response_cache.close()
+        if self.conversation_store:
+            self.conversation_store.close()
+
+    def format_response(self, text):
+        return self.markdown_renderer.render(text)
+
+    def store_message(self, session_id, role, content, html_text):
+        # Ответ пишется в ту сессию, которая была текущей при отправке вопроса, даже если чат уже очищен
+        if self.conversation_store and session_id is not None:
+            return self.conversation_store.append(session_id, role, content, html_text)
+        return None
+
+    async def read_stream(self, lines, usage, metrics=None):
+        # Разбор server-sent events: строки "data: {...}", комментарии ":" и финальный "[DONE]"
+        done = False
+        async for raw_line in lines:
+            if metrics is not None:
+                metrics["response_bytes"] += len(raw_line) + 1
+            # После "[DONE]" поток дочитывается до конца, чтобы соединение вернулось в пул
+            if done or not raw_line.startswith(b"data:"):
+                continue
+            payload = raw_line[5:].strip()
+            if payload == b"[DONE]":
+                done = True
+                continue
+            chunk = json.loads(payload.decode("utf-8"))
+            if "error" in chunk:
+                raise RuntimeError(chunk["error"].get("message", str(chunk["error"])))
+            if chunk.get("usage"):
+                usage.update(chunk["usage"])
+            choices = chunk.get("choices") or []
+            if not choices:
+                continue
+            delta = choices[0].get("delta") or {}
+            yield delta.get("content") or "", delta.get("reasoning") or ""
+
+    async def finish_local_answer(self, history, session_id, bot_response, status, request_started_at, status_text, listener):
+        # Ответ без обращения к модели (кэш или справочник) проходит тот же путь, что и законченный стрим
+        import asyncio
+        render_started = time.perf_counter()
+        formatted_response = self.format_response(bot_response) if self.render_html else None
+        markdown_ms = (time.perf_counter() - render_started) * 1000
+        # Запись в SQLite (и резервирование id под блокировкой базы) — не в цикле asyncio, где идут другие ответы
+        store_id = await asyncio.to_thread(self.store_message, session_id, "assistant", bot_response, formatted_response)
+        history.append(ChatMessage("assistant", bot_response, store_id, html_text=formatted_response))
+        listener.started()
+        listener.finished(bot_response, formatted_response, store_id)
+        record = RequestMetricsLog.new_record(status=status, total_ms=round((time.perf_counter() - request_started_at) * 1000, 2),
+                                              markdown_ms=round(markdown_ms, 2))
+        listener.metrics(record)
+        listener.status(status_text)
+        return record
+
+    async def respond(self, history, record, session_id=None, listener=None):
+        # Вопрос добавляется в историю здесь, а не при отправке: вопросы одного разговора идут по очереди,
+        # и ответ на предыдущий уже лежит в истории. Возвращает запись метрик ответа
+        import asyncio
+        listener = listener or ResponseListener()
+        message = history.append(record).content
+        request_started_at = time.perf_counter()
+        # Подробности запроса пишутся только в DEBUG и с выборкой — без сериализации всей истории
+        verbose = debug_sampler.sample()
+        if verbose:
+            logger.debug("Conversation history: %s", Preview(history))
+        local_answer = await asyncio.to_thread(self.knowledge.lookup, message) if self.knowledge else None
+        if local_answer:
+            return await self.finish_local_answer(history, session_id, local_answer, "local", request_started_at,
+                                            "Ответ из локального справочника", listener)
+        # Ответ зависит от предыдущей реплики бота, поэтому она входит в ключ кэша
+        cache_context = history[-2].content if len(history) > 2 and history[-2].role == "assistant" else ""
+        cached = await asyncio.to_thread(self.response_cache.get, message, cache_context) if self.response_cache else None
+        if self.response_cache:
+            listener.cache_stats(self.response_cache.stats_text())
+        if cached:
+            bot_response, match = cached
+            return await self.finish_local_answer(history, session_id, bot_response, "cache", request_started_at,
+                                            "Ответ из кэша" + (" (похожий вопрос)" if match == "fuzzy" else ""), listener)
+        messages, context_tokens = self.context_window.build(history)
+        snippets = await asyncio.to_thread(self.knowledge.search, message) if self.knowledge else []
+        if snippets:
+            # Только подходящие фрагменты справочника, прямо перед вопросом; в историю они не попадают
+            reference = ChatMessage("system", "Справочные данные AMD (используйте, если они относятся к вопросу):\n"
+                                    + "\n".join(f"- {text}" for _, text in snippets))
+            messages = messages[:-1] + [reference, messages[-1]]
+            context_tokens += reference.tokens
+            logger.info("Knowledge snippets: %d, best score %.2f", len(snippets), snippets[0][0])
+        data = {
+            "messages": messages,
+            "stream": True
+        }
+        if verbose:
+            logger.debug("Sending request: %s", Preview(data))
+        logger.info("Request: %d messages, ~%d tokens", len(messages), context_tokens)
+        listener.status(f"Отправка запроса... (~{context_tokens} токенов, сообщений: {len(messages)})")
+        usage = {}
+        content_parts = []
+        reasoning_parts = []
+        stream_markdown = StreamingMarkdown(self.markdown_renderer) if self.render_html else None
+        pending = []
+        pending_size = 0
+        last_flush = 0.0
+        started = False
+        request_started = time.monotonic()
+        metrics = RequestMetricsLog.new_record(status="ok", response_bytes=0, prompt_tokens=context_tokens)
+        markdown_ms = 0.0
+        first_token_at = None
+        attempt = None
+        try:
+            if self.rate_limiter:
+                waited = await self.rate_limiter.acquire()
+                if waited >= 0.001:
+                    metrics["rate_wait_ms"] = round(waited * 1000, 2)
+            attempt = await self.request_policy.open_stream(data, listener.status)
+            metrics["model"] = attempt.model
+            for name in ("reused", "dns_ms", "connect_ms", "ttfb_ms", "request_bytes"):
+                value = attempt.timings.get(name)
+                metrics[name] = round(value, 2) if isinstance(value, float) else value
+            async for content, reasoning in self.read_stream(attempt.iter_lines(), usage, metrics):
+                if not started and (content or reasoning):
+                    started = True
+                    first_token_at = time.perf_counter()
+                    metrics["first_token_ms"] = round((first_token_at - request_started_at) * 1000, 2)
+                    listener.started()
+                if reasoning:
+                    if not reasoning_parts and not content_parts:
+                        listener.status("Модель размышляет...")
+                    reasoning_parts.append(reasoning)
+                if content:
+                    content_parts.append(content)
+                    pending.append(content)
+                    pending_size += len(content)
+                    now = time.monotonic()
+                    # Первый токен уходит сразу, остальные — пачками
+                    if len(content_parts) == 1 or pending_size >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_INTERVAL:
+                        render_started = time.perf_counter()
+                        text = "".join(content_parts)
+                        snapshot = stream_markdown.feed("".join(pending)) if stream_markdown else text
+                        markdown_ms += (time.perf_counter() - render_started) * 1000
+                        listener.chunk(snapshot, text)
+                        pending = []
+                        pending_size = 0
+                        last_flush = now
+            bot_response = "".join(content_parts)
+            if not bot_response:
+                bot_response = "".join(reasoning_parts)
+            if verbose:
+                logger.debug("Parsed response: %s", Preview(bot_response))
+            if "http" not in bot_response:
+                bot_response += "<br>Для дополнительной информации посетите [сайт AMD](https://www.amd.com)."
+            render_started = time.perf_counter()
+            formatted_response = self.format_response(bot_response) if self.render_html else None
+            finished_at = time.perf_counter()
+            markdown_ms += (finished_at - render_started) * 1000
+            if verbose:
+                logger.debug("Formatted response: %s", Preview(formatted_response))
+            logger.info("Response from %s: %d chars in %.2f s", attempt.model, len(bot_response), time.monotonic() - request_started)
+            store_id = await asyncio.to_thread(self.store_message, session_id, "assistant", bot_response, formatted_response)
+            history.append(ChatMessage("assistant", bot_response, store_id, html_text=formatted_response))
+            if self.response_cache and content_parts:
+                await asyncio.to_thread(self.response_cache.put, message, cache_context, bot_response,
+                                        time.monotonic() - request_started)
+            if not started:
+                listener.started()
+            listener.finished(bot_response, formatted_response, store_id)
+            completion_tokens = usage.get("completion_tokens") or estimate_tokens(bot_response)
+            generation_time = finished_at - (first_token_at or request_started_at)
+            metrics.update(
+                total_ms=round((finished_at - request_started_at) * 1000, 2), markdown_ms=round(markdown_ms, 2),
+                prompt_tokens=usage.get("prompt_tokens", context_tokens), completion_tokens=completion_tokens,
+                tokens_per_s=round(completion_tokens / generation_time, 2) if generation_time > 0 else None)
+            listener.metrics(metrics)
+            prompt_tokens = usage.get("prompt_tokens", f"~{context_tokens}")
+            listener.status(f"Подключено к DeepSeek API · {attempt.model} · отправлено токенов: {prompt_tokens}")
+        except asyncio.CancelledError:
+            logger.info("Request cancelled")
+            raise
+        except Exception as e:
+            logger.warning("Request failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            partial_response = "".join(content_parts)
+            if started:
+                # Ошибка посреди стрима: уже полученный текст сохраняется
+                formatted_partial = self.format_response(partial_response) if partial_response and self.render_html else ""
+                store_id = None
+                if partial_response:
+                    store_id = await asyncio.to_thread(self.store_message, session_id, "assistant", partial_response,
+                                                       formatted_partial)
+                    history.append(ChatMessage("assistant", partial_response, store_id, html_text=formatted_partial))
+                listener.finished(partial_response, formatted_partial, store_id)
+            listener.failed(str(e))
+            listener.status("Ошибка подключения")
+            metrics.update(status="error", error=str(e), total_ms=round((time.perf_counter() - request_started_at) * 1000, 2))
+            listener.metrics(metrics)
+        finally:
+            if attempt is not None:
+                attempt.close()
+        return metrics
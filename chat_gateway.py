@@ -0,0 +1,457 @@
+# Локальный шлюз: один бэкенд чата (пул соединений к OpenRouter, кэш ответов, справочник и лимит запросов)
+# на несколько клиентов. HTTP с потоковой выдачей (server-sent events) и WebSocket, у каждого клиента свои сессии.
+# Запуск: python chat_gateway.py --port 8787; окно подключается как тонкий клиент через AMD_CHATBOT_GATEWAY_URL
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import sqlite3
+import time
+import weakref
+
+import aiohttp
+from aiohttp import web, WSMsgType
+
+from chat_core import (APP_DATA_DIR, API_BASE_URL, API_POOL_SIZE, ChatBackend, ChatMessage, ConversationStore, MarkdownRenderer,
+                       MessageStore, OpenRouterClient, RateLimiter, RequestMetricsLog, ResponseListener, StreamingMarkdown,
+                       UpstreamError, logger, setup_logging)
+
+GATEWAY_HOST = os.environ.get("AMD_CHATBOT_GATEWAY_HOST", "127.0.0.1")
+GATEWAY_PORT = int(os.environ.get("AMD_CHATBOT_GATEWAY_PORT", "8787"))
+# Общий ключ клиентов шлюза (пусто — без проверки, только для localhost)
+GATEWAY_TOKEN = os.environ.get("AMD_CHATBOT_GATEWAY_TOKEN", "")
+# Одновременных ответов на всех клиентов; вопросы одной сессии всегда идут по очереди
+GATEWAY_WORKERS = 16
+GATEWAY_MAX_SESSIONS = int(os.environ.get("AMD_CHATBOT_GATEWAY_MAX_SESSIONS", "1000"))
+GATEWAY_SESSION_TTL = float(os.environ.get("AMD_CHATBOT_GATEWAY_SESSION_TTL", "3600"))
+GATEWAY_CLEANUP_INTERVAL = 60
+# Сколько последних реплик клиент передаёт в новую сессию; окно контекста всё равно возьмёт столько, сколько влезет
+GATEWAY_HISTORY_LIMIT = 200
+
+class GatewaySession:
+    def __init__(self, session_id, client, store_id=None):
+        self.id = session_id
+        self.client = client
+        self.store_id = store_id
+        self.messages = MessageStore()
+        self.lock = asyncio.Lock()
+        self.tasks = set()
+        self.last_used = time.monotonic()
+
+class EventQueueListener(ResponseListener):
+    # События ответа складываются в очередь, откуда их забирает HTTP- или WebSocket-обработчик.
+    # Клиентам уходят только новые куски сырого текста, даже если бэкенд рендерит HTML для хранилища
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.sent = 0
+
+    def status(self, text):
+        self.queue.put_nowait({"type": "status", "text": text})
+
+    def cache_stats(self, text):
+        self.queue.put_nowait({"type": "cache_stats", "text": text})
+
+    def started(self):
+        self.queue.put_nowait({"type": "started"})
+
+    def chunk(self, snapshot, text):
+        self.queue.put_nowait({"type": "delta", "text": text[self.sent:]})
+        self.sent = len(text)
+
+    def finished(self, text, html_text, store_id):
+        self.queue.put_nowait({"type": "finished", "text": text})
+
+    def failed(self, error):
+        self.queue.put_nowait({"type": "error", "message": error})
+
+    def metrics(self, record):
+        self.queue.put_nowait({"type": "metrics", "record": record})
+
+class ChatGateway:
+    def __init__(self, backend, token=GATEWAY_TOKEN, workers=GATEWAY_WORKERS, max_sessions=GATEWAY_MAX_SESSIONS,
+                 session_ttl=GATEWAY_SESSION_TTL):
+        self.backend = backend
+        self.token = token
+        self.workers = workers
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.sessions = {}
+        self.slots = None
+        self.active = 0
+        self.answered = 0
+        self.cleanup_task = None
+
+    def make_app(self):
+        app = web.Application(middlewares=[self.check_token])
+        app.router.add_get("/v1/health", self.health)
+        app.router.add_post("/v1/sessions", self.create_session)
+        app.router.add_delete("/v1/sessions/{session}", self.delete_session)
+        app.router.add_post("/v1/sessions/{session}/messages", self.post_message)
+        app.router.add_get("/v1/sessions/{session}/ws", self.websocket)
+        app.on_startup.append(self.on_startup)
+        app.on_cleanup.append(self.on_cleanup)
+        return app
+
+    async def on_startup(self, app):
+        self.slots = asyncio.Semaphore(self.workers)
+        self.cleanup_task = asyncio.ensure_future(self.expire_sessions())
+        await self.backend.warm_up()
+
+    async def on_cleanup(self, app):
+        self.cleanup_task.cancel()
+        for session in list(self.sessions.values()):
+            self.drop_session(session)
+        await self.backend.close()
+        self.backend.close_storage()
+
+    @web.middleware
+    async def check_token(self, request, handler):
+        if self.token and not secrets.compare_digest(request.headers.get("Authorization", ""), f"Bearer {self.token}"):
+            return web.json_response({"error": "unauthorized"}, status=401)
+        return await handler(request)
+
+    @staticmethod
+    async def read_body(request):
+        # Тело — JSON-объект; битый JSON, массив или строка — ошибка клиента (400), а не исключение в обработчике
+        if not request.can_read_body:
+            return {}
+        try:
+            body = await request.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            raise web.HTTPBadRequest(text=json.dumps({"error": "body must be a JSON object"}), content_type="application/json")
+        return body
+
+    def find_session(self, request):
+        session = self.sessions.get(request.match_info["session"])
+        if session is None:
+            raise web.HTTPNotFound(text=json.dumps({"error": "unknown session"}), content_type="application/json")
+        session.last_used = time.monotonic()
+        return session
+
+    def drop_session(self, session):
+        self.sessions.pop(session.id, None)
+        for task in list(session.tasks):
+            task.cancel()
+
+    async def expire_sessions(self):
+        # Сессии без вопросов дольше session_ttl удаляются вместе с историей
+        while True:
+            await asyncio.sleep(min(GATEWAY_CLEANUP_INTERVAL, self.session_ttl))
+            deadline = time.monotonic() - self.session_ttl
+            for session in list(self.sessions.values()):
+                if session.last_used < deadline and not session.tasks:
+                    self.drop_session(session)
+
+    async def health(self, request):
+        cache = self.backend.response_cache
+        return web.json_response({"sessions": len(self.sessions), "active": self.active, "answered": self.answered,
+                                  "workers": self.workers, "cache": cache.stats_text() if cache else None})
+
+    async def create_session(self, request):
+        if len(self.sessions) >= self.max_sessions:
+            return web.json_response({"error": "too many sessions"}, status=503)
+        body = await self.read_body(request)
+        # Сессия может начаться с истории клиента: восстановленная вкладка или сессия, пересозданная после перезапуска шлюза
+        history = body.get("history") or []
+        if not isinstance(history, list) or not all(
+                isinstance(item, dict) and item.get("role") in ("user", "assistant") and isinstance(item.get("content"), str)
+                for item in history):
+            return web.json_response({"error": "bad history"}, status=400)
+        store = self.backend.conversation_store
+        store_id = await asyncio.to_thread(store.create_session) if store else None
+        session = GatewaySession(secrets.token_urlsafe(12), str(body.get("client") or request.remote), store_id)
+        for item in history[-GATEWAY_HISTORY_LIMIT:]:
+            session.messages.append(ChatMessage(item["role"], item["content"]))
+        self.sessions[session.id] = session
+        logger.info("Gateway session %s for %s, %d messages of history", session.id, session.client, len(history))
+        return web.json_response({"session": session.id})
+
+    async def delete_session(self, request):
+        self.drop_session(self.find_session(request))
+        return web.json_response({"ok": True})
+
+    async def answer(self, session, content, listener):
+        # Очередь сессии, затем общий лимит одновременных ответов; сигнал конца — None в очереди событий
+        try:
+            async with session.lock:
+                # Вопрос пишется в хранилище сразу, как в окне при отправке: ответ бэкенд сохранит сам
+                record = ChatMessage("user", content)
+                record.message_id = await asyncio.to_thread(self.backend.store_message, session.store_id, "user", content,
+                                                            record.rendered_html())
+                async with self.slots:
+                    self.active += 1
+                    try:
+                        await self.backend.respond(session.messages, record, session.store_id, listener)
+                    finally:
+                        self.active -= 1
+                        self.answered += 1
+        finally:
+            session.last_used = time.monotonic()
+            listener.queue.put_nowait(None)
+
+    async def ask(self, session, content, send):
+        listener = EventQueueListener()
+        task = asyncio.ensure_future(self.answer(session, content, listener))
+        session.tasks.add(task)
+        task.add_done_callback(session.tasks.discard)
+        try:
+            while True:
+                event = await listener.queue.get()
+                if event is None:
+                    break
+                await send(event)
+        finally:
+            # Клиент отключился или отменил вопрос — ответ модели больше никому не нужен
+            if not task.done():
+                task.cancel()
+
+    async def post_message(self, request):
+        session = self.find_session(request)
+        content = (await self.read_body(request)).get("content")
+        if not isinstance(content, str) or not content.strip():
+            return web.json_response({"error": "empty message"}, status=400)
+        content = content.strip()
+        if "text/event-stream" not in request.headers.get("Accept", ""):
+            events = []
+
+            async def collect(event):
+                events.append(event)
+
+            await self.ask(session, content, collect)
+            result = {"answer": "", "error": None, "metrics": None}
+            for event in events:
+                if event["type"] == "finished":
+                    result["answer"] = event["text"]
+                elif event["type"] == "error":
+                    result["error"] = event["message"]
+                elif event["type"] == "metrics":
+                    result["metrics"] = event["record"]
+            return web.json_response(result)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+        await response.prepare(request)
+
+        async def send(event):
+            await response.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+
+        try:
+            await self.ask(session, content, send)
+            await response.write(b"data: [DONE]\n\n")
+        except ConnectionResetError:
+            logger.info("Gateway client %s disconnected", session.client)
+        return response
+
+    async def websocket(self, request):
+        # Вопросы идут сообщениями {"type": "message", "id": ..., "content": ...}, события ответа приходят с тем же id;
+        # {"type": "cancel"} отменяет все вопросы сессии
+        session = self.find_session(request)
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        pending = set()
+
+        async def handle(request_id, content):
+            async def send(event):
+                await ws.send_json(dict(event, id=request_id))
+            try:
+                await self.ask(session, content, send)
+                await send({"type": "done"})
+            except ConnectionResetError:
+                pass
+
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                # Ошибка разбора — событие error, соединение остаётся открытым
+                try:
+                    data = json.loads(message.data)
+                except ValueError:
+                    await ws.send_json({"type": "error", "message": "invalid json"})
+                    continue
+                if not isinstance(data, dict):
+                    await ws.send_json({"type": "error", "message": "message must be a JSON object"})
+                    continue
+                content = data.get("content")
+                if data.get("type") == "cancel":
+                    for task in list(pending) + list(session.tasks):
+                        task.cancel()
+                elif data.get("type") != "message":
+                    await ws.send_json({"type": "error", "id": data.get("id"), "message": "unknown message type"})
+                elif not isinstance(content, str) or not content.strip():
+                    await ws.send_json({"type": "error", "id": data.get("id"), "message": "empty message"})
+                else:
+                    task = asyncio.ensure_future(handle(data.get("id"), content.strip()))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+        finally:
+            for task in list(pending):
+                task.cancel()
+        return ws
+
+async def start_gateway(gateway, host=GATEWAY_HOST, port=GATEWAY_PORT):
+    # Возвращает runner и адрес; port=0 — свободный порт (для тестов и бенчмарков)
+    runner = web.AppRunner(gateway.make_app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    address = runner.addresses[0]
+    return runner, f"http://{address[0]}:{address[1]}"
+
+class GatewayClient:
+    # Тонкий клиент для окна: тот же интерфейс, что у ChatBackend, но ответы приходят со шлюза.
+    # История и поиск остаются локальными, HTML рисуется здесь же по приходящим кускам текста
+    def __init__(self, url, token=GATEWAY_TOKEN, data_dir=APP_DATA_DIR, use_store=True):
+        self.url = url.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {token}"} if token else {}
+        self.http = None
+        self.markdown_renderer = MarkdownRenderer()
+        # Сессия шлюза на каждую историю вкладки; очистка чата создаёт новую историю и, значит, новую сессию
+        self.sessions = weakref.WeakKeyDictionary()
+        self.conversation_store = None
+        if use_store:
+            try:
+                os.makedirs(data_dir, exist_ok=True)
+                self.conversation_store = ConversationStore(os.path.join(data_dir, "conversations.sqlite3"))
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Conversation store disabled: %s", e)
+
+    def get_http(self):
+        if self.http is None:
+            self.http = aiohttp.ClientSession(headers=self.headers, timeout=aiohttp.ClientTimeout(sock_connect=10, sock_read=120))
+        return self.http
+
+    async def warm_up(self):
+        try:
+            async with self.get_http().get(f"{self.url}/v1/health") as response:
+                logger.info("Gateway %s: %s", self.url, await response.text())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.info("Gateway warm-up failed: %s", e)
+
+    async def close(self):
+        if self.http is not None:
+            await self.http.close()
+
+    def close_storage(self):
+        if self.conversation_store:
+            self.conversation_store.close()
+
+    def format_response(self, text):
+        return self.markdown_renderer.render(text)
+
+    def store_message(self, session_id, role, content, html_text):
+        if self.conversation_store and session_id is not None:
+            return self.conversation_store.append(session_id, role, content, html_text)
+        return None
+
+    async def gateway_session(self, history, renew=False):
+        if renew or history not in self.sessions:
+            # Новая сессия шлюза получает локальную историю, иначе модель потеряет контекст разговора.
+            # Последняя реплика — текущий вопрос, он уходит отдельным сообщением
+            messages = [{"role": message.role, "content": message.content} for message in history
+                        if message.role in ("user", "assistant")][:-1][-GATEWAY_HISTORY_LIMIT:]
+            async with self.get_http().post(f"{self.url}/v1/sessions", json={"client": f"desktop-{os.getpid()}",
+                                                                              "history": messages}) as response:
+                if response.status >= 400:
+                    raise UpstreamError(f"Шлюз: {response.status} {await response.text()}", response.status)
+                self.sessions[history] = (await response.json())["session"]
+        return self.sessions[history]
+
+    async def respond(self, history, record, session_id=None, listener=None):
+        listener = listener or ResponseListener()
+        history.append(record)
+        request_started_at = time.perf_counter()
+        metrics = RequestMetricsLog.new_record(status="error")
+        stream_markdown = StreamingMarkdown(self.markdown_renderer)
+        received = []
+        text = None
+        try:
+            for attempt in range(2):
+                # Сессия могла истечь на шлюзе (перезапуск, простой) — создаём новую один раз
+                gateway_session = await self.gateway_session(history, renew=attempt > 0)
+                response = await self.get_http().post(f"{self.url}/v1/sessions/{gateway_session}/messages",
+                                                      json={"content": record.content},
+                                                      headers={"Accept": "text/event-stream"})
+                if response.status == 404 and attempt == 0:
+                    response.release()
+                    continue
+                break
+            async with response:
+                if response.status >= 400:
+                    raise UpstreamError(f"Шлюз: {response.status} {await response.text()}", response.status)
+                async for line in response.content:
+                    line = line.strip()
+                    if not line.startswith(b"data:") or line == b"data: [DONE]":
+                        continue
+                    event = json.loads(line[5:])
+                    kind = event["type"]
+                    if kind == "status":
+                        listener.status(event["text"])
+                    elif kind == "cache_stats":
+                        listener.cache_stats(event["text"])
+                    elif kind == "started":
+                        listener.started()
+                    elif kind == "delta":
+                        received.append(event["text"])
+                        listener.chunk(stream_markdown.feed(event["text"]), "".join(received))
+                    elif kind == "finished":
+                        text = event["text"]
+                    elif kind == "error":
+                        listener.failed(event["message"])
+                    elif kind == "metrics":
+                        metrics = event["record"]
+            if text is not None:
+                html_text = self.format_response(text) if text else ""
+                store_id = await asyncio.to_thread(self.store_message, session_id, "assistant", text, html_text) if text else None
+                if text:
+                    history.append(ChatMessage("assistant", text, store_id, html_text=html_text))
+                listener.finished(text, html_text, store_id)
+            listener.metrics(metrics)
+        except asyncio.CancelledError:
+            logger.info("Gateway request cancelled")
+            raise
+        except Exception as e:
+            logger.warning("Gateway request failed: %s", e)
+            listener.failed(str(e))
+            listener.status("Ошибка подключения к шлюзу")
+            metrics.update(status="error", error=str(e), total_ms=round((time.perf_counter() - request_started_at) * 1000, 2))
+            listener.metrics(metrics)
+        return metrics
+
+def main():
+    parser = argparse.ArgumentParser(description="Локальный шлюз чат-бота AMD для нескольких клиентов")
+    parser.add_argument("--host", default=GATEWAY_HOST)
+    parser.add_argument("--port", type=int, default=GATEWAY_PORT)
+    parser.add_argument("--base-url", default=API_BASE_URL, help="адрес OpenRouter или локальной заглушки")
+    parser.add_argument("--workers", type=int, default=GATEWAY_WORKERS, help="одновременных ответов на всех клиентов")
+    parser.add_argument("--rate", type=float, default=0.0, help="не больше стольких запросов к модели в секунду (0 — без лимита)")
+    parser.add_argument("--burst", type=float, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="без общего кэша ответов")
+    parser.add_argument("--max-sessions", type=int, default=GATEWAY_MAX_SESSIONS, help="не больше стольких открытых сессий")
+    parser.add_argument("--session-ttl", type=float, default=GATEWAY_SESSION_TTL, help="удалять сессии без вопросов дольше стольких секунд")
+    parser.add_argument("--store", action="store_true", help="сохранять разговоры клиентов в хранилище шлюза")
+    args = parser.parse_args()
+    log_listener = setup_logging()
+    # HTML шлюзу нужен только для собственного хранилища: клиенты рендерят ответ сами
+    backend = ChatBackend(use_cache=not args.no_cache, use_store=args.store, render_html=args.store,
+                          rate_limiter=RateLimiter(args.rate, args.burst) if args.rate else None,
+                          client=OpenRouterClient(base_url=args.base_url, pool_size=max(API_POOL_SIZE, args.workers)))
+    gateway = ChatGateway(backend, workers=args.workers, max_sessions=args.max_sessions, session_ttl=args.session_ttl)
+
+    async def serve():
+        runner, url = await start_gateway(gateway, args.host, args.port)
+        print(f"AMD_CHATBOT_GATEWAY_URL={url}", flush=True)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log_listener.stop()
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('path/to/app_icon.ico', '.'), ('path/to/app_icon.png', '.'), ('path/to/bell_icon.png', '.'), ('path/to/search_icon.png', '.'), ('path/to/settings_icon.png', '.'), ('path/to/star_icon.png', '.')],
+    datas=[('path/to/app_icon.ico', '.'), ('path/to/app_icon.png', '.'), ('path/to/bell_icon.png', '.'), ('path/to/search_icon.png', '.'), ('path/to/settings_icon.png', '.'), ('path/to/star_icon.png', '.'), ('knowledge/amd_specs.json', 'knowledge')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,47 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Сборка в папку без UPX: без распаковки во временный каталог при каждом запуске
+# и без распаковки сжатых библиотек. Иконки входят в resources_rc.py (python build_resources.py).
+
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('knowledge/amd_specs.json', 'knowledge')],
+    hiddenimports=['resources_rc'],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['tkinter'],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='main',
+    icon='path/to/app_icon.ico',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='main',
+)
@@ -0,0 +1,396 @@
+# Сгенерировано build_resources.py из path/to — не редактировать вручную.
+from PyQt6.QtCore import QResource
+
+qt_resource_data = (
+    b'qres\x00\x00\x00\x01\x00\x00\x00\x14\x00\x00\x00\x84\x00\x00H\x0f\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02'
+    b'\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\x12~\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x00=\xca\x00\x00\x00t\x00\x00'
+    b'\x00\x00\x00\x01\x00\x008\xd0\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x004,\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00B\xcb\x00\x00\x12z\x00\x00\x01\x00\x01\x00\x00\x00'
+    b'\x00\x00\x01\x00 \x00d\x12\x00\x00\x16\x00\x00\x00\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\\r\xa8f\x00'
+    b'\x00\x00\x01orNT\x01\xcf\xa2w\x9a\x00\x00\x12\x1eIDATx\xda\xed\xdd\tt\x94\xe5\xbd\xc7\xf1\xa1\xad\xca\x95\xe3m\xcf\xb9V\xa9\x17\x0b\x04H2Y\x08'
+    b'\x99L\x02\x01\xb2\x18\x81\x00\xb5\x0b\xc7\x16\x04\x15E\xadu\xc7\xba\x0b\x14\xb5\xe2\x82\x0b\xde\xba\xb4\xe7&lz\xaf\xf5\xde\x9e*\xb2\t(\x89\x84\xec)\xbd(\xa0\xec'
+    b'kX\x13\x92\x90\x15\xc2\xf6\xbf\xcf\xf3f\x12&!\x13\x03$\x99\xe5\xf9\xfe\xcf\xf9\x9d\xe09\x1e}\x87\xf7\xf9}\xdee\xde\x99\xd8l\x0c\xc30\x0c\xc30\x0c\xc30'
+    b'\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc30\x0c\xc3\x18<\xf9\xa3\x86\xdb\xf2F\x0e\xb3\x15\xa4&6dL'
+    b'\x12!\xe4\xbb2:\xd1\x96\xaf\xfa\xa2\xbb\xa3;\xe4WS8*\xd1\xb6-\xa6\xa1\xf0\xf9\xea\x85\x14\xfdb\x84z\x11\t=\xd4?\xffX\xbd\xb0\xeb\xd4\x0b\xecE\x08'
+    b'\xf1\x10\xdd\x11\xd5\x15\xd5\x99+\xad\xee\xa8\x0e\x15\xa8NeN\xbe[\xfd9\xd9\xb7\xcb\xdfx\xa4\xcf\x1f\xa37:\xa1\xbb\xda\xf8!\x05c\x12\xa7\x17\x8cNZ\xa4\xf2'
+    b'\x95z\x81\xbbU\x8a\t!\x1e\xb3\xdb\xd5\x95E\xba;V\x87F&tW\x7f\xb6z\xa5\xe3\x9b\xe5\x1f\x9dde\x9d3V\x9f\xc28\xd5\x0bX\xa8rDE\x08!'
+    b'\x17\x9d#\xaaW\xef\xab\x9f\x83\xb3~\x1d\xdfM\x9f\x11\xe8\xf8X\xf9\x13\x1b\x92\x9a\xd4]\xfd\xbc\xdfu\xa4g\xe7\x11\xd2q\xd9\xa3\xce\x02\xee\xcbK\xb5\xce\xac}\x07'
+    b'\x81\x86#\x7f\x82\xba\xf6\x1f~\x85\xda\xc0ijC\xab\xcf\xdb\xf8\xd1\x89R\x90\x9a \xf9\x84\x90\xef\x8c\xee\x8a\xd5\x99\xf3\x11\xa8Q\x99\x91?*\xb1\xbb\xd5\xbb1I'
+    b'\xde\xbf\xe1\xa7\xaf\xf9s\x86\x0f\xef\xe6:\xf2W\xbb\x97>\x7f\xe40\xc9M\x8a\x95\x9c\xe1\xd1\x92\x1d?P\xb2\x87DJ\xf6\xe0\x08B\x88\xa7\xe8\x8e\xa8\xae\xe8\xce\xe8'
+    b'\xee\xe8\x0e\xb5\xc0\xa0Z\x9f\t\xac\x1f7\xdaV06\xc9\x96;6\xc5{\x00l\x1b\xa2\xefRZ\xd7\xfe\x83\x1bNQ\x1a6RotN\x82\xc3zAkc\xc3'
+    b'\x08!\x17\x19\xdd!\xdd%\x0b\x82f\x97\x03Iq\x85\xea2`\xfa\xa2\r\xde\xbc\xeb\x9f`+\x189\xbc\xbb\xeb&\x85%U\xde\r\x83-\xc5\xd8y\x84t$\x04'
+    b'\x91V\xb7\x1a\xcf\x06\xf2\xc7$-\xccS\x97\x02\xfay\x01\xef<\xe4\xa3\x1f\xf0i\xb8\x191\xa4\xe1Ne\xa2\xe4&\xc7\xca\xda\xb8pv\x18!\x9d\x11\xd5-}Y'
+    b"\xe0B@wn\xb0\xd5\xc1Q\t^\x00`\xc4P[\xe1/G\xda\xac\xf7\xf9\x95HZ'\xcaOH\xe7#`\x9d\t4\\\nL+\xfay\x8a-\xcf\x1bO\x0b"
+    b'\x16\x8c\xd2\xa7\xff\t=\xf4\x03\x0b\xfa\xfaD\x9f\xa2\xb0\x83\x08\xe9\x9a\xcb\x01\xd7=\x81O\nG%^Y\xe0\x8d\xcb\x00\xd7\xdb\x10\xd7\xa8S\x90\xaf\xf4M\nv\x0c'
+    b'!]\x17\xdd9\xd5\xbd\xf5\xaa\x83\xfa\x11{/\x00\xa0\x1f\xf7\xfdY\xf2uy#\x86\xee\xe6n?!]\xff\xee@\xde\x88\xf8\xdd\xba\x83\x05\xdex<X\xbf\x03P'
+    b"86\xb9Wn\xa2\xb3\x98\x1dBH\xd7GwOwPw\xb1\xcb'/9\xd6\x96\x972\xb8W\xce\xd0(\x00 \xc4\x1b\x97\x01\xaa{\xba\x83\xba\x8b]>\xd9\xf1"
+    b'Q6\xb5\x01\xbd\xd4\xa9\x08\x00\x10\xe2\x9d\xcb\x80b\xab\x83C\xa3\xba\x1e\x80\xb5q\xe1\xb6\xb5\x83#z\xa9\x9f\x00@\x88w\xde\x12,vu\xd0\x0b\x00\xc4\x86\xe9\xf4'
+    b'R\x01\x00B\xbc\x93bW\x07\x01\x80\x10\x00\x00\x00B\x00\x00\x00\x08\x01\x00\x00 \x04\x00\x00\x80\x10\x00\x00\x00B\x00\x00\x00\x08\x01\x00\x00 \x04\x00\x00\x80\x10\x00\x00'
+    b'\x00B\x00\x00\x00\x08\x01\x00\x00 \x04\x00\x00\x80\x10\x00\x00\x00B\x00\x00\x00\x08\x01\x00\x00 \x04\x00\x00\x80\x10\x00\x00\x00B\x00\x80\x1dA\x08\x00\x10B\x00\x80\x10\x02'
+    b'\x00\x84\x10\x00\xf0\x85d9B$+:\x98\x90\x0b\x8b#\x18\x00\xfc\x1a\x00\xa7]r\x93ce\xdbK3e\xef\xdc?\xcb\xde\xb4\xf7dO\xda\xbb\xd6OB\xdaL'
+    b'\xfa{\xb2\xf3\xad\xd9j\xfd\xc4Y\xeb\x08\x00\xfc\xf4\x0c {H\xa4l\xf9\xc3Sr\xb2\xa2L\x18\xe6B\xa6\xfeh\xa9\x14\xfe,E\xd6\xc6\x84\x02\x80\xff^\x024'
+    b"\xe8\xbdy\xda\xe3R_Z\xc2\xaaf\xda='\x8e\x1cV\x00\xdc\xa0\xce\x00\x00\xc0\xefo\x02f\xc7\x85\xcb\x96\x19O\xcaI\xa5:\xc3\x00\x80!\x00\xacq\x86\xc9\xd2"
+    b'\xe8\x10\xf9$j\x80,\x1a\x14"\xf9\xcf<&u\x9c\t0\x00`\x06\x00Y*\xcb\x14\x00\xf3\xc3\xfbI\x9a\xbd\xaf\xa4\xab\x9f_>\xf5{\xa9\xe3L\x80\x01\x00s'
+    b'.\x01\x96;Bd\x01\x080\x00`\xee\x83@\xfaL\xa0\x11\x81\xb9\x1a\x81\xa7\xd5\xe5\xc0\xd1\xa3\xact\x06\x00Ly\x12\xb0%\x02k\x9e}B\x8e\x97\xf1\x16!\x03'
+    b"\x00\xc6<\n\xdc\x0c\x81\x88\xfe\n\x81'A\x80\x01\x00\x93>\x0b\xd0\x12\x81\xaci\n\x81r\x10`\x00\xc0\x98\x0f\x03\x81\x00\x03\x00\x86\x7f\x1a\xd0\xfd-B\x0b\x81\xe9"
+    b'O\x81\x00\x03\x00&}\x1cxi\x0b\x04\xd6\xcexZNTT\xd0\x00\x00\x00\x00S\xbe\x0f\xa0\x01\x81\xa0s\x08\xcc|\x16\x04\x00\x00\x00L\xfaB\x90\x96\x08dk'
+    b"\x04\x8e\x81\x00\x00\x00\x801\xdf\x08\xd4\x1c\x81\x01\x92\xfd\xdc4\x10\x00\x00\x000\xe9+\xc1\x9a!\x10\xa9\x11\x98\x0e\x02\x00\x00\x00&}'`K\x04r^\x98!'"
+    b'*\x8f\xd1\n\x00\x00\x00S\xbe\x14\xd4\x1d\x81y\x1a\x81?\xce\x94\xfa\xcaJ\x9a\x01\x00\x00`\xca\xb7\x02\xb7D \x17\x04\x00\x00\x00\xcc\xfaZ\xf0\xe6\x08\x04K\xee\x8b'
+    b'\n\x81*\x10\x00\x00\x000\xe6\xf7\x02,i\x89\xc0\xac\xe7@\x00\x00\x00\xc0\x14\x00\xb2Z"0\xb0\x11\x81*\x9a\x02\x00\x00`*\x02y/\xffQ\xea\xab\xabi\x0b'
+    b'\x00\x00\x80\xa9\x08\xe4\xbf\xf2"\x08\x00\x00\x00\x98\x86\xc0\xbc&\x04B$\xffU\x85@\r\x08\x00\x00\x00\x18\x8c\xc0,\x10\x00\x00\x000\t\x81\xc5\xd1\xc1\xe7\x10\x88R'
+    b"\x08\xcc\x9e%'kjh\x0f\x00\x00\x801\x08\x0cj\x8e@\xc1\xeb/\xcb\xc9Z\x10\x00\x00\x000\x12\x81\xf9\n\x81\xc27^\x01\x01\x00\x00\x00s\x11\x08U\x08\xbc"
+    b'\n\x02\x00\x00\x00\xc6"0\xa8\x11\x81Z\xda\x04\x00\x00`\n\x02\x9f\xb6@\xa0\xe8\xcd\xd9r\n\x04\x00\x00\x00\x0cF`\xcekr\xaa\xae\x8eV\x01\x00\x00\x98\x89\x80'
+    b']\xfe\xf1\x1fo\x80\x00\x00\x00\x00\x08\x80\x00\x00\x00\x80\x99\x08D+\x04\xfe\xf4&\x08\x00\x00\x00\x18\x87@X\x0b\x04\x8e\x83\x00\x00\x00\x801\x08,j\x81\xc0\xba\xb7'
+    b'\xe7H\xf5\x81\xfdRs\xf8\x90\x91\xa9-)\x91\xb3\xa7O\x03\x00\x00\x98\x89\x80~l\xf8\xc3\xe4x\xf9\xeb\rC\x8d\x8b~\xdd\x9f\x8e\xff\x95\x85\x00\x00\x00\x80\x91\x08'
+    b'\xa4+\x04\xd2\xec}$-\xd4\xc0\x84\xf4\xb6\x10\xd0g\x02\x00\x00\x00\xe6"`h4\x02\xfaL\x00\x00\x00\xc0h\x04\x16\x86\xf7\x93\x05&&\xac\xaf\xfc-e\x98\xd4'
+    b'\x02\x00\x00\x98\x8c@\xa6\xd3nd2\x1c\xa1\x92;6\xd9*\x19\x00\x00\x001-\xaaT\xba\\\x00\x00\x00\x04\x00\x00\x00\x00\x08\x00\x00\x00\x00\x18U\x02;\x00\x00\x00'
+    b'\x00\x98X\xfc\xec\xc1\x11\xf2\xf5}wJ^\xca`3!\x00\x00\x000\xf6\xa8\x1f\x17.[\x9e{F\xaa\xbf\xdd(\x857\xa5\xf8\xf2\x02\x03\x00\x00\x00\x80\x8e>\xf2'
+    b'o}a\x9a\x9c\xac(\x97\xfa\xd2\x12__`\x00\x00\x00\x00\xd0q\xe5\x8f\x94m\xb3\xfe`\x95\xdfO\x16\x18\x00\x00\x00\x00tH\xf9\x87D\xca\xf6\x97\x9f\x97S\x95'
+    b'\xc7\xfci\x81\x01\x00\x00\x00\xc0%\x97?~\xa0\xecxm\x96\x9c\xaa\xaa\xf4\xb7\x05\x06\x00\x00\x00\x00\x97V\xfe(\xd99\xe7U9\xd5\xcao\x0f\x06\x00\x00\x00\x80\x00'
+    b'.\x7f\xce\xd0A\xb2\xebO\xaf\xcbi\x0f\xbf+\x10\x00\x00\x00\x00\x02\xb5\xfc\xc3\x06\xc9\xeew\xe7\xc8\xe9\xbaZ\x7f^`\x00\x00\x00\x00p\xc1\xe5\x1f\x1e-{\xfe\xf2'
+    b"\xb6\x9c\xfe\x8e\xef\xfc\x03\x00\x00\x00\x80@+\x7f\x82C\xf6\xa6\xbf'g\x8e\x1f\x0f\x84\x05\x06\x00\x00\x00\x00\xed-\x7fnb\x8c\xec[\xf0\x9fr\xa6\xfeD\xa0,0"
+    b"\x00\x00\x00\x00h\xcfb\xceM\x8a\x95\xe2\x0f\xe6\xaa\xf2\xd7\x07\xd2\x02\x03\x00\x00\x00\x806\x13\xa3\xca\x9f\x1c'\xfb?|_\xce\x9e<\x19h\x0b\x0c\x00\x00\x00\x00\xda"
+    b'*\xbf\xfe4\xdf\x81\xff\xf9o9{\xeaT .0\x00\x00\x00\x00h\xf5\xfb\xfct\xf9o\x8c\x97\x83\x7f\xffH\xce\x9e>\x15\xa8\x0b\x0c\x00\x00\x00\x00Z+\x7f\xfe'
+    b'\x88\xa1rh\xd1\xdf.\xe97\xdb\x00\x00\x00\x00\x80?\x96\x7f\xd4p9\xbc\xe4\x139{\xe6L\xa0/0\x00\x00\x00\x00p/\x7fAj\x82\x1cY\xbeX\xe4\xecY'
+    b'\x13\x16\x18\x00\x00\x00\x004\x95\x7fL\x92\x94\xacZ\xde!\xe5\x07\x00\x00\x00\x00?*\xbf^\x08%_\xac\xe8\xb0\xf2\x03\x00\x00\x00\x80\xbf\x94\xff\xe77Ji\xe6\x17'
+    b"&.0\x00\x00\x00s\x01\xd0\xe5/\xfa\xe5H9\x9a\x95i\xea\x02\x03\x00\x000\x13\x00\xab\xfc\xe3R\xa5,'\xcb\xe4\x05\x06\x00\x00`\x1e\x00\xba\xfc\xff\xb8y\x8c"
+    b'\x94\xe7g\x9b\xbe\xc0\x00\x00\x00\xcc\x02@\x97\x7f\xddon\x92\x8a\xa2|\x16\x18\x00\x00\x80I\x00X\xe5\x9f\xf0\x0b9\xb6\xae\x88\x05\x06\x00\x00`\x12\x00\xba\xfc\xff\x9c'
+    b'4N*\xd7\xff\x93\x05\x06\x00\x00`\x12\x00\xba\xfc\xffw\xdb\xcdR\xf9\xf5z\x16\x18\x00\x00\x80I\x00\xe8\xf2\xaf\x9f<^\xaa6m`\x81\x01\x00\x00\x98\x04\x80U'
+    b'\xfe)\x13\xa5z\xf3&\x16\x18\x00\x00\x80I\x00\xe8\xf2\x7fu\xf7\xadR\xb3u3\x0b\x0c\x00\x00\xc0(\x00T\xf9\xbf\xbew\xb2\xd4\xec\xd8\xc6\x02\x03\x00\x000\n\x00'
+    b'\xb537\xdc?Ejw\xedd\x81\x01\x00\x00\x18\x05\x80\xd3.\x1b\x1f\xbaG\xea\xf6\xecb\x81\x01\x00\x00\x18\x05\x80.\xff\xd4\xdfI\xdd\xbe\xbd,0\x00\x00\x00\xd3'
+    b'\x00\xd8\xf4\xd8\x03r\xfc@1\x0b\x0c\x00\x00\xc04\x00\xbey\xf2a9q\xe8\x00\x0b\x0c\x00\x00\xc0(\x00\xe2\xc2\xe5\xdbg\x1e\x95\x13\x87\x0f\xb1\xc0\x00\x00\x00\x8c\x02'
+    b'@]\xf3\xeb/\xf0\xac\xdd\xb5\x83\x05\x06\x00\x00`\x1c\x00\xae\xef\xf1\xab/9\xc2\x02\x03\x00\x000\xef\x0c\x80\x05\x06\x00\x00\x00\x00,0\x00\x00\x00\x00`\x81\xb1\x7f'
+    b'\x00\x00\x00X`\xec\x1f\x00\x00\x00\x16\x18\xfb\x07\x00\x00\x80\x05\xc6\xfe\x01\x00\x00`\x81\xb1\x7f\x00\x00\x00X`\xec\x1f\x00\x00\x00\x16\x18\xfb\x07\x00\x00\x80\x05\xc6\xfe\x01'
+    b'\x00\x00\x00\x00\xf6\x0f\x00\x00\x00\x00\xb0\x7f\x00\x00\x00:~\x81\x15\x8cM\x96,GH\xc3"\x0b\xe4\xf0a-\x00\x00\x80\xe6S_Z"\xeb\xef\x18o!\xa0\xb75'
+    b'`sS\x8a\xe4$8\xce\xfb\xb8v~j\x82T\xef\xe4\xe3\xda\x00`(\x00g\xcf\x9c\xb6\x10\xd0\xdb\x18\xa8\xd1\xaf\xefhV\x86\x14\x8dK\xb5J\xef\xbe\x8f2\xf5'
+    b'\xefgx\xfca\xa9\xf1\xd1}\x04\x00\x00\xc0\\\xe2\xd4l\xdb"_\xdd5\xe9\xbc\xf2[\x00\xc4\xd8eAx?Y\xfd\xfb\x87\xa4\xe6\xf0a\x00\x00\x00\x00\x08\xa8\xf2'
+    b'o\xdd\xac\xca?\xd1\xba\xdeom\x1fe:5\x00A\x92\x1e\x16$\xab\x1f}Pj\x0e\x1d\x04\x00\x00\x00\x80@\x98\xaam[e\x9d:\xf2g8B\xac\xa2gy'
+    b'\x00\xe0\xfd\x88~\x92f\xefk!\xf0\xc5#\xf7\xfb\x14\x02\x00\x00\x00\xccEL\x99:\xed_v\xfbx\x99\xaf\x8a\xadO\xf1?\x8a\xec/\x19\xad\\\x02\xe8,W@'
+    b'\xe8\x7f\xa7\x19\x02\x07\x0f\x02\x00\x00\x00\x80?N\xf9\xf6\xad\xb2\xf4\xf6\t\x92\x16\xdaG\xd2T\xa1?PG\xf8U1m\x17\xe8<\x04\x1e\xbeO\xaa\x0f\x1e\x00\x00\x00'
+    b'\x00\x00\x7f\x9a\x8a\x1d\xdbe\xd9\x1d\x13\xad\xf2\xa7\xb7\xb3\xfc\x9e\x10\xf8\xdc\x07\x10\x00\x00\x00`\xda[\xfe\x9d;d\xf9\x9d\x93.\xaa\xfc\x1e\x11x\xe8^\xa9>\xb0\x1f'
+    b'\x00\x00\x00\x00|y\x8e\xed\xde%\xcb\xa7\xdcvI\xe5wG`\xa1F@\xfdw\xd2\x15\x04\xab\x1e\xf8\xadT\xef/\x06\x00\x00\x00\x00\x9f,\xff\x9e]\xf2\xd9=\x93'
+    b'\xad\xa3v\xd35\xbf\xe3\xd2\n\xf3\xd9y\x08\xdc#U^@\x00\x00\x00\x80ic*\xf7\xecn*\xbf>\xf2\xeb\xb7\xf4V::\xa6,\xbe\x80\x00\x00\x00\x00\xe3\xa9'
+    b'\xfc\xfb\xf6\xca\x8a\xdfMi:\xf2wd\xf9="p\xff\xdd\n\x81}\x00\x00\x00\x00\xe0\xcd\xa9*\xde\'+\xef\xbb\xcb*eg\x95\xff\x1c\x02\xa1\xcd\x10X\xa9\x11'
+    b'(\xde\x07\x00\x00\x00\x00\xde\x98\xea\xfd\xfb\xad#\xb1\xfb\x91\x7f\x85\xa3s\x0b\xa2\xff\xfb\x0b#\x1a\x10\xd0\xff\xdf\x15\xf7N\x91\xca\xbd{\x00\x00\x00\x00\xa0K\xcb\x7f`'
+    b'\xbf|\xfe\xe0\xbd\xcd\x8e\xfc\x9d]~o"\x00\x00\x00\xc04\x96\xff\xe0\x01\xeb}\xf9\xc6\xf2/\xec\xc2\xf2{F\xe0\xceNE\x00\x00\x00\x80Q\xa3?\xa0\xa3\x9f\xd1'
+    b'\xd7w\xfa\xd3\xc2\xfaz\xa5\xfc\x1e\x11\xf8m\xe7!\x00\x00\x00@\xf9\x0f\x1f\x92\xd5S\x1fh(\xbf*\x9c\xbe!\xe7\xad\xf2{F\xe0\x0e\xeb-I\x00\x00\x00\x00\xe8'
+    b'\xc0\xa9U\x7fw\xfas\xfa\xee\xe5\xd7o\xcd\xf9\xc2\xfem\x89\x80~\x1eA?\x91\x08\x00\x00\x00\x00\x1dQ\xfe\x92#\x92\xf1\xf8#>Y\xfe\xd6\x11\xe8#\xcb\xef\xba'
+    b'M\x8e\xed\xda\t\x00\x00\x00\x00\x97T\xfe\xd2\x12\xc9|b\xaa\xa4\xbb>\x98\xa3?\xa0\xb3\xdc\xc7\xca\xef\x8e\x80~7\xc2\x82*\xb4\x01\x81\x8a\x0eB\x00\x00\x00\xc0\xb8'
+    b'\xa9;Z*\x99O>\xea\x17\xe5o\x1b\x81\x1d\x00\x00\x00\x00pA\xe5/;*_>\xf3\x98\xcc\xf5\xa3\xf2{D`\xca\xad\xd6G\x94\x01\x00\x00hv;\xe6x'
+    b'Y\x99\xacy\xf6\t\xbf,\x7fcV\xb6@`\xd9\x9d\x93\xa4|\xc7v\x00\x00\x00\xa6\xcd\xf2\x97\x97K\xd6\xf4\xa7dnD\x7f\xbf-\xbfG\x04\xee\x98(\xe5\xdb\xb7'
+    b'\x01\x00\x000\xad\x96\xbf\xa2\\\xd6\xcex\xbaY\xf9\x97E\xfbg\xf9=!\xb0t\xf2-\x17\x85\x00\x00\x00@@\xcf\x89c\x15\xb2v\xe6\xb3M\xe5\x9f\x1f\x00\xe5o'
+    b'\x1b\x81\xad\x00\x00\x00\x8c\xb5\xb8+\x8fI\xce\xf3\xd3en\xe4\x80\xa6\xf2/\r\x90\xf2\xb7\x89\xc0\xb6\xad\x00\x00\x00\x94?\xe7\x85\x19n\xe5\x0f\n\xb8\xf2\xbb#\xf0\x81'
+    b';\x02\xb7O\xb0~o\x01\x00\x00\x80\x91S_U%\xb9/\xce4\xa2\xfc\x9e\x10Xr\xebo\xa4l\xcbf\x00\x00\x00\xf3\xca\x9f\xf7\xd2\xf32o`\xb01\xe5\xf7'
+    b'\x8c\xc0\xaf\xe5\xe8\x96o\x01\x00\x00\x0c)\x7fu\xb5\xe4\xbd\xfcB\xb3\xf2/Q\xe5\xcf2\xa0\xfc\x8dY\xd5\x12\x81Im#\x00\x00\x00\x10\x10s\xb2\xa6Z\nf\xcf'
+    b'2\xba\xfc\x9e\x10X\xac\x11\xd8\xfc-\x00\x00@\xa0\x96\xbfF\n^{I\xe6E\x85X\xe5\x9fgp\xf9\x9b\x10\x88i\r\x81o\x00\x00\x00\x02kN\xd5\xd6J\xe1'
+    b'\x1b\xafP\xfe\xf6 0\xf1f)\xfdf#\x00\x00@\x80\x94\xbf\xaeV\x8a\xe6\xcc\x96\xf9\x83B\x9b\xca\xbf8:\x98\xf2\xb7\x81\xc0\xa7\x13\xc6I\xe9\xa6\x8d\x00\x00\x00'
+    b'\xfe^\xfe:)z\xeb\xf5\xe6\xe5\x1fD\xf9\xdb\x87\xc0\xaf\x14\x02\x1b\x00\x00\x00\xfc\xb4\xfc\xc7\x8f\xcb\xba\xb7\xe7\xc8\xfch;\xe5\xbfX\x04\xc6+\x04\xbe\xd9$\xf5\xa5'
+    b'%\x00\xe0\xb7\x00\xc44\x00P_r\xc4\xac\xf2\xbf\xf3V\xb3\xf2\x7fJ\xf9\xdb\x8d\xc0\x7fE\xf4?\x87\xc0-\xe3d\x7f\xc6\xe7RxS\x8a\x02\xc0\x0e\x00\xfew\x06'
+    b'`\x97\xfc\xd1IR\xa1N\xe7j\xd4Y\x80\xfev\xdb@\x8e\xfe\xa5\x1d\rG\xfe0\xca\x7f\x91\xf9\xdc\x1d\x01\xf5w\xf8\xf1hu\xf4\x1f\xee\xf0\xe5m\x06\x80\xb6\xf2'
+    b'e\\\x84\xfco\xf2\x10\xf9\xeb\rC\x03>\x1f&\xc7\x9f\xbb\xdb\x1fF\xf9/\x15\x01\xfdE\xa3\x0b\xc2\xfaJf\x8c\x1d\x00\xfc\x15\x80Lu\x16\xa0w\xa2>\xa5\x0b'
+    b'\xf8\xd8\xfbX\xbf\xb5G\x97\x7f\x11\xe5\xef\x10\x04\xf4w#d:\x01\xc0\xbf\x01h\xfc\xcd\xb2\x06d.\xe5\xefP\x04>\x1a8\x00\x00\xfc\x1d\x80F\xc9\x03=\xfa{'
+    b'\xfb)\x7f\xc7&C\xad\x9f5\xbe\xbd\x8d\x00\xd0\x1e\x04L\t\xe57.\x00@\x08\x00\x00\x00!\x00\x00\x00\x84\x00\x00\x00\x10\x02\x00\x00@\x08\x00\x00\x00!\x00\x00\x00'
+    b'\x84\x00\x00\x00\x10\x02\x00\x00@\x08\x00\x00\x00!\x00\x00\x00\x84\x00\x00\x00\x10\x02\x00\x00@\x08\x00\x00\x00!\x00\x00\x00\x84\x00\x00\x00\x10\x02\x00\x00@\x08\x00\x00\x00!'
+    b'\x00\x00\x00\x84\x00\x00\x00\x10\x02\x00\x84\x10\x00 \x84\x00\x00!$\x80\x01X\xe3\xb4\xdb\xbet\xda\xff=+6l7;\x82\x90\xae\x8f\xee\xde\x1ag\xd8uk\xbc\x01'
+    b'\xc0JG\x88\xed\xb3\xe8\x90k2\x9d\xf6\x8d\xec\x0cB\xba>\xaa{\x1b\x96;B\xafY\xe9\x08\xedz\x00\xd2\xc3\x83lo\x86\xf4\xbe\xea3G\xe8Jv\x06!]'
+    b'\x1f\xd5\xbd\x15o\x04\xf7\xbe*=,\xa8\xeb\x01\x88\xfba\x0f\xfd\xe3\x07\x1fF\xf6\x9f\xc3\xce \xa4\xeb\xa3\xbb\xa7;\x18\xf3\xaf=l\xde\x9a\xef?\xdd\xe7\xba[\xd4'
+    b'\xa9H\x19;\x84\x90.=\xfd?\xaa\xba7Aw\xd0\xe6\xc5\xf9A\xef\xee\x97G\xfd=j\xc0Rv\n!]\x17\xd5\xb9%\xd7\xab\xee\xe9\x0ez\x13\x80\xef\xa9\xf4'
+    b'}\xf8\xa7\xd7N\xce\x88\xb1\x1f`\xc7\x10\xd2\xf9Y\xad\xba\xf6\xd0\xf5\xd7\xde\xae\xba\xd7\xc7\xd5A\xafNO\x95\x98\xf7\xec}f\xadq\x86\xd5\xb2\x83\x08\xe9\xbc\xe8\x8e'
+    b'\xe9\xaeuS\x9dsu\xcf\xeb\xa3\xef@\x0c\xbc\xf6\xf2\xcb\xe2\xe7\x87\x07\xbd\x03\x02\x84tR\xf9c\xc3j\x17\x84\x07\xbd\xab\xbb\xa6;\xe7\xea\x9e\xd7\xa7\x9b\xebT$'
+    b'Fm\xd8\x10\xad\xd3j\xa7}?;\x8c\x90\x8e\x8b\xbe\xc4\xd6\xdd\xeay\x85U\xfe\x18W\xe7\xba\xd9|d\xb4D\x11z\xc3\xf4\xa9\xc9\x83\xd7_{\xeb\xc7Q\xc1\x8b'
+    b'\x1b\xdf\x1d\xc8f\x07\x12rA\xc9v\xbb\xdb\xffq\xd4\x80%\x8f\xfc\xb4\xe7dW\xf1c\\]\xbb\xd2\xe6cs\xb5J\xb4k\x03\xa3\x7f\xa2\xa4\x9a\xaa6Z\x9f\xb2'
+    b",\x1e\x14\x9c\xb1\xca\x11\xbaY+\x96\xe1\xb4\x1f!\x84\xb4\x1e}\x83OwEuf\xf5\xfc\x88\xa0w\xa6\xf6\xee9\xf9'\rG\xfd\xa6n\xb9\xba\xe6s\xd3\xcdu"
+    b'SBo\xa0S\xc5\xe1\xfast\x9f\x7f\xb9b\xd8\xb0\x1f]5"\xf5\xdf~8z\xec\xd5?\x1aC\x08i=\xa3TGTWn\xec\xad:\xd3\xd8\x1fW\x97\x9c'
+    b'\xae?\xf7\xf4\xa5S\xff\xd6\x10\xb8\xba\xf1r\xc0-\x0e\xb7D\x13B<\xc6\xbd+\x8d\xfd\xd1\xe5\x8ftu\xcbg\xcb\xef>W\xbanR\x0ct{\x01\xce\x16(\x10'
+    b'BZ\x8f{_\x06\xba\xba\xd4\xc3\xe6g\xd3\xcd\xb5\xd1\xfa\x94\xa5\x9f\x8a\xdd\xa5\x18!\xc4s"\\]\tru\xa7\x87\xbf\x1c\xf5\xbf\xeb\x89A\xfd\xc8\xe2e*\x97'
+    b'\x13B<\xe62WW\xbegc\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86a\x18\x86i}\xfe\x1f1\xd3'
+    b'n\x94\xd8n\xbb\xb6\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00!\xaa\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x02\x00\x00\x00\x02\x00\x08\x06'
+    b'\x00\x00\x00\xf4x\xd4\xfa\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00 \x00IDATx\xda\xed\xddw\x98\x95\xf5\x99\xf0\xf1\xfb'
+    b'9\xd3\xceP\xa5K\xb3\x02J\xd3\xb8\x89\xb1\xc4\x92h\xec\xef\xc6\xdd}}\xddWA\x04\x05\x05\xfb\xaaXb\x8cF\x8d\x89&\xd8P""\x82-\x9b\xdd\xf4k\x03'
+    b'\x88%F\x8dQ\xa3&n\x8c-\xc6JGEQa\xfay\xf6\x8fA\x97\x98\x19\x8a\x02s\xe6<\x9f\xcfuq%\xf1\x10\xae\xe1>?\xb9\xbf\xe773\x87\x08\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00X\xbf\xa4\x14~\x13\xbf;`\xaf\xfeIe\xf9AI!\xd93\x92\x18\x12Il\x17\x11\xdd#I:DD\x85\xa7'
+    b'\x19\x80O\xa1!\xd2tuD\xac\x884^O#^\x8a$}"\xado\xbco\xef_?\xb6H\x00\xb4\x91\xc7\x0f\xdc\xa3OZ^y|\x92KFE$\xbb8'
+    b'\xa7\x00l9\xe93\x854\xfda\xae\xa1\xfe\x8e=\x1fxb\x99\x00\xd8\x02\x9e8x\xbf\xed\xd3\\\\\x90F2&I"\xef\x10\x02\xd0f\x19\x90FmRHo'
+    b'Os\xb9\xef\xeeu\xcfo^\x17\x00\x9b\xc1S\x9f\xff|E}\xaf\x0eg\x95%\xb9K\xd2\x88\x8e\x8e\x1d\x00E\x15\x02\xb9\xb8\xb6\xd0\xb1\xfe\xf2\xbd\x7f\xfcX\x8d\x00'
+    b'\xd8D\x1e?t\xdf]"r\xff\x19I\xec\xe4\x98\x01P\xbc%\x10/\x16r\xe9\xd1{\xcf}\xf8Y\x01\xf0\x19=q\xf0~\xc7\x17\xca\xe2\x07I$\xd5N\x16\x00'
+    b'\xed\xa0\x02V\xa7Mq\xd2^\xf7>|\xb7\x00\xf8\x94\x1e;t\xff\xb3\x93\\|/\xd2\xc89P\x00\xb4\xa7\n(\xa4\x85\x8b\xf6\xbe\xe7\x91\xef\x08\x80\x8d\xf4\xf8!'
+    b'_:+r\xe5\xd7:C\x00\xb4\xe3\n\xb8`\xaf\xf9\x0f_%\x006\xd0\x13\x07\xefw|Z\x9e\xdc\xb6\xc1\xaf\xfc\x0b\x85(4\xd4G\xda\xd8\x18iSS\xf3\x8f'
+    b'4\x8d(\x14\x9c>\x00>\xbd\\.\x92$\x89\xa4\xac\xac\xf9Gyy\xe4**#r\x1bx1\x9dD!mL\xc7\x14\xe3\xa7\x03\x8a.\x00\x1e?t\xdf]\xd2'
+    b'$y|\xbd\x9f\xf3/\x14\xa2\xa9\xae.\nu\xb5\x9166:\xa4\x00l\xb9\xe5Y^\x1e\xb9\xaa|\x94UUm@\x0c\xa4\xab\x0bI\xecYl_\x18XT\x01'
+    b'\xf0\xe0\x97\xbf\x9c\xaf\xce\xa7\xcf\xac\xeb\xab\xfd\xd3\xa6\xa6(\xd4\xd6DSmmD\x9a:\x85\x00\xb4\xe1\x16M\xa2,\x9f\x8f\\\xbe:\x92\xb2\xb2u\xfd\xcc\x17zD'
+    b'\x87\xdd\x06\xcf\x9bWW,\x1fzy1\xcd\xb1:_\xb8(\x92\xa4\xd5\xe5\xdfTS\x13M\xabWY\xfc\x00\x14\x874m\xdeM\xb5\xb5QV\xdd!\xca\xaa\xab#'
+    b'\x92\x16_[\x0f]\x91\xae\xba "\xbe\xe5\x06\xe0\x13\x9e8x\xbf\xed\x0b\xb9\xe4\xf9\x96\xde\xdd/mj\x8a\xc6\xf7WF\xda\xd4\xe4\xb0\x01P\xbc\x17\x02eeQ'
+    b'\xde\xa5k\x8b\xb7\x01i\xa45\x85\xa4|\xe8\x97\xe6\xfe\xfa\r7\x00k\x0f&I/L\x92\xe4\xef\x96\x7f\xa1\xae6\x1a?\xfc\xd0\xab~\x00\x8a\xffB\xa0\xa9)\x1a'
+    b'\xde{7\xca;u\x8e\\U\xd5\'^q\'\xd5\xb9\xa6\xc6\x0b"b\x92\x1b\x805\x1e?p\x8f>iE\xfe\xf5O\xbe\xfao\xaa\xa9\x89\xa6U\x1f:Q\x00\xb4'
+    b';e\x1d;5\x7fJ`\xed@H\xa36i\xa8\xdd\xae\x18\xfe\x02\xa1\xa2\xb8\x01H\xcb\xab\xc6~r\xf9\x17jk-\x7f\x00\xda\xad\x8fv\xd8\xda\x11\x90$\x91\x8f'
+    b'\xca\xaa\xd1\x111E\x00DD\x92\x8bc\xfff\xf9\xd7\xd5F\xe3\x87\x1f8=\x00\xb4\xfb\x08Hr\xb9\xbf\xf9t@\x121\xaa\x18\x02\xa0\xcd?\x05\xf0\xbb\x03\xf6\xea'
+    b'\x9f\xab\xaa\\\xf8\xf1m\xc0\x9a\xcf\x9f\xf8\x9c?\x00%!I\xa2b\xabnk\x7fa`\xda\xd8\xd88`\x9f\xfb\x1e]\x9c\xe9\x1b\x80\\E\xd9\xc1\x1f\xff\x8f4\x8d'
+    b'\xc6\xf7WZ\xfe\x00\x94\x8e5\xbb\xadb\xabn\x1f}\x8b`R\x91+\xfbjD\xdc\x91\xe9\x00\x884\xb7\xc7G\xff\xb5\xa9\xa6\xc6\xb7\xfa\x01Pz\r\xd0\xd4\x14M'
+    b'55Q\xd6\xa1\xc3G\xd7\x02{\n\x80\\\xf3\x1b\xff4\x0fg\xb5S\x02@Ij\xaaY\x1d\xb9\xaa\xaaH\xca\xca\xa2\x90\xa4C\xda\xfa\xe3i\xfb\x00Hb\xfb\x88'
+    b'\x88Bm\x8d\xab\x7f\x00J\xf8\x1a \x8dBmM\x94u\xec\x14I\xc4\x0e\x02 \xd2\xaeQH\x9b\xdf\xdb\x1f\x00J\xf9\x16`\xcd[\x06G.\xd9*\xf3\x01\x90\xa6'
+    b'\xd1\xb1PW\xe7\xd5?\x00\x99\xb8\x05h\xaa\xab\x8b\\>\xdf)\xf3\x01\x90$IE\xa1\xce\xab\x7f\x00\xb2\xa1PW\x1be\xd5\xd5\x15\x99\x0f\x80(\x14"mlt'
+    b'"\x00\xc8\xc6%@ccD\xa1\xd0\xe6\x1fG\x9b\x07@\xa1\xa1\xdei\x00 [\xb7\x00E\xb0\xfb\xda\xfek\x00\xbc\xfa\x07 \x8b\xb7\x00\x99\x0f\x00o\xfc\x03@\xd6'
+    b'\x02\xa0\x08v_\x11\xdc\x00\x08\x00\x00\x04@\xf6\x02 |\xfb\x1f\x00\x19\x0b\x80"\xf8\xd6\xf7"\xf8\xbb\x00\x04\x00\x00\x99+\x00\x01 \x00\x00\x10\x00Y\x0c\x00\x00@'
+    b'\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00'
+    b'\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00'
+    b'\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00@\x00\x18\x01'
+    b'\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\xa0\x8dTm\xdd7v\xb9yv\xe4\xfb\r0\x0c`\x8by\xe4\x8b\xc3\rA\x00\xd0\x96\xea\x96.\x89?M'
+    b'\x1c+\x02\x00\x10\x00\x99\x8c\x80I\xe3\x9a#\xa0o\x7f\x03\x01@\x00d&\x02\x96,\xfe\xdf\x9b\x00\x11\x00\x80\x00\xc8V\x04<;\xb1\xf9&\xa0\xaao?\x03\x01@'
+    b'\x00dE\xed\x92E\xf1\xeci\xe3c\x97\x9bgEe\xaf>\x06\x02\x80\x00\xc8\x8a\x9a\x05o\xc4\x9f&\x8e\x13\x01\x00\x08\x80\xecF\xc0\xec\xa8\xec\xd5\xdb@\x00\x10\x00'
+    b'\xa5\xa4!Mcam}\xd4\x17\xd2\xbf\x7f\xf0\xc5\x97\xe2\xb5\xb1\xc7\xc6\x11\xb3\xee\x8e\x0e\xbd\xdd\x04\x00 \x00JFE\x92\xc4\x80|e\xab\x11\xb0\xf2\xf5\xd7b\xce'
+    b'\xb8Q"\x00\x00\x01P\xaa\x11\xb0\xa0\xb6>\x1aZ\x8b\x80\x13F7G\x80O\x07\x00\x08\x00#(\xad\x08\x18\xb8\xae\x08x\xed\xd5\xff\xbd\t\x10\x01\x00\x02\x80lE'
+    b'\xc0\xdcq\xa3\xe3\xf0Yw\x89\x00\x00\x01@)F\xc0\x9b5u\xd1\xd8\xc2\xd7\x05\xbe\xf7\xda+1w\xdc\xe88b\xf6\xddQ\xdd\xb3\x97\x81\x01\x08\x00J)\x02\xb6'
+    b'\xa9\xaeZg\x04\xcc\x19;J\x04\x00\x08\x00\xb2\x18\x01\xf3&\x8c\x8d\xc3o\xbb+\xf2\xdd\xba\x19\x18\x80\x00\xa0\x94"``\xbe*\x16\xd4\xb6\x1c\x01+\xfe\xf2b\xcc'
+    b'=a\xb4\x08\x00\x10\x00\x94\x9a\xca\xdc\x06D\xc0\x89\xc7\xc5\xe13\xef\x14\x01\x00\x02\x80LE\xc0K/\xc4\xdc\x13\x8f\x8b#n\xbb+\xaa\xb6\xda\xca\xc0\x00\x04\x00Y'
+    b'\x8b\x80\xc3g\xde)\x02\x00\x04\x00Y\x8a\x80w^|^\x04\x00\x08\x002\x1b\x01\xe3\xd7D@W\x11\x00 \x00\xc8N\x04\xbc\xb0\xd6M\x80\x08\x00\x10\x00\x94V\x04'
+    b'\x0cX\x13\x01M\xadD\xc0\xbc\xf1c\xe2\xb0[\xef\x10\x01\x00\x02\x80RR\xb5\xd6M@K\x11\xf0\xf6\xf3\xcf5G\xc0\xcc;\xa3\xaaKW\x03\x03\x10\x00d.\x02'
+    b'n\xbdC\x04\x00\x08\x002\x15\x01\xcf\xfd9\xe6O:1\x0e\x9b>;*:u20\x00\x01@)E\xc0\x80|e,\xac\xado1\x02\x96?\xf3\xc7\x98w\xf2'
+    b'\xd88\xec\x96\xdb\xa3\xa2cG\x03\x03\x10\x00\x94\x8a|.\xb7\xde\x08\xb8\xe7\xa4\xb1q\xe8-\xb3E\x00\x80\x00 K\x11\xb0\xec\x99?\x88\x00\x00\x01@f#\xe0\xe4'
+    b'qq\xe8\xf4Y"\x00@\x00\x90\xa9\x08\xf8\xe3\xd3\xcd\x11p\xcb\xec\xa8\xe8\xd0\xc1\xc0\x00\x04\x00\xa5\x16\x01\x0bj\xeb\xa3\xd0J\x04\xcc?y\\\x1c2}\x96\x08\x00'
+    b'\x10\x00\x94Z\x04\x0c\\G\x04,\xfd\xc3S1\x7f\xe2\tq\xc8\xcd\xb7\x89\x00\x00\x01@\xa6"\xe0\xe9\'E\x00\x80\x00 \xb3\x110\xe9\xc48\xf4\xe6\x99Q^-'
+    b'\x02\x00\x04\x00%\x15\x01\x1f}a`\x8b\x11\xf0\xd4\xef\xe3\xbe\xd3\'\xc6A7\xde\x12\xe5\xf9\xbc\x81\x01\x08\x00JE\xf5z"`\xd1c\x8f\xc6}\xa7\x9f\x1c\x07M'
+    b'\x9d.\x02\x00\x04\x00\x99\x8a\x80\xdf\xfd6\xee;}b\x1c|\xe3\xf4(\xab\xaa20\x00\x01@v"\xe0\x91\xb8\xf7\xb4\x93E\x00\x80\x00 \x8b\x11p\xdf\xe9\x13\xe3'
+    b'\xa0\xa97\x8b\x00\x00\x01@\x96"`\xe1\xa3\x0f\x8b\x00\x00\x01@f#\xe0\x8c\x89q\xd0\r"\x00@\x00\x90\xad\x08\xf8\xed\xc3q\xff\x99\x93\xe2\xab7\xdc\x1ce\x95'
+    b"\x95\x06\x06 \x00(\xa5\x08\xe8WU\x19\x8b\xebZ\x8e\x80\x05\x8f<\x14\xf7\x9f1Q\x04\x00\x08\x00JM\xc7\xb2\r\x88\x803'\xc5W\xaf\xff\x81\x08\x00\x10\x00d"
+    b'*\x02\x1e\xfe\x8d\x08\x00\x10\x00d5\x02\x1e\x9c|V\x1c0\xe5\x86\xc8\x95;\x8a\x00\x02\x80\xccD\xc0\xeb\xf7\xcf\x8f_\x9fs\x86\x08\x00\x10\x00d1\x02\x1e<\xf7'
+    b'\xcc\xf8\xca\xf7\xaf\x17\x01\x00\x02\x80,E\xc0k\xf7\xdd\x131\xf9\xac\xe6\x08(+30\x00\x01@\xa9E\xc0\xa2\xba\xfaH[\x8a\x80{\xe7E\x9c\x1b"\x00@\x00'
+    b'P\x8a\x11\xd0\x7f}\x1109\x89\xaf|\xef:\x11\x00 \x00\xc8T\x04\xcc\x9f\x1bI\x92\xc4\x97\xaf\xbeV\x04\x00\x08\x00\xb2\x14\x01\xaf\xde3\'"B\x04\x00\x08\x00'
+    b'J1\x02\xfaUU\xc4\xe2\xba\x86\xd6# \x89\xf8\xf2U"\x00@\x00PR:\x95\x95E\xbf\xaah=\x02\xe6\xcdi\xfet\xc0w\xaf\x89D\x04\x00\x08\x00J+'
+    b'\x02\xfaVF,\xa9o9\x02^\x99\xfb\xab\xc8UT\xc6~W\\\x15I.g`\x00\x02\x80R\xd1\xb9\xbc\xf9\xd5}k\x11\xf0\xf2/\x7f\x16I\x92\xc4\xbe\x97\x7f'
+    b'W\x04\x00\x08\x00\xb2\x14\x01\x7f\xf9\xc5O#\x92$\xf6\xbd\xec;"\x00@\x00\x90\xa9\x08\xf8\xf9O\x9a#\xe0[W\x8a\x00\x00\x01@\xa6"\xe0g?\x8e\x88\x10\x01'
+    b'\x00\x02\x80,F@\x92$\xb1\xcf\xa5\xdf\x16\x01\x00\x02\x80,E\xc0K?\xfd\xcf\x88$\x89}.\xb9B\x04\x00\x08\x00J-\x02\xd2\x88X\xdaZ\x04\xfc\xe4?"'
+    b'"b\xdfK\xbf\x1d\x91$\x06\x06 \x00(\x15]>\xba\t\xa8kh\xf1\xf1\x97~\xf2\x1f\x91D\x12\xfb\\z\x85\x08\x00\x10\x00d)\x02^\xfc\xc9\x8f"\x92\x88'
+    b'}.\x11\x01\x00\x02\x80lE\xc0\x8f\x7f\x14\x11"\x00@\x00P\x92\x11\x90F\xc4\xd2uD@y>\x1f{\x9e\xff\r\x11\x00 \x00(%]\xd7\xdc\x04\xb4\x16\x01'
+    b'\x7f\xbesvD\x924G\x00\x00\x02\x80\x0cE\xc0\x1d\xb3""D\x00\x80\x00 \x9b\x11\x90\xc4\x9e\xe7_dX\x00\x02\x80lE\xc0m\x91$I\xecq\xde\xd7\r'
+    b'\x0b@\x00\x90\xa5\x08x\xf6\xf6\x99\x11I\x12{L\xbe\xd0\xb0\x00\x04\x00\x99\x8a\x80\xd9\xb7FD\x88\x00\x00\x01@&# Ib\x8fs/0,@\x00\x18\x01\xa5'
+    b'\x16\x01\x854\x8d\xe5\xf5\x8d-G\xc0\xac\x19\x91$\x11_<G\x04\x00\x02\x00JJ\xb7\x8a\xe6c\xddZ\x04\xfc\xe9\xb6\x19\x11I\x12_<\xfb|\xc3\x02\x04\x00d'
+    b'*\x02f\xde\x12\xe5U\xf9\xf8\x87S\xcf4, \x93\xda\xfc\xbdR\x1f\xde}X\xeai`sy\xb7\xa1\xb1\xd5\x08\x80\xf1\xcf\xbdb\x08\x9f\xc1#_\x1cn\x08\x9f'
+    b'\xc1~O>\xdf\xa6;\xd8\r\x00\x99\xbe\t\x00\xc8*\x01\x80\x08\x00\x10\x00 \x02\x00\x04\x00\x88\x00\x00\x01\x00"\x00@\x00@\xbb\x8d\x804"\xde\x12\x01\x80\x00\x80'
+    b'l\xe9\xbe&\x02\xde\x16\x01\x80\x00\x80l\xe9QQ\x1e=*\xfc+\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00'
+    b'\x08\x00\x00@\x00\xc0\x96\x91\xef7 j\x17/4\x08@\x00@\x96\x96\xff\xc8i3\xe3\xc9\x7f:\xc40\x00\x01\x00YP\xbd\xed\xf6\xb1\xcb\xb4\x99Q\xd9\xab\x8fa'
+    b'\x00\x02\x00\xb2\xa0\xc3v;\xc4\xc8\x9bfFe\xaf\xde\x86\x01\x08\x00\xc8\x82\x8eCv\x8e\x91SgDE\xb7\xee\x86\x01\x08\x00# \x0b:\xed<,FL\x9d\x11'
+    b'\x15]\xb72\x0c\x00\x01@&\x96\xff\xd0\xe11r\xea\x8c(\xef\xd2\xd50\x00\x04\x00Y\xd0e\xd7\xddb\xc4u7GY\xc7N\x86\x01 \x00\xc8\x82\xae\xbb}!'
+    b'\x86_;-\xca:t4\x0c\x00\x01@&\x96\xff\xe7w\x8f\xe1S\xa6EY\x87\x0e\x86\x01 \x00\xc8\x82n{\xef\x1b\xc3\xae\xbe>r\x95U\x86\x01 \x00\xc8\x82'
+    b'\xee_\xda?\x86^u\xad\xe5\x0f \x00\xc8\x8a\x9e\x07\x1e\x1c;_\xfe\xbdH\xca\x1dk\x00\x01@&\xf4:\xe8\xb0\xd8\xe9\xb2\xab")+3\x0c\x00\x01@\x16\xf4'
+    b'>\xe4\x88\x18r\xe9w,\x7f\x00\x01@Vl}\xe4Q1\xf8\xc2K"r9\xc3\x00\x10\x00dA\xdf\x7f9:\x06\x9dw\xb1\xe5\x0f \x00\xc8\xcc\xf2?\xea\x98'
+    b'\x184\xf9\xa2\x88$1\x0c\x00\x01@\x16\x0c8\xee\x84\xd8\xfe\xf4s\x0c\x02@\x00\x90\x99\xe5?\xe6\xc4\xd8\xfe\xb4\xb3\r\x02@\x00\x90\x15\xdbN85\xb6\x99p\x8a'
+    b"A\x00\x08\x00\xb2b\xbbIg\xc4\xc0q'\x1b\x04\x80\x00 \x13\x92$v8\xeb\xbc\xe8\x7f\xcc\x18\xb3\x00\x10\x00de\xf9\xefx\xce\x85\xd1\xef\xe8Qf\x01 \x00"
+    b'\xc8\xca\xf2\x1f4\xf9\xa2\xe8{\xd41f\x01 \x00\xc8\xc4\xee\xcf\x95\xc5\xe0\x8b/\x8f>G\x1ci\x18\x00\x02\x80\xac,\xff!\xdf\xbc"z\x1f\xfe5\xc3\x00\x10\x00'
+    b'db\xf9\x97\x97\xc7\xceW|?z\x1ep\x90a\x00\x08\x002\xb1\xfc+*b\xe8\x95S\xa2\xc7\xfe\x07\x1a\x06\x80\x00 \x0br\x95\x95\xb1\xf3\x95\xd7D\x8f\xfd\xbe'
+    b'b\x18\x00\x02\x80L,\xff|>\x86}ojt\xdbco\xc3\x00\x10\x00dAYuu\x0c\x9brSl\xf5\x85=\x0c\x03@\x00\x90\x89\xe5\xdf\xa1C\x0c\x9f2'
+    b'-\xba~~w\xc3\x00\x10\x00d\xe2\xd0u\xee\x1c#\xae\x9f\x1e\x9dG\xecj\x18\x00\x02\x80l,\xff.1\xe2\x86[\xa2\xf3\xf0\x91\x86\x01 \x00\xc8\x82\x8an\xdd'
+    b'c\xe4\x8d\xb7F\xc7\xc1;\x19\x06\x80\x00 \x13\xcb\xbf{\x8f\xe6\xe5?h\x88a\x00\x08\x00\xb2\xa0\xb2G\xcf\x189\xed\xb6\xe8\xb0\xfd\x8e\x86\x01 \x00\xc8\x82\xaa\xad'
+    b'\xfb\xc6\xc8\x9bn\x8b\xea\x81\xdb\x18\x06\x80\x00 \x13\xcb\xbfo\xbf\xd8e\xda\xac\xc8\xf7\x1f`\x18\x00\x02\x80,\xc8\xf7\x1b\x10#\xa7\xcd\x8c|?\xcb\x1f@\x00\x90\t'
+    b'\xd5\xdbn\x1f\xbbL\x9b\x19\x95\xbd\xfa\x18\x06\x80\x00 \x0b:l\xb7C\x8c\xbcifT\xf6\xeam\x18\x00\x02\x80,\xe88d\xe7\x189uFTt\xebn\x18\x00'
+    b'\x02\x80,\xe8\xb4\xf3\xb0\x181uFTt\xdd\xca0\x00\x04\x00\x99X\xfeC\x87\xc7\xc8\xa93\xa2\xbcKW\xc3\x00\x10\x00dA\x97]w\x8b\x11\xd7\xdd\x1ce\x1d'
+    b';\x19\x06\x80\x00 \x0b\xba\xee\xf6\x85\x18~\xed\xb4(\xeb\xd0\xd10\x00\x04\x00\x99X\xfe\x9f\xdf=\x86O\x99\x16e\x1d:\x18\x06\x80\x00 \x0b\xba\xed\xbdo\x0c\xbb'
+    b'\xfa\xfa\xc8UV\x19\x06\x80\x00 \x0b\xba\x7fi\xff\x18z\xd5\xb5\x96?\x80\x00 +z\x1exp\xec|\xf9\xf7")wl\x00\x04\x00\x99\xd0\xeb\xa0\xc3b\xa7\xcb'
+    b'\xae\x8a\xa4\xac\xcc0\x00\x04\x00Y\xd0\xfb\x90#b\xc8\xa5\xdf\xb1\xfc\x01\x04\x00Y\xb1\xf5\x91G\xc5\xe0\x0b/\x89\xc8\xe5\x0c\x03@\x00\x90\x05}\xff\xe5\xe8\x18t\xde'
+    b'\xc5\x96?\x80\x00 3\xcb\xff\xa8cb\xd0\xe4\x8b"\x92\xc40\x00\x04\x00Y0\xe0\xb8\x13b\xfb\xd3\xcf1\x08\x00\x01@f\x96\xff\x98\x13c\xfb\xd3\xce6\x08\x00'
+    b'\x01@Vl;\xe1\xd4\xd8f\xc2)\x06\x01 \x00\xc8\x8a\xed&\x9d\x11\x03\xc7\x9dl\x10\x00\x02\x80LH\x92\xd8\xe1\xac\xf3\xa2\xff1c\xcc\x02@\x00\x90\x95\xe5\xbf'
+    b'\xe39\x17F\xbf\xa3G\x99\x05\x80\x00 +\xcb\x7f\xd0\xe4\x8b\xa2\xefQ\xc7\x98\x05\x80\x00 \x13\xbb?W\x16\x83/\xbe<\xfa\x1cq\xa4a\x00\x08\x00\xb2\xb2\xfc\x87'
+    b'|\xf3\x8a\xe8}\xf8\xd7\x0c\x03@\x00\x90\x89\xe5_^\x1e;_\xf1\xfd\xe8y\xc0A\x86\x01 \x00\xc8\xc4\xf2\xaf\xa8\x88\xa1WN\x89\x1e\xfb\x1fh\x18\x00\x08\x80,'
+    b'\xc8UV\xc6\xceW^\x13=\xf6\xfb\x8aa\x00 \x002\xb1\xfc\xf3\xf9\x18\xf6\xbd\xa9\xd1m\x8f\xbd\r\x03\x00\x01\x90\x05e\xd5\xd51l\xcaM\xb1\xd5\x17\xf60\x0c'
+    b"\x00\x04@&\x96\x7f\x87\x0e1|\xca\xb4\xe8\xfa\xf9\xdd\r\x03\x00\x01\x90\x89'\xb5s\xe7\x18q\xfd\xf4\xe8<bW\xc3\x00@\x00dc\xf9w\x89\x117\xdc\x12\x9d"
+    b'\x87\x8f4\x0c\x00\x04@\x16Tt\xeb\x1e#o\xbc5:\x0e\xde\xc90\x00\x10\x00\x99X\xfe\xdd{4/\xffAC\x0c\x03\x00\x01\x90\x05\x95=z\xc6\xc8i\xb7E'
+    b'\x87\xedw4\x0c\x00\x04@\x16Tm\xdd7F\xdet[T\x0f\xdc\xc60\x00\x10\x00Y\xb1\xcb\xf4\xdb#\xdf\xb7\xbfA\x00 \x00\xb2\xc4\xf2\x07@\x00\x00\x00\x02\x00'
+    b'\x00\x10\x00\x00\x80\x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00'
+    b'\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\xa0-'
+    b'}\xb0hat\xee?\xc0 \x10\x00\x905\xfb\xfe\xfe9C(!o\xcc\xb8)\xde\x9c1m\x83\x7f\xfe\x9c\xe3\x8f\x89\xc3g\xdd\x1d]\x06ncx\x08\x00\x80\xf6'
+    b'h\xe1\x9d\xb7m\xd4\xf2\x8f\x88\xf8p\xc9\xe2\x983\xf6\xd88b\xf6\x0fE\x00\x02\x00\xa0\xdd-\xff\xbbf\xc5kS\xa7|\xaa\xff\xef\xaa\xa5K\x9a#`\xd6\xdd\xd1'
+    b'e\x9bm\r\x13\x01\x00\xd0\x1e,\xfa\xe1\xed\xf1\xda\r\xdf\xffL\xbf\xc6\xc7\x110\xfb\x87"\x00\x01\x00P\xf4\xcb\xff\xdf\xef\x88W\xaf\xbbz\x93\xfcZ\xab\x96-\x15'
+    b'\x01\x08\x00\x80\xa2_\xfe?\xba3^\xbd\xf6\xaaM\xfak\xaeZ\xb64\xfe\xeb\xb8\x7f\x8d#f\xdd\x15[\xed0\xc8\x90\x11\x00\x00\xc5d\xe9\xcf\x7f\xbc\xc9\x97\xffG'
+    b'j\xde~+\xe6\x8c\x1b\x1dG\xdcvWl\xb5\xa3\x08@\x00\x00\x14\xc7\xf2\xff\xc5O\xe2\xe5\xef~+"M?\xf3\xafU\x91K\xa2\xa1\x90\xb6\x12\x01\xa3\xe2\x88Y'
+    b'w\x8b\x00\x04\x00@[{\xe9\xa7\xff\x19\xbf\xbd\xf4\xa2H\x0b\x85\x16\x1f\xefYY\x1e=*6\xfc\x8f\xb5\x81\xf9\xcaXX[\x1f\xf5-E\xc0;o\xc7\x9cq\xa3'
+    b'\xe2\xf0\xdb\xee\x8an\x83\x06\x1b>\x02\x00\xa0-\xfc\xe5g?^\xe7\xf2\xef^Q\xb6Q\xcb?"\xa2"Ib\xc0z"`\xee\t\xa3E\x00\x02\x00\xa0M\x96\xff'
+    b'/~\x1a\x8f\\\xf2\xf5u.\xff^\x95\x15\x9f\xea\xd7\xde\xa0\x08\xf8\xe8&`\xf0\x10O\x06\x02\x00`Kx\xf9\x97?\x8bG.\xbe`\xb3,\xff\r\x8e\x80\x15\xef'
+    b'\xfc\xefM\x80\x08@\x00\x00l^\xaf\xde3g\x9d\xcb\xbf\xdb&X\xfe\x1b\x1b\x01\x87\xcd\xbc3\xba\x0f\xd9\xc9\x93\x83\x00\x00\xd8\x1c^\x9b?7~s\xde\xbfE\xa1'
+    b'\xa9\xa9\xd5\xe5\xdf{\x13-\xff\xb5#``\xbe2\x16\xac+\x02N\x1c\x1d\x87\xcf\xbcK\x04 \x00\x006\xf9\xf2\xbfw^<8\xf9\xacV\x97\x7f\xd7\xcd\xb0\xfc?'
+    b'\xfeCq=\x11P\xbbb\xc5\x9a\x08\xb83\xba\x0f\xd9\xd9\x93\x85\x00\x00\xd8\x14^\xbf\x7f\xfez\x97\xff\xd6\x9bi\xf9oL\x04\xcc9\xfe\xd88\xec\xd6;\xa2\xe7\xf0'
+    b"\x11\x9e4\x04\x00\xc0g[\xfe\xf7\xc6\xaf\xcf9#\n\x8d\x8dm\xb6\xfc?\x19\x01\x0bk\xeb\xa3\xae\x85\x08\xa8{\x7fe\xcc\x1b?&\x0e\xbb\xf5\xf6\xe89|\xa4'"
+    b'\x0f\x01\x00\xf0i,x\xe4\xa1xp\xf2\x99E\xb1\xfc\xd7\x8e\x80\x01\xeb\x8d\x80\xe3E\x00\x02\x00\xe0\xd3X\xf8\xdb\x87\xe3\xfe3&FS}}\xcb\xcb\xbf|\xcb/'
+    b'\xffO\xde\x04,XG\x04\xcc=\xb1\xf9&\xa0\xd7\x88]<\x99\x08\x00\x80\rZ\xfe\x8f>\x1c\xf7\xado\xf9WU\xb4\xe9\xc7X\xb6\x9e\x08\xa8\xff\xe0\xfd\x8fo\x02'
+    b'D\x00\x02\x00`=\x16\xfd\xee\x91\xb8\xef\xf4\x89\xd1TW\xd7\xe2\xe3\x9d\xcbs\xd1\xa7\x8d\x97\xffFG\xc0\x8c\xd9\xd1k\xe4\xae\x9e\\\x04\x00@\xcb\xcb\xff\xb7\xeb]'
+    b'\xfe}\xab*#)\xa2\x8fy\x83"`\xc2\xf1q\xd8\x8c\xdbE\x00\x02\x00\xe0\x93\x96>\xfdd\xdcw\xc6\xa4h\xac\xadm7\xcb\x7f\xc3#\xe0\x83\x987\xe1\xf88'
+    b'\xf4\x96\xd9\xd1{\x97\xcfy\xb2\x11\x00\x00\x11\x11K\xff\xf0T\xcc\x9fxB4\xd6\xacn\xf1\xf1NE\xbc\xfc\xd7\x8e\x80m\xf2U\xb1\xa0\xb6.j[\x89\x80{N'
+    b'\x1a+\x02\x10\x00\x00\x11\x11\xcb\xfe\xf8t\xcc?y\\4\xacn}\xf9\xf7+\xf2\xe5\xff\x91\\\x121pC"`\xfa\xac\xe8\xbd\xebn\x9e|\x04\x00\x90\xd1\xe5\xff'
+    b"\xcc\x1f\xe2\x9e\x12Y\xfe\x1b\x13\x01\xf3N\x1a\x1b\x87M\x9f\x1d\xbd?'\x02\x10\x00@\xc6,\x7f\xe6\x8fq\xcfIc\xa3a\xd5\xaa\x16\x1f\xefX\xd6\xfe\x96\xff'#"
+    b'`a]]\xd44\xfd}\x044|\xf8a\xcc\x1d?&\x0e\xf9\xc1\xad\xd1w\xf7=\x1c\x06\x04\x00\x90\ro?\xff\\\xcc\x9ft\xe2\xba\x97\x7f\xbe}.\xff\xb5#'
+    b'`@U\xeb\x11\xd0X\xb3:\xe6O\x1a/\x02\x10\x00@6\xbc\xf3\xc2\xf31o\xfc\x98\xa8{\x7f\xe5:\x97\x7f\xae\x04~\xaf"\x00\x01\x00\x10\x11\xef\xbc\xf8|\xcc'
+    b'=\xf1\xb8\xa8[\xf9^\xc9/\xff\x8d\x8e\x80i3\xa2\xef\x17\xf7tH\x10\x00@\xb6\x96\x7fu\t.\xffOu\x13 \x02\x10\x00@\xa9X\xf1\x97\x17\x9b\x97\xff{'
+    b'\xad/\xff\x01%\xba\xfc78\x02jkb\xfe\xa4\xf1q\xf0\xb4\x19\xd1o\x8f\xbd\x1c\x1a\x04\x00\xd0\xbe\xbd\xf7\xda+1o\xfc\xf1\x99^\xfe\x1b\x13\x01\xf7\x9e2A'
+    b'\x04 \x00\x80\xf6\xbf\xfc\xe7\x8c\x1d\x155\xef\xbc\xdd\xfa\xf2\xaf\xca\xc6\xf2\xdf\xe8\x08\xb8\xe9\x96\xe8\xb7\xe7\xde\x0e\x11\x02\x00h_V\xbe\xf6j\xcc\x1d7:j\xde~'
+    b'\xab\x95\xe5\x9f4/\xff${\xb3\xc9%\x11\x03\xf2U\xb1\xa8\xb6>V7\x15Z\x8e\x80SO\x8a\x83n\x9c\x1e\xfd\xf7\xfa\x92\xc3\x84\x00\x00\xda\xc9\xf2\x7f\xfd\xb5\x98'
+    b's\xc2\xe8X\xfd\xd6\xf2\x16\x1f\xcf\xe7\x92\x18PU\x95\xc9\xe5\xffq\x04DD\xff|\xe5:#\xe0\xbe\xd3N\x8a\x83n\xbcE\x04 \x00\x80v\xb0\xfc\xdfx=\xe6'
+    b'\x8c\x1b\x15\xab\x97/k}\xf9\xe7+3\xbd\xfc7<\x02j\x9b#`\xea\xf4\xe8\xbf\xf7>\x06\x86\x00\x00\x8a\xd3\xfbo\xbe\x11s\xc7\x1d\xbb\xde\xe5_\x96\xd8\xfe\x1b'
+    b'\x13\x01\xf7\x9e:!\x0e\xbc\xee\xa6\xd8f\xff\x03\x0c\x0c\x01\x00\x14\x97\x0f\x17/\x8ay\xe3\xc7\xc4\xaae\x96\xff\xa6\x8e\x80\xa6\xfa\xfax\xe0\xacSE\x00\x02\x00(\xb2'
+    b'\xe5\xbfdq\xcc\x197*>X\xb4\xb0\xc5\xc7\xab,\xffM\x12\x01\xf7\x9fyJ|\xf5\xba\x9bb\x9b/\x1fh`\x08\x00\xa0m\xadZ\xba$\xe6\x8c=6>X'
+    b'\xb8\xa0\xc5\xc7+-\xffM\x16\x01\x85\x86\x86\xb8\xff\xacS\xe3\xc0ko\x8cm\xbf\xf2U\x03C\x00\x00\xc5\xbb\xfc\x07\xe6+\xa3\xdc\xf2\xdf\xa4\x11\xf0\xc0\xbf\x9d&\x02'
+    b'\x10\x00@\x1b-\xffeKc\xce\xd8c\xe3\xfd\x05oZ\xfe\x9b)\x02\x16\xd7\xd6\xc7\xaauE\xc057\xc6\xb6\x07\x88\x00\x04\x00\xb0\x85\xd4\xbc\xf3v\xcc\x1b\x7f\xbc'
+    b'\xe5\xbf\x99#\xa0\xdf\xfa"\xe0\xec\xd3\xe2\xc0)Sc\xdb\x03\x0f20\x04\x00\xb0\xf9\x97\xff\x9cq\xa3\xe2\xbdW\xffj\xf9\x17C\x04\x9cs\xba\x08@\x00\x00\x9by'
+    b"\xf9\xafx'\xe6\x9e0:\xde{\xc5\xf2\xdf\x92\x11\xd0?_\x19\x8b\xeb\xea\xe3\xc3\xc6\xd6o\x02\x0e\x9825\xb6\xfb\xea\xc1\x06\x86\x00\x006\xad\xda\x15+b\xee\t"
+    b'\xa3\xe3\xdd\xbf\xbe\xdc\xe2\xe3\x15k\xbe\xda\xdf\xf2\xdf\xf4\x92\x88\xe8WU\x19\x8b\xa3\x95\x08hl\x8c_\x9fs\xba\x08@\x00\x00\x9ba\xf9\x9f8:\xde}\xf9/\xad'
+    b'.\xff\x81\xf9\xca\xa8\xb0\xfc\xdb4\x02\x1e8\xfb\xb4\xf8\xf2w\xa7\xc4\x8e\x87\xff\xa3\x81!\x00\x80\xcf\xa6\xee\xfd\x95q\xcf\xc9cc\xc5_^\xb2\xfc\x8b<\x02\xd2\xa6'
+    b'\xa6\xf8\xcd\x05\xe7D\xa4i\xecx\xc4\xd7\x0c\x0c\x01\x00|:\xf5\x1f\xbc\x1f\xf3\xc6\x1f\x1fo?\xff\x9c\xe5\xdf\x9e"\xe0\xc2s#"D\x00\x02\x00\xf8\x0c\xcb\xff\xb9'
+    b'g-\xffv\x1a\x01i\x9a\xc6\xa0\xffs\xa4\x81!\x00\x80\r]\xfe\x1f\xc4\xbc\tc\xe3\xad?\xff\xa9\xe5?$\x92\x88\x01U\x96\x7f\xb1G\xc0C_\x9f\x1c\x91\xa6'
+    b"1\xe8\x1f\xff\xc9\xc0\x10\x00\xc0\xfa\x97\xff='\x8d\x8d\xb7\x9e\xfd\xefV\x97\xff\xc0|UT\xe6,\xffv\x11\x01\x17\x9d\x17\x11!\x02\x10\x00@\xeb\x1akV\xc7\xbd"
+    b'\xa7N\x88\xe5\x7fz\xa6\xc5\xc7\xcb\x92\x88\x01\x96\x7f\xfb\x8c\x804\x8dA_\xfbg\x03C\x00\x00\x7f\xbf\xfc\xe7O\x1a\x1fK\x9f~\xb2\xd5\xe5?0_\x15U\x96\x7f'
+    b'\xfb\x8c\x80o\x9c\x1fi\x1a1\xf8H\x11\x80\x00\x00>Z\xfe\xb551\x7f\xd2\xf8X\xf2\xe4\x13\x96\x7f;\x8f\x80\xa5\xd1\x10\xef76\xb5\x18\x01\x0f_|~D\xa4'
+    b'1\xf8\xc8\x7f10\x04\x00X\xfe\xeb^\xfe\xb9$b@\xbe\xd2\xf2o\'\x11\xb0uUEDD\xeb\x11\xf0\x8d\xf3#"D\x00\x02\x00\xb2\xbd\xfck\xe3\xdeS&'
+    b"\xc4\x92\xdf?\xde\xea\xf2\x1f\x98\xaf\x8c|.gX\xa5\x12\x01\x85B<\xfc\x8d\xf3#M\xd3\x18\xf2O\xff\xd7\xc0\x10\x00\x90\xc5\xe5\x7f\xdfi'\xc5\xe2'\x1e\xb3\xfc"
+    b'3\x1a\x01Muu1\xf4_\x8f50\x04\x00d\xc5G\x7f\x83\xdc\xa2\xc7\x1e\xb5\xfc3\x1a\x01\x91\xa6\xf1\xe8\xe5\xdf\x8cH\xd3\x18\xfa\xffG\x19\x18\x02\x00\xb2\xb0\xfc'
+    b'\xef?\xf3\x94X\xf0\xd0\x83\x96\xbf\x08\x88G\xaf\xb8$\xd24\x8da\xc7\x8c60\x04\x00\x94\xf4\xf2?\xeb\xd4x\xf3\xa1_\xb7\xba\xfc\x07X\xfe%\x19\x01ID\xac'
+    b'l%\x02~\xf7\xedK#"D\x00\x02\x00Jr\xf976\xc6\x03\xffvZ\xbc\xf9\x9b\x07Z]\xfe\xfd\xab*\xa3\xda\xf2/\xc9\x08\xe8\xb3\xe6&`\xdd\x11\x90\xc6'
+    b'\xb0c\x8e30\x01\x00\x94\xd4\xf2?\xfb\xb4x\xe3\xc1\xfb\xd7\xb9\xfc;\x94Y\xfe\xd9\x8e\x80oE\xa4i\x0c;v\x8c\x81\t\x00\xa0\xbdK\x9b\x9a\xe2\xa1\x0b\xcf\x89'
+    b'7\x1e\xb8\xcf\xf2\x17\x01\x1f\x7fM@\xab\x11p\xe5e\x11\x11"@\x00\x00\xed}\xf9\xff\xe6\x82s\xe2\x95\xb9\xbf\xb2\xfc\xf9\xd8\x86D@\x9aF\x0c\x1f%\x02\x04\x00'
+    b'\xd0>_\xf9\x7f}r\xbc2\xf7\xbfZ]\xfe\xfd,\xffLG@\x92D\xbc\xd7\xd0r\x04<\xf6\x9d\xcb"\xd24\x86\x8f>\xde\xb0\x04\x00\xd0\xae\x96\xffE\xe7\xc5'
+    b'_\x7f\xf5\xcb\x16\x1fO\xd6,\xff\x8e\x96\x7f\xa6\xf5\xa9l\xbe\th5\x02\xbe{y\xa4i\x1a#\x8e\x1bkX\x02\x00(\xfa\xe5_(\xc4\xc3\x17\x9f\x1f\x7f\xfd\xaf'
+    b'_\xb4\xba\xfc\xfb[\xfel`\x04<~\xd5\x15\x11i\x1a#\xc6\x8c3,\x01\x00\x14\xef\xf6O\xe3\xd1\xcb.\x8e\x97\x7f\xf9s\xcb\x9fM\x1a\x01Mu\xb5\xb1\xeb\x84'
+    b'I\x86%\x00\x80\xa2\\\xfe\x97\x7f3^\xfc\xf1\x8fZ]\xfe\xfd\xaa*,\x7f6>\x02"\xe2\xc9\xeb\xbe\x1f\x11!\x02\x04\x00Pt\xcb\xff\x8aK\xe2\x85\xff\xf8\xe1'
+    b":\x97\x7f\xa7\xb22\xb3b\x9d\x11\x90D\xc4\xbb\xeb\x88\x804M\xe3s'\x9dbX\x02\x00(\x86\xe5\xff\xbbo\x7f+^\xf8\xd1\xdd\xad.\xff\xad+-\x7f6L"
+    b'\xef57\x01\xadE\xc0S\xd7O\x89H\xd3\xf8\xdc\xc9\xa7\x1a\x96\x00\x00\xdat\xf9_yY<\xff\xefw\xaes\xf9w)\xb7\xfc\xd9\x84\x11p\xc35\x91\xa6\x11\xbb'
+    b'M\x14\x01\x02\x00h\x13\xbf\xbf\xf6\xeax\xfe\x87wX\xfel\xf1\x08xz\xea5\x11\x91\xc6n\x13O3,\x01\x00lIO^su\xfci\xe6-\x96?m\x18'
+    b'\x01\xd7FD\x88\x00\x01\x00l\xb1\xe5\x7f\xdd\xf7\xe3\xbfgNo\xf5q\xcb\x9f-\x1a\x01i\x1a\xbbM:\xdd\xb0\x04\x00\xb09=u\xc35\xf1\xdf3~\xd0\xfa\xf2'
+    b'\xaf\xb2\xfc\xd9\xf4\x11\x90D\x12+\x1a\x1a[\x8e\x80\x1b\xaf\x8b4M\xe3\x1fN9\xc3\xb0\x04\x00\xb0\xb9\x96\xff3\xd3oj\xf5\xf1>U\x15\xd1\xd5\xf2g3\xe8U'
+    b'\xd9\xbc\x1aZ\x8b\x80?\xdct\xbd!\t\x00`sx\xfa\xc6\xeb\xd6\xbb\xfc\xb7\xb2\xfci\xe3\x08\xd8\xa9c\xde\xa0\x04\x00m\xe5\xd6\xe1;\x1aB\xc6X\xfel\xc9\x08'
+    b'H\x92\x88w\xea\x1b\rC\x00\x00m\xa9we\xb9\xe5\xcf\x16\xd5\xb3\xa2yM\x88\x00\x01\x00\xb4\xe1\xab\xb1n\x15\xfe\x95E\x04 \x00 S\xcb\xbf\xbb\xe5\x8f\x08@'
+    b'\x00\x80\xe5\x0f"\x00\x01\x00\xa5\xfa\x07\xae\xe5\x8f\x08@\x00@\xf6\x96\x7f\x0f\xcb\x9f"\x8e\x00\x04\x00`\xf9#\x02\x10\x00lI\xde\x88\x03\x00\x01\x00\x00\x08\x00\x00@'
+    b'\x00\x00\x00\x02\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00'
+    b'\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00\x08\x00\x00@\x00\x00\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00'
+    b'\x00\x02\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00\x10\x00\x00\x80\x00\x00\x00\x04\x00\x00 \x00\x00\x00\x01\x00\x00\x08\x00\x00@\x00\x00\x00'
+    b'\x02\x00\x00\x10\x00\x00@v\x03 \x8dhH"*<\x15\x00dH}\xe6\x03\xa0)Mk\xca\x93D\x00\x00\x90\x19Mi\xac\xce|\x00\x14\xd2\xf4\x83H\x92.\x8e'
+    b'\x03\x00\x99\t\x80H?\xc8|\x00\xd4\x15\n\x0b*s\xb9\xfe\x8e\x03\x00YQ\xd3TX\x90\xf9\x00\xf8\xa0)}\xbdsy\xec\xe98\x00\x90\x15\xab\x9b\nod>'
+    b'\x00\x16\xd5\xd5\xff\xb9_\x95/\x01\x00 ;\xde\xac\xad{6\xf3\x010\xef\xadw\x9f\xda\xbdK\xc74"\x12G\x02\x80\x0cH\x7f\xf5\xf6\xca\xa72\x1f\x00\xf7\xafx'
+    b'\xff\xed\xc9\xdb\xa5/V\x97%C\x9d\t\x00J\xdd\xeaB\xe1\xf9\x87V\xac\\\x91\xf9\x00\x88\x88\xf4\xf5\xda\xda\xb9C;V\x0b\x00\x00J\xde\x1b\xab\xeb\xe7DD*'
+    b'\x00"\x9a\xee\\\xb4\xfc\x9e+\x06o{Z.\x89*G\x03\x80RU\x88\xb4v\xf6\xe2e\xf7FD\x93\x00\x88h\xfa\xed\xcaU\xef.k\xa8\xffe\xdf\xca\xca\xa3'
+    b'\x1d\x0f\x00J\xd5\xd2\xba\xc6\x9f=\xb6r\xd5{\x02\xa0Y]DT\xdd\xb9\xf8\x9d\xdb\xcf\xddn\xeb\xaf\xe5"\xc9;"\x00\x94\x9a4\xd2\x9a\xdb\x97,\xbbk\xad\xdd'
+    b'\x97\xf9\x00\xa8\x8d\x88.\xbfz\xeb\xddeG\xf5\xe96k\x87\xea\xfc$\xc7\x04\x80R\xf3\xca\xea\xfa\x99\xf3\xdez\x7f\xf9Z\xbb\xafM\x15\xc3\xb7\xdeu\x8f\x88\xed#'
+    b'"z\x97\x97W\xde\xbd\xeb\xe0;\xabr\xc9\x8e\x8e\n\x00\xa5\xa2\xb6\xa9\xf0\xf2q\xcf\xbe2fYCC\xc3\x9a\x7f\xf4jD\xbc\x9b\xf5\x1b\x80\x8f\xdf\x0fyyc'
+    b"c\xfd\xec\xc5\xcb'O\xe8\xdf\xe7\xae\\\x12\x1d\x1c\x19\x00\xda\xbb4\xd2\x9a\xbb\x96\xbd\xf3\xf5\xb5\x96\xff\xdf\xec\xbe,\x07@CD\xac\x8eh^\xf8w/y\xe7\xcd"
+    b'];w\xbc|\xcf\xae\x9d\xbe\x1d\x119G\x07\x80v\xac\xf0\xc4{\xab.\xbdc\xd1[\xaf\xad\xf5\xcfVEDc[\x7f`\xc5\xf2\xee{\xbd#b\xe0\xda\xff\xe0'
+    b"\x07\xc3\xb6;jx\xc7\x0e\x178;\x00\xb4W/\xac\xaa\x99r\xf2\xf3\xaf\xfd\xfb'\xfe\xf1\x82\x88X.\x00\x9a\x95G\xc4\xc8O\xbe\xe2\xff\xc1\xd0\x1d\x8e\x1e\xde)"
+    b'\x7f\xae\x9b\x00\x00\xda\x99\xf4\xa5\xd5\xb5\xd7Ox\xee\xd5\xbb>y#\x10\x11\xcf\xba\x01\xf8[\x03\xd7\xdc\x04\xfc\x8d\xab\x87ls\xd0\x1e];~3\x89\xa4\xday\x02'
+    b"\xa0\xe87\x7f\xc4\xea'\xde\xfb\xf0[\xe7\xbd\xfc\xe6\x03-<\xbc|\xcd\r@\x9b+\xa6\x00\xa8\x8c\x88\xe1-\xbd\xda\x1f\xd3\xbf\xd7\xf6\xa3\xb7\xee\xf9\x9d|.\x19\xe4"
+    b'h\x01P\xacj\x9b\n/\xdf\xb1d\xc5\x85w-Y\xfez\x0b\x0f\x17"\xe2\xcf\xd1\xfc\xb5o\x02\xe0\x13\xfaFD\xbf\x96\x1e\xe8QQQ~\xe5\xe0\x01\xffo\xe7'
+    b'\x8e\xd5\x93\x92\xf0\x1d\x02\x00\x14\x8fB\xa4\xb5o\xd6\xd6\xdfq\xee\x0bo\xcc^\xde\xd8X\xdf\xcaO[\x14\x11K\x8b\xe5c.\xb6\x00H"bhD\xb4z\xdd\x7f'
+    b'X\xafn\xbd\x8f\xef\xdbs\xcc\xd6\x95\x15\xff\xec\xef\x0e\x00\xa0\xad\x17\xff\xb2\xba\xc6\x9f\xcf^\xb2\xec\xce\xb5\xde\xe4\xa7%5\x11\xf1B\x14\xc1_\x02T\xac\x01\x10\x11'
+    b'\x91\x8f\x88\x9d#\xa2l]?i\x9f\xae\x1d\xbb\x8d\xe9\xdf\xfb\x90m\xf2U\x87w(\xcb\rs\x0c\x01\xd8B\xd2\xd5\x85\xc2\xf3o\xd4\xd6\xcd\x9d\xbdp\xf9\xfc5\xef'
+    b'\xed\xbf\xeeNh^\xfe\xb5\xc5\xf4\x9bH\x8at\xb8\xdd"b\x87\r\n\xcf\xc6/\x00\x00\x01PIDAT\xfd\xc9\xfbw\xef\xda\xfdk=\xbb~a@\xbejd'
+    b'\xc7\xb2\xdc\xb6U\xb9\xdc\x80\x8a$\xb6J\x92\xa4:\x89\xa8pV\x01\xd8\xe8-\x1f\xd1\xd0\x94\xa65Mi\xbc[W(,\xfa\xb0\xa9\xf0\xfa\x82\xda\xba?\xff\xea\xed'
+    b'\x95O=\xb4b\xe5\x8a\x8d\xf8\xa5\xda\xfc]\xff\xdaS\x00DD\xf4\x8a\x88m\x1cA\x00\xda\xb1\xa2\xf8\x9e\xff\x96\x94\x17\xf1\xd0\xdeZ\xf3\x9f"\x00\x80\xf6ha\xb1'
+    b'.\xffb\xbf\x01\xf8H\xb7\x88\xd8.\xbc\x19\x10\x00\xedC!"^\x8f"\xbc\xf6oo\x01\x10\xd1\xfc\x85\x81;\xc4:\xbe;\x00\x00\x8a@M4\x7f\xce\xbf\xb6\xd8'
+    b'?\xd0\xa4\x1d\r5\x89\xe6\xaf\x0b\xe8\xef6\x00\x80"|\xd5\xbf,"\x96D\x11}\xab_\xa9\x04\xc0G*#\xa2OD\xf4\x14\x02\x00\x14\xc1\xe2\x7f;\x9a\xdf\xe0'
+    b'\xa7\xa1=}\xe0I;\x1ezyDt_\xf3\xa3\xa33\x08\xc0\x16\xb4*"V\xac\xf9\xd1\xd8\x1e\x7f\x03I\x89<\x11\x15\x11\xd1yM\x08\xe4\xd7\xdc\x12T\xac\xb9'
+    b'!H\x9cS\x00>\x854"\x9a\xd6,\xf8\xfah\xfe\xbc\xfe\x87\x11\xf1A{]\xfa\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
+    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd0^\xfc\x0f\xe1\xdd\xf4\x85\xe8\xe1Q\xe2\x00\x00\x00\x00IEND\xaeB`\x82'
+    b'\x00\x00\x04\xa0\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x1a\x00\x00\x00 \x08\x06\x00\x00\x00\x0c\xabh\x05\x00\x00\x01 iCCPsRG'
+    b'B\x00\x00\x18\x95c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\xeeN\n\x11\x91Q\n\x0cH 1\xb9\xb8\x80\x01/\xf8v\x8d\x81\x11D_\xd6\r,a'
+    b'\xe3\xc6\xaf\x16\x03p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\x8a@l\x1f [)9#1\x05'
+    b'\xc8\x06\xb9O\xa7($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16_\x18\x18\x98\'"\xc4\x92\xa610'
+    b'log`\x90\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\xa4\xe6\x85\x06\x03i6 \x96a\xf0'
+    b'c\xd0gpd`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xffg-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd'
+    b' \xb1(\x11\xac\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bpgp\x02\x00{,Nu} z'
+    b'\x86\x00\x00\x00\tpHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\xa8d\x00\x00\x03&IDATH\x89\xad\x96Oh\x1dU\x14\xc6\xbfs\xe7\xbe\xbc\xd1\xbc '
+    b'\xb5\xa4\x06\x84T\xfa\xd4\xd2\x98\x1a\xb0\x9b\x06\xdd\x04\xd4E\x02O\xe8\xc6dg\x91\xbar\xdd\x85\x9b\xec\\\xb8\xe9\xaa`\x16\xed\xa2P\x10\x9a&TBIHh\x16'
+    b'\x01]\x88\x10W\x8a\x01\x83\x06\x11\x12\\$\xcc<3\x99\xb9\xe7s\x91\x99\x9a\xbc?y\xd7\xbc|00\xf7\xcf9\xbfs\xcf=\x97{\x05\x1eZ\\\\|yo'
+    b'o\xef\x03\x00W\x8d1\x83$\x95\xe4o"\xf2S\xb9\\^\xae\xd5j\xf5N>\xac\x0f\xa8^\xaf\xdf\xca\xb2\xecK\x11\x11\xe7\xdc\xd1!\x06Ap\x03\xc0\x93N>'
+    b'\x8c\x0f\xc8Z\xfb\x03\x006t\x13\xc0A\xb9\\^\xf7\xf1\xe1\x05\xaa\xd5j\xcf*\x95\xca\xb0\xb5\xf6a\x01)\x95J_\xf5\xf6\xf6^\x9e\x98\x98\xf8\xfd\xcc@9\xec'
+    b'\x17c\xcc\xf7E\xdbZ\xfb\xb4V\xab\xfd\xe1k/>\x93\xd6\xd6\xd6\xce\xed\xec\xec\xbc\x9b\xa6\xe9\xa7\xaa\xfa\x11\x00Zk\xef\x05A\xf0\xa8Z\xad~722\x12w'
+    b'\x05ZZZ\xba\xb0\xbb\xbb{GUo\x90\xeci\x9cO\x92\xc6\x98\xd8\x18s?\x0c\xc3/N\xaa\xbe\xb6\xa0\x85\x85\x85+Q\x14=%y\xb1S\xb4\x00h\x8c\xf9'
+    b"\xb1\xaf\xafob|||\xa7\xd5\x84\x96{\xb4\xb9\xb9\x19\xc6q\xfc\xd8\x13\x02\x00\xa2\xaa\xd7\xa2(z@\xb2e\xf0-A\xeb\xeb\xeb7U\xf5\xb2'\xe49\xcc9"
+    b'\xf7\xe1\xfc\xfc\xfc\x987(M\xd3[\xf0,\x94FX\x96e\x9fy\x81VVV\xce;\xe7\xae\x9e\x02\x02\x00 \xf9\xde\xf4\xf4t\x93\xdf\xa6\x8e8\x8e\xdf"\xe9}'
+    b'\xbe\x1a\xa5\xaa\x03\xa3\xa3\xa3\xaft\x04\x1d\x1c\x1c\x0c\xe3ti+$\xf5z\xfdJG\x90\x88\xbc)\xd2\r\x07\xe2\x9c{\xa3#\x08@\xd3\xa4\xff+\x92\xd5\x8e\xa0S'
+    b'\x94u\x93T\xf5d\xd0\xd6\xd6\xd6\x0b\xce\xb9W\xbb\x05\x01\xb8t"hccc\x10@\xcf\x19\x80^#\x19\xb4\x05\xc5q\\Ew\x15\x07\x00 \xd9777w'
+    b'\xa1-(I\x92Kd\xe3Ez*\x89\x88\x1c\xdb\xa7c \x92\xc3gA\x01 i\x9a\x1e;K\x8d\xa0k]\x9e\xa1\xff\x1c\x1bs\xbd%hyyy0\xcb\xb2'
+    b'\x913\xa1\x00P\xd5\xf7gffJE\xfb\xf9s+\x8a\xa2\xeb"\xf2\x04\x80\xe2\xc8\x8b\x87\xa4\xb4Y%\xf3q\x8a\x08ED\xf3\xf7^\x02\xc0\x91\xec\xe9\xef\xef\x7f'
+    b'\x1d\xc0\xcf@^a$m\x0e\r\x8a/\x8a\xa2R\xa5R)\x01\x08\xf6\xf7\xf7\r\x00\t\xc3\xb0\xb0\x91$ILa_.\x97\x01\x00I\x92\x90\xa4\xcbA\x14\x11\t'
+    b"\xc3\xf0\x1f\x11\xd9\x96\xd9\xd9\xd9{\xce\xb9\x8f\x01\x04y\xe8\x82\xc3\x94\x16\xff'\xa9q\x9c-\xaa\xd6\x19cn[\xe7\xdc;\xaa\xfab\x07\x87\xbej\x15\x98%y\xd1"
+    b"\x1ac\xbe&\xf96\xc9\xba\x88\xa8\xaa\n\x00\xe49'Ik\xad}IUo\xe20\xadG\xf5\x17\xc9o\xe4P\x8a|\x7fUUs\x1f\xc5\xf2\xbe\xf5\xaa\xe5\xd5\xd5"
+    b'U\xbb\xbd\xbd\xfd\xa7\xaa\xf67\x0c=\x98\x9a\x9a\xfa\xc4\xc7\x87\xd7M:66\x96\x89\xc8\xdd\x86\rH\x8d1\xf7}\xec\x81\xe6T\xb4\xd5\xd0\xd0\xd0\xda\xc0\xc0\xc0\xdf'
+    b'"r\x0e\xc0\xaf"\xf2\xf9\xe4\xe4\xe43_\xfb\x7f\x01\xf3!c?~\xa8\xbe\x10\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x04\xf6\x89PNG\r\n\x1a\n'
+    b'\x00\x00\x00\rIHDR\x00\x00\x00\x1f\x00\x00\x00 \x08\x06\x00\x00\x00\xea\x82\xa3A\x00\x00\x00\tpHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00'
+    b'\x00%tEXtdate:create\x002025-05-11T16:11:14+00:00{\x12\xe8\x82\x00'
+    b'\x00\x00%tEXtdate:modify\x002025-05-11T16:11:14+00:00\nOP>'
+    b'\x00\x00\x00(tEXtdate:timestamp\x002025-05-11T16:11:17+00:00'
+    b'l\xb2k|\x00\x00\x04\x12IDATH\x89\xbd\x96_\x88\x1bE\x1c\xc7\x7f3\xf3\x9b\x9d\xd9\x9d\xdd\xbdl\xb2{\x97\x94\x18c\xc8\x993=\xe50\xfe\xb9\x07\xb5'
+    b'y\xf1\xa1H}\x10\x02*\xf8\xe6\xf5\xe9\xa0w\nE_\x8cPP|\xd2\x17+W\xfa\xa4T_\xab\xe0\xdf\n}Q\x90\xf3\x0f\xb6\xd8\x83R\xb5\xc5S\xeaY\xd4'
+    b';\xab\xd7zw\xbb\xf1!\tl\x96l\xb2\xa1=\x7f0\x10f\xe7\xfb\xfd~f\xb2;3\x04\x86\x17\x99\x98\x98\xd8\xbb\xb1\xb1q\x0f\x00\xdc\x1a\x04\x81A)\xfd\x8b'
+    b'\x10\xf2\xa3\xeb\xba\xcb\xab\xab\xab?$\xf0\x18\xad*\x95\x8a\xa5\x94:\xcc\x18\xbb\x00\x00>\x00\x04}\x9a\x8f\x88\xdf\x18\x86\xf1t\xb5Z\xd5nJ\xb0eY\x07(\xa5'
+    b'\xab1\x81}\x1b\xe7\xfc;\xdb\xb6\xef\xbf\xa1`\xd34\x9b\x00\xb03Jp\xb7\x11B\xae)\xa5\x9e\xba\x91\xe0~K\xecSJ\xff\xe4\x9c\x7f\x86\x88\x1fq\xce\x97)'
+    b'\xa5\x7f\xc7@l+\xa5\x9e\x18)\xd8q\x9c\x03\x84\x90\xe8\x8c}\xce\xf9\xe7\xb6m?R\xaf\xd71<\xbeV\xab\x19\xb6m?\xc99_\x89\x02\x13B\xfeq\x1c\xe7'
+    b'\xceD\xc1\x95J\xc5b\x8c\xfd\x1c\t\xdeQJ=\x0f\x00\x14\x00 \x95J\xed\xe3\x9c\xff\x86\x88kB\x88\x8f\xd3\xe9\xf4-\x00\x00\xe5rYH)\x8fE\x01\x10\xf1'
+    b'\x8b\xaev`)\xa5\x9e\x8b\xceX)\xf5Lx\x8c\x94\xf2\xc5\xf0\x18]\xd7\x0f5\x9bM\xba\xb4\xb4\xc4;\xcf\x97"\x00\xbei\x9a\x8f\r\xcb&\x9c\xf3KacM'
+    b'\xd3>\x88\x0e\xca\xe5r\xae\x10\xe2U!\xc4\xbbB\x88O\n\x85BIJ\xb9\xcc\x18\xbb\x92\xc9d\xee-\x97\xcb\x82s~.\xec\xc39?509\x9b\xcd\xde\x17'
+    b'%v]\xf7\xeea\xc4\xb5Z\xcd%\x84l\x01@\xc0\x18\xbbP,\x16\xa5\xe38\x8fC\xef\nn\xe5\xf3\xf9t\xac\x89R\xea\xd9\x08\xed\xd9a\xc1\xdd2\x0c\xe3\x85'
+    b'\xaeN\x08q\xb0^\xafKD\\\x0f\xfb\x19\x86\xb1?\xd6\xc04\xcd\xa5\xf0`!\xc4\x1bI\xc3\xab\xd5\xaa\xc6\x18\xfb\t\xda\xb3?\x05\x00\xa0\xeb\xfa\xe9\x88\xdf\xa18'
+    b'=\xf5}\xbfgYZ\xad\xd6/I\xc3WVV\xb6\x84\x10\x9fvtw\x01\x000\xc6.\x87\xc7\xf8\xbe?\x16\x1b\x0e\xed\xdd,\xda\x97\xb8(\xa5\x17;?\x19\x00'
+    b'\x00!$\xba\xc7\x07qZ\x04\x80\xb5pG\xab\xd5\xbam\x94\xf0T*\xf5\xfa\xf6\xf6\xb6\xc3\x18;\xbd\xb9\xb9\tA\x10\x14\xc3\xcf\t!k1R\x00\xc30\x0eB'
+    b'\xe8?b\x8c]\x04\x002\n@\xb7\xe6\xe7\xe7\xf70\xc6\xfe\r\xf9\xf9\x96e=\x18+\xf0<\xaf\x0c\x91O\xcd\xb6\xed\xf87t@MOO\xbf\x14\xf2\t\x08!'
+    b'W\xf3\xf9\xbc>P\xc49\xff*,B\xc4\xb3\xc5bQ\x8e\x12<77w\xbb\xae\xebW\xa1\xf7\xb3=1T\xd89\x06{\xf6f)\xe5[\x8dF\x83%\t^'
+    b"XXH\xb9\xae\xfbmX\x0f\x00~:\x9d\x9e\x1d*n4\x1a\x0c\x11\xbf\x8c\x8a\x85\x10'\xa7\xa6\xa62\x83\xb4\xb3\xb3\xb3w\x98\xa6\x19\r\x0e\x84\x10'\x93\x80\x03"
+    b'\x00@:\x9d\xdeK\x08\xe9Y6h\xbf\x80Wl\xdb>2999\xd3l6\xb5V\xabE\x16\x17\x17\xf5R\xa9\xf4\x80\xe7y\xc7\x11\xf1ZT\x03\x00\x01\xa5\xf4'
+    b'r&\x93\x99J\x0c`Y\xd6\xa3\x00p\xbd\x9f\x19\xb4/\x14\xd75M\xdb\xa0\x94nA\xfc\xbd.\x0c\xb0\xeay\xdedb\x00\xc30\xf6\x13B\xfe\x18f\x1c\x07\xd8'
+    b'g\xe5.e\xb3\xd9bb\x80\xb1\xb1\xb1\x12"~\x98dv\x9d\xb6#\xa5|[)\xf5r\x0c\xc0\xf7\xdd\xcbG\xe22M\xf3!\xce\xf9\tJ\xe9\xef}L}\xc6'
+    b'\xd8\xafB\x88c\x9e\xe7\xcd\x844G\xfa\x01 \xe2y\xd7u\xf7\x8c\x04\x00\xd0\xfe\x1al\xdb\x9eD\xc4}\x88\xf80"\xd6;\x9bS\xdfs@\xd7\xf5Wb\x00\xce'
+    b'\x8d\x8f\x8fO\x8c\x0c0j\xe9\xba\xfeZ\x0c\xc0\x99\\.\xe7\xeev>\x91R\x1e\xed\x07\xc09\xff\xbaP(8\xbb\r@\x85\x10\xc7\xfb\x01t\xfaw\xbd\x98\xa6i'
+    b"oF\x01\x10\xf1\xcc\xff\x11\xde\x05x'\x04\xe0s\xce\x8f&:8nB\xb5fff\xde[__\xd7\x08!\xb6\xa6i\xef\x9b\xa6y\xf8?E\xc9\x9b\xd5j\x89"
+    b'\xec\xfb\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00\x04\xfd\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00s'
+    b'zz\xf4\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\xeeN\n\x11\x91Q\n\x0cH 1\xb9\xb8'
+    b'\x80\x01/\xf8v\x8d\x81\x11D_\xd6\r,a\xe3\xc6\xaf\x16\x03p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00'
+    b'\xb1\x93\x0b\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9'
+    b'\x0c\x0c\x16_\x18\x18\x98\'"\xc4\x92\xa610log`\x90\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~'
+    b'\x02\x89\xf0\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xffg-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff'
+    b'\xbd\xe8\xff\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f'
+    b'\x08bpgp\x02\x00{,Nu} z\x86\x00\x00\x00\tpHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\xa8d\x00\x00\x03\x83IDATX\x85\xb5W'
+    b'O\x88\x1bu\x14\xfe\xde\x9b$\xb8\xd9\xa8\xd4f=\x14\xf1\xa8\x1e\xf6&h\x1b[73\x0b.\xaeX,\x94\x15\xb6\x88\x7f\n"VpoR\xc1\x83\x82\x17\xc1['
+    b'U\x8a\xf8\xa7\xf6P\xcc\x8a\x0b\xeb\x162$3\x83\x9b\xd5\x83\xe6\xb2\xb0\x82\x10Q\x0f\xb5b\xcc^f\x17L7\x9b\xf7<\x98@\xfe\xcd$S\x99w\x9b\xef\xbd\xf7'
+    b'}\xdfc~\xbf\xf9\xfd\x86\x101\xca\xe5\xf2Qf\xbe\x02`f \xf5[\xb3\xd9|~qq\xf1V\x14\xbeDT\x03\xaa\x9a\x07\xf0\xd4\x88\xd4#\xa9T\xea}\x00'
+    b'?F\xe1\xe3\xb0d\xa1P0\x06\xb1D"AA\xf5D4\x94\xf3</t\xc8\x91\x06l\xdb\x9ev\x1c\xc7\xcdf\xb3\x7f\xbb\xae\xfbX\x17/\x16\x8b\xf7\x88\xc8\xf1'
+    b'@2\xe6\xc7=\xcf\xcbt\x9f\x1d\xc79\xa3\xaa\xbe\xe7y\xd7\x82\x8c\x0c9\xb6m{:\x99L^\x070\xd7\x81|\x119\xcf\xccO\x02X\x06pG\xd8D\x00\xf6'
+    b'T\xf5\x13\x00\xdbDt\x19@\n\x00Tu\x95\x99\x97M\xd3<\x0c4P\xadV\xd3\xbe\xef_\x07\x90\x1f#r\xbb\xf1e\xa3\xd18\xb7\xb4\xb4\xd4\xee\x02}\xaf\xc0'
+    b'\xf7\xfd\xd5\x18\xc5\x01\xe0\xd9\x99\x99\x99K\xbd\xc0\xe0\x1ax0F\xf1\x91\x1a}\x06D\xe44\x80\xbf\xe2RV\xd5\x9a\x88<\xd7\x8b\r-B\xc7q,"rb\xd0'
+    b'\x17\xc30\x1e\x9a\x9b\x9b\xab\xf5\x82\xa3\xb6\xe1\xe9\x18\xc4\x01\x80\xdb\xed\xf6\xd3C`\xef\xc3\xfa\xfaz\x1a\xc0\x8b\x13\x90\xfd\x02\xe0u\x11\xc9\x11\xd1)U\xbd\x08\xe0\xe6'
+    b'\x04}\xaf\x0e\x02\xb4\xb5\xb5u\xe7\xc1\xc1\xc1\x13\x00\x0c\x00\xb3\x00\xde\ncP\xd5\xb5\xce~n\xf6\xe2\x1b\x1b\x1bG\xd2\xe9\xf4:\x80\x93a\xfd"\xb2\xc2\xcc\x7f\x02'
+    b'\xb8\xd5l6\x8b\xe4\xba\xee\xa7\x98lj\xa8\xea\xafSSS\xb3\xb9\\\xee\x9fQy\xdb\xb6\xefM&\x93?\x0382!\xdf\xdbLD\xd9I\x8a\x01\x80\x88>\x08'
+    b'\x12\x07\x80\x85\x85\x85\xba\xaa~\x11\x81/\x1bz\x18\r\x063\x8f=\xe9T\xb5\x1a\x893Jq\xab\xd5\x1a:\x1d\x87\x08\x99\xa3\r\x15\xa5\xd80\x8c\x13\x13\x94\xe5"'
+    b'\x19\x10\x91\x1b\x93\x16\xab\xeak\xa5R\xe9\xee\xa0|\xa5R\xb9\x1f\xc0\xb9\x08|7xwww\x85\x88N\x01\xc8\x13\xd1JX\x03\x11\x1dK$\x12k\x95Jeh'
+    b'\x95{\x9ew_\xab\xd5\xfa\x06@fDk\xaf\xe82\x80\xbc\x88\xe4677\xdf\xeb\xfb\x14\x17\n\x85T6\x9b\xbd\t\xe0\xe8\x18\x92:3\x7f\xdcn\xb7\xab\xccl'
+    b'\xa8\xeaI\x00/\x11\xd1]a}\x00~\xb2,k\xb6o\xa8\xc1\n\xd7u\xdf\x05\xf0\xe6\x18\xa2\xdb\n"z\xc54\xcd\xcb\xbd\xd8\xa8E\xf8]\x1c\xe2\x00\xe4\xf0\xf0'
+    b'\xf0\xfbA\xb0\xcf\x80\xe7y\xc7U\xf5ZL\x06\xd80\x8cb\xb9\\~ \xd0\x80\xaa~5\xc1{\xfc?q\x8c\x88>\x0f4\x00\xe0\xdb\x18\xc5\xff\x13d\xee\xd3\xe8'
+    b'3P\xab\xd5^ \xa2\xb5\x18\xf5?4M\xf3b/0\xb4\x0b\xaa\xd5jroo\xaf\xa0\xaa\xcft\xa0\xba\x88\x9c\xed\\\xcb_\xc6\x98-\n\xe0\x0fU\xbd\x04`'
+    b'\x1b\xc0*\x11Mw\xf0\x8f,\xcb\xba\x00@C\rtM\xf8\xbe\x7f\x15\xc0\xc3Dt\xc64\xcd\x1d\x00\xd8\xd9\xd9I\xd5\xeb\xf57\x00\xbc\x13 ~\xbe\xd1h\\\xe9'
+    b'^\xbbK\xa5R\xde0\x8c\xab\x00\xbe\xb6,keP<\xd0@Xx\x9ewVUWG\xe5T\xf5\xd1\xf9\xf9\xf9\x1f\xa2\xf0E:\x8c\x00@D\xdaA9"\n'
+    b'\xcc\x05E\xe4\xbf\xe3\xfd\xfd\xfdr&\x93\xf9\x8c\x99\xfb.2"\xf2;3oG\xe5\xfb\x17c\x0bN|\x96A\xe2\xce\x00\x00\x00\x00IEND\xaeB`\x82\x00'
+    b'\x00\x04\xbc\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00 \x00\x00\x00\x1e\x08\x06\x00\x00\x00M\n\x1c)\x00\x00\x01 iCCPsRGB'
+    b'\x00\x00\x18\x95c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\xeeN\n\x11\x91Q\n\x0cH 1\xb9\xb8\x80\x01/\xf8v\x8d\x81\x11D_\xd6\r,a\xe3'
+    b'\xc6\xaf\x16\x03p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\x8a@l\x1f [)9#1\x05\xc8'
+    b'\x06\xb9O\xa7($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16_\x18\x18\x98\'"\xc4\x92\xa610l'
+    b'og`\x90\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\xa4\xe6\x85\x06\x03i6 \x96a\xf0c'
+    b'\xd0gpd`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xffg-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd '
+    b'\xb1(\x11\xac\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bpgp\x02\x00{,Nu} z\x86'
+    b'\x00\x00\x00\tpHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\xa8d\x00\x00\x03BIDATH\x89\xbd\x97Mh\x1dU\x14\xc7\xff\xe7\xce\xdc|Q\x17\xdd<'
+    b'\x0c\x04C\xec#V\xe8\x07\xc4\xee\x8a\xbc<\xc1\x85 X\x17"X\x1b\x89\xab.E\x05\xb1\x90\xb9w P\xe9\xae\xb8\x1a7\xc1]\x1b\x04A\\)4\x19\xddX'
+    b'\xa2P\x0b\xad\xd8\x82A\xc9\x87\xef\x11\xdc\x18\xc1\xf7q\xef\xdfE\x1axMg^2\x93\xd6\xb3\x9bs\xee\xff\x9c\xdf=3\xe7^FP\xd2\x8c1\xa1\x88\\\x15\x91'
+    b'V\x14E\x1f\x88\x08\xcb\xe4\t\xcb\x02h\xad\xcf\xb7\xdb\xed\x8b\x000??\x7f\x03\xc0\xd7e\xf2\xa82\xa2$It\xb7\xdb\xbd\x04@\x00\x88s\xce\x18cJ\xe5*'
+    b'%j4\x1a\xe7\xbd\xf7\xd5\xddg\xef\xfd\x94\xd6\xfa\xb52\xb9\xa4\xa8 I\x12\xbd\xb1\xb1q\x87d\xb5\xd7/"\xb7\x00\x9c\x89\xe3\xd8\x17\xc9W\xb8\x03\xcdf\xf3m'
+    b'\x92\xc7\xf6\xfaI\x9e\x1e\x1c\x1c<W4_\xa1\x0e$I\xa2777\xefz\xef\x1f\x01\x00\x00\xa5\xd4\xcf$_(\xd2\x85B\x1dh4\x1a\xefx\xef\x9f\xcd\x8b{'
+    b'\xefO\x85aX\xa8\x0b\x07\x06X\\\\\x1c\xf0\xde\x7f\x8c\xfe]+<\x11\xb9\xc9\x16\x16\x16\x86\x9a\xcd\xe6x\xbb\xdd~\x0e\xc01\xef\xfdY\xe7\xdc\xeb\xfb\x00\x00\x00'
+    b'\xc30\xbc&"?\x8a\xc8oZ\xeb{\xa3\xa3\xa3\x7f\xcc\xcc\xcc\xfc\x93\t`\x8c9\xa2\x94:\x0b`\xf2\xc1\x97=\t\xa0J\xf2\x19\x92\x9a$D\n\x0f\xcb\x0e\t'
+    b'w\x0eG\xa5\x94SJm\x02X\x05p_)\xb5J\xf2\xfe\xc8\xc8\xc8\x8d\x10\xc0\x97\xce\xb9\x97\xf2vV\xb6x\xaf\x96d\xe0\x9c\x1b\x030\x06\xe0E\xe7\x1c\x00`'
+    b'{{\xfb{\x05\xe0\x97\xd2\x15\x0eg\x14\x91\x9bA\xa5R\xf9\xa6R\xa9<\r`\n%\x0e\xa6C\x14\xff\xd4\x18\xf3\xe1nA1\xc6\\!\xf9\xfe\xff\x00A\xa5\xd4'
+    b'\x15k\xed%\x00\x0cv\xbdi\x9a~[\xab\xd5\x08`\xfa\tB0\x08\x02k\xad\x8dv\x1dAo4M\xd3\xefj\xb5\xda\xdf\x00^~\x02\x10>\x08\x82\x8f\x8c1'
+    b'\x9f\xf4:\x83\xbd\xab\xd24\xfdazz\xfaO\x00\xaf\xa0\xe4m\x99aNk\xfd^\x14EW\xf7\x06\x1e\x01x\x00\xf1S\xbd^_%\xf9j\xde\x9a\x02\xd6\r\xc3'
+    b'\xf0b\x14E\x9fe\x05s\x93///\xdf\xae\xd7\xeb\xcf\x93<y\x98\xeaJ\xa9\xeb\xc6\x98\xb9\xdc\xf8>\xfa\xea>\xf1\x83\xd8x\xbf`.\xc0\xd2\xd2RH\xf2\xf8'
+    b'c\x008\xde\xefr\xca\r\xac\xac\xac\x8c\x93<r\xd8\xea\xde\xfb\xa3\xc3\xc3\xc3c\x85\x01Z\xad\xd6I<\x86Q$)\x9dN\xe7Da\x00\xe7\\\xae\xa8\x88\x89\x08'
+    b'H\x9e\xca\x8b\xe7\xfe\x17\x90\xdc\x0f\xa0\xab\x94\xba\x0e\xa0\xe3\xbd\x7f\x0b\xc0@\xdeB\xef}\xee$\xf5\x9b\x82<QWD\xaei\xadO[k/Xk\xdf\x15\x91\x13'
+    b'"\xf29\x80N\x96\xa0\xdf(g\xbe\xe3$IF\xd6\xd7\xd7\xff\xc2\xc3\xbbr"\xf2E\x10\x04\xf3Q\x14\xdd\xc9\xd2\x19c&\x01\xcc\x91|\x13\x0fw\xb7511'
+    b'qtvv\xf6\xdf\xbd\x9a\xccW\xb0\xb5\xb5U\x05\xa0{\n\x7f%"\xb1\xb5\xf6v\xdeN\x00 \x8e\xe3{\x00.\x18c.\x03\x88I\x9e\xc3\xcea7\xb0\xb6\xb6'
+    b'6\x0e\xe0\xd7\x03\x01\x04A\xf0;\x80\x9b\x00\xb6D$\x8a\xe3\xf8V\xbf\xc2\x19 w\x01\xbca\xad\x9d"9\'"O\r\r\r\xade\xad\xfd\x0f4\xa3G\xea\x0b'
+    b'\xa0\xca\xc5\x00\x00\x00\x00IEND\xaeB`\x82\x00\x05\x00o\xa6S\x00i\x00c\x00o\x00n\x00s\x00\x0c\x07o\x84\x7f\x00a\x00p\x00p\x00_\x00i\x00'
+    b'c\x00o\x00n\x00.\x00i\x00c\x00o\x00\x0c\x07o\x9c\xa7\x00a\x00p\x00p\x00_\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\x00\x11\x0b[R'
+    b'g\x00s\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00_\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\x00\x0f\x0bs\xfaG\x00s\x00e\x00a\x00'
+    b'r\x00c\x00h\x00_\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\x00\r\x0b\xe7\x1d\x07\x00b\x00e\x00l\x00l\x00_\x00i\x00c\x00o\x00n\x00'
+    b'.\x00p\x00n\x00g\x00\r\x0f0]G\x00s\x00t\x00a\x00r\x00_\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g'
+)
+
+QResource.registerResourceData(qt_resource_data)
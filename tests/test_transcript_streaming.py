@@ -0,0 +1,96 @@
+# Лента вкладки, пока идёт ответ: подгрузка старой истории сверху не должна сдвигать строку стрима,
+# а события ответа, отправленного до очистки вкладки, не должны попадать в очищенную ленту.
+# Окно работает без экрана (QT_QPA_PLATFORM=offscreen), сеть не нужна — сигналы ответа вызываются напрямую
+import os
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["AMD_CHATBOT_HOME"] = tempfile.mkdtemp(prefix="amd_chatbot_test_")
+
+import pytest
+
+from PyQt6.QtWidgets import QApplication
+
+import main
+
+HISTORY_TURNS = 60
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def window(app):
+    window = main.ChatBotWindow()
+    window.set_active_screen(4)
+    window.ensure_chat_backend()
+    yield window
+    window.close()
+
+def stored_session(window, turns=HISTORY_TURNS):
+    store = window.conversation_store
+    session_id = store.create_session()
+    message_ids = []
+    for turn in range(turns):
+        message_ids.append(store.append(session_id, "user", f"вопрос {turn}", f"вопрос {turn}"))
+        message_ids.append(store.append(session_id, "assistant", f"ответ {turn}", f"<p>ответ {turn}</p>"))
+    store.flush()
+    return session_id, message_ids
+
+def row_texts(session):
+    model = session.view.transcript_model
+    return [model.plain_text(message) for message in model.messages]
+
+def test_older_page_while_streaming(window):
+    session_id, _ = stored_session(window)
+    session = window.new_chat_tab(session_id)
+    loaded = len(row_texts(session))
+    assert loaded == main.HISTORY_PAGE_SIZE
+    window.begin_stream_block(session)
+    window.update_stream_block(session, "<p>начало ответа</p>")
+    window.load_older_messages(session)
+    rows = row_texts(session)
+    assert len(rows) == 2 * main.HISTORY_PAGE_SIZE + 1
+    window.update_stream_block(session, "<p>середина ответа</p>")
+    window.finish_stream_block(session, "<p>готовый ответ</p>", -1)
+    rows = row_texts(session)
+    assert rows[-1].endswith("готовый ответ")
+    # Старая история на месте: ответ не записался поверх подгруженных строк
+    assert all("ответа" not in text and "готовый" not in text for text in rows[:-1])
+    assert rows[0].endswith(f"вопрос {HISTORY_TURNS - main.HISTORY_PAGE_SIZE}")
+    assert session.stream_row_id is None
+
+def test_search_result_while_streaming(window):
+    session_id, message_ids = stored_session(window)
+    session = window.new_chat_tab(session_id)
+    window.begin_stream_block(session)
+    window.update_stream_block(session, "<p>начало ответа</p>")
+    # Найденное сообщение старше загруженной страницы: всё недостающее вставляется над строкой стрима
+    window.open_search_result(session_id, message_ids[0])
+    window.finish_stream_block(session, "<p>готовый ответ</p>", -1)
+    rows = row_texts(session)
+    assert len(rows) == len(message_ids) + 1
+    assert rows[0].endswith("вопрос 0")
+    assert rows[-1].endswith("готовый ответ")
+    assert all("ответа" not in text and "готовый" not in text for text in rows[:-1])
+
+def test_late_events_after_clear(window, monkeypatch):
+    monkeypatch.setattr(main.NotificationWindow, "exec", lambda self: 0)
+    session = window.current_session
+    old_reply = main.SessionResponseListener(window, session)
+    old_reply.started()
+    old_reply.chunk("<p>старый ответ</p>", "старый ответ")
+    window.clear_chat()
+    # Отменённый запрос ещё успевает прислать события: очищенная вкладка их не показывает
+    old_reply.chunk("<p>старый ответ, продолжение</p>", "старый ответ, продолжение")
+    old_reply.failed("отменено")
+    assert row_texts(session) == []
+    new_reply = main.SessionResponseListener(window, session)
+    new_reply.started()
+    old_reply.started()
+    old_reply.chunk("<p>старый ответ</p>", "старый ответ")
+    new_reply.chunk("<p>новый</p>", "новый")
+    old_reply.finished("старый ответ", "<p>старый ответ</p>", None)
+    new_reply.finished("новый ответ", "<p>новый ответ</p>", None)
+    rows = row_texts(session)
+    assert len(rows) == 1 and rows[0].endswith("новый ответ")